@@ -6,7 +6,19 @@ LangChain-powered agents for intelligent research paper analysis and exploration
 
 __version__ = "0.1.0"
 
-from .agents_new import create_agent
-from .tools import research_tools
-
 __all__ = ["create_agent", "research_tools"]
+
+
+def __getattr__(name):
+    """Lazily import submodules (PEP 562) so `import App` stays cheap
+
+    The langchain stack takes ~1-2s to import; deferring it to first
+    attribute access keeps cold starts off the critical path.
+    """
+    if name == "create_agent":
+        from .agents_new import create_agent
+        return create_agent
+    if name == "research_tools":
+        from .tools import research_tools
+        return research_tools
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,124 @@
+"""On-disk LRU+TTL cache for external API responses (Semantic Scholar, arXiv)"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Optional on-disk persistence so the cache survives process restarts
+try:
+    import diskcache
+    _disk_cache = diskcache.Cache(
+        os.path.expanduser(os.getenv("SUNHACKS_CACHE_DIR", "~/.cache/sunhacks_ss"))
+    )
+except ImportError:
+    _disk_cache = None
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss statistics"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            if _disk_cache is not None:
+                value = _disk_cache.get(key)
+                if value is not None:
+                    self.hits += 1
+                    self._entries[key] = (value, time.monotonic() + self.ttl)
+                    return value
+
+            self.misses += 1
+            return None
+
+    def set(self, key: Any, value: Any):
+        """Store a value, evicting the LRU entry when full"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            elif len(self._entries) >= self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+
+            if _disk_cache is not None:
+                try:
+                    _disk_cache.set(key, value, expire=self.ttl)
+                except Exception:
+                    pass  # persistence is best-effort
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": f"{(self.hits / total * 100):.1f}%" if total else "n/a",
+                "persistent": _disk_cache is not None
+            }
+
+
+# Registry of named caches so stats can be reported per endpoint
+_caches: Dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def cached(ttl: float = 300.0, maxsize: int = 256) -> Callable:
+    """Decorator that memoizes a function through a named TTLCache"""
+
+    def decorator(func: Callable) -> Callable:
+        with _caches_lock:
+            cache = _caches.setdefault(func.__name__, TTLCache(maxsize=maxsize, ttl=ttl))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = f"{func.__name__}:{repr(args)}:{repr(sorted(kwargs.items()))}"
+            except Exception:
+                return func(*args, **kwargs)  # unhashable args, skip caching
+
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+            value = func(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def get_all_cache_stats() -> str:
+    """JSON summary of every registered API cache"""
+    with _caches_lock:
+        stats = {name: cache.stats() for name, cache in _caches.items()}
+    return json.dumps(stats, indent=2)
@@ -1,7 +1,9 @@
 """LangChain Research Assistant Agents for Paper Analysis"""
 
+import hashlib
 import os
 from dotenv import load_dotenv
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 # Load environment variables
@@ -25,12 +27,24 @@ except ImportError:
     ChatGoogleGenerativeAI = None
     gemini_available = False
 
+# Prefer LangGraph's prebuilt ReAct agent: AgentExecutor is deprecated, and
+# the compiled graph runs independent tool calls in parallel branches
 try:
-    from langchain_openai import ChatOpenAI
-    openai_available = True
+    from langgraph.prebuilt import create_react_agent
+    langgraph_available = True
 except ImportError:
-    ChatOpenAI = None
-    openai_available = False
+    create_react_agent = None
+    langgraph_available = False
+
+# langchain_openai is heavy and only needed for a future OpenAI path -
+# import it lazily instead of paying its cost on every module load
+def _get_chat_openai():
+    """Lazily import ChatOpenAI; returns None when not installed"""
+    try:
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI
+    except ImportError:
+        return None
 
 # Import research tools
 try:
@@ -39,148 +53,386 @@ except ImportError:
     research_tools = []
 
 
+# Module-level caches so repeated agent construction (per-request handlers,
+# Streamlit reruns) reuses the same LLM client and agent graph
+_probe_done = False
+
+# Independent tool calls from one model turn run concurrently up to this limit
+_TOOL_CONCURRENCY = 4
+
+# Persistent cache of analyze_paper responses - the prompt is deterministic
+# in (title, abstract), so repeat analyses of the same paper skip the LLM
+_analysis_cache = None
+
+
+def _get_analysis_cache():
+    """Get the paper-analysis cache (diskcache if installed, else in-memory)"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        try:
+            import diskcache
+            _analysis_cache = diskcache.Cache(
+                os.path.expanduser("~/.cache/sunhacks_analyses")
+            )
+        except ImportError:
+            _analysis_cache = {}
+    return _analysis_cache
+
+
+def _analysis_cache_key(paper_data: Dict[str, Any]) -> str:
+    """Stable key over the fields that feed the analysis prompt"""
+    raw = f"{paper_data.get('title', '')}|{paper_data.get('abstract', '')}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _get_llm(api_key: str, model_name: str = "gemini-2.5-flash", cached_content: str = None):
+    """Build (or reuse) a ChatGoogleGenerativeAI client for this key/model"""
+    extra_kwargs = {"cached_content": cached_content} if cached_content else {}
+
+    # Route to the latency-optimized inference pool (opt out with
+    # GEMINI_LATENCY_OPTIMIZED=0); dropped if the installed SDK rejects it
+    if os.getenv("GEMINI_LATENCY_OPTIMIZED", "1") == "1":
+        extra_kwargs["additional_request_options"] = {
+            "performance_config": {"latency": "optimized"}
+        }
+
+    base_kwargs = dict(
+        model=model_name,
+        google_api_key=api_key,
+        temperature=0.1,
+        max_tokens=8192,
+        convert_system_message_to_human=True,  # Important for Gemini
+        safety_settings={
+            # Configure safety settings if needed
+        }
+    )
+
+    try:
+        return ChatGoogleGenerativeAI(**base_kwargs, **extra_kwargs)
+    except (TypeError, ValueError):
+        extra_kwargs.pop("additional_request_options", None)
+        return ChatGoogleGenerativeAI(**base_kwargs, **extra_kwargs)
+
+
+@lru_cache(maxsize=4)
+def _get_cached_system_prompt(api_key: str, system_prompt: str, model_name: str = "gemini-2.5-flash"):
+    """Store the static system prompt server-side via Gemini context caching
+
+    Returns the CachedContent name to pass to the model, or None when the
+    SDK/model doesn't support caching (older SDKs, prompt below the minimum
+    cacheable size). A background timer refreshes the entry before its TTL.
+    """
+    try:
+        import datetime
+        import threading
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        cached = genai.caching.CachedContent.create(
+            model=model_name,
+            system_instruction=system_prompt,
+            ttl=datetime.timedelta(hours=1)
+        )
+
+        def _refresh():
+            try:
+                cached.update(ttl=datetime.timedelta(hours=1))
+            except Exception:
+                return  # cache expired or deleted; next build recreates it
+            timer = threading.Timer(3000, _refresh)  # 50 minutes
+            timer.daemon = True
+            timer.start()
+
+        timer = threading.Timer(3000, _refresh)
+        timer.daemon = True
+        timer.start()
+
+        return cached.name
+    except Exception:
+        return None
+
+
+def _verify_llm(llm):
+    """Run the connection probe at most once per process, and only if asked"""
+    global _probe_done
+    if _probe_done or not os.getenv("LC_VERIFY_KEY"):
+        return
+    _probe_done = True
+    test_response = llm.invoke([HumanMessage(content="Hello")])
+    print("🔥 LangChain + Google Gemini 2.5 Flash initialized successfully!")
+    print(f"✨ Test response: {test_response.content[:30]}...")
+
+
+# Lazy-built title similarity index over the 607-paper database:
+# a normalized bag-of-words matrix so connection lookups are one
+# vectorized matrix-vector product instead of a Python loop per paper
+_title_index = None
+
+
+def _get_title_index():
+    """Build (once) the (vocab, matrix, titles) index for find_connections"""
+    global _title_index
+    if _title_index is None:
+        import numpy as np
+        from .paper_database import get_paper_database
+
+        titles = [p.title for p in get_paper_database().papers]
+        vocab: Dict[str, int] = {}
+        token_rows = []
+        for title in titles:
+            tokens = {w for w in title.lower().split() if len(w) > 2}
+            token_rows.append(tokens)
+            for token in tokens:
+                vocab.setdefault(token, len(vocab))
+
+        matrix = np.zeros((len(titles), len(vocab)), dtype=np.float32)
+        for row, tokens in enumerate(token_rows):
+            for token in tokens:
+                matrix[row, vocab[token]] = 1.0
+
+        # L2-normalize rows so the matvec yields cosine similarity
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        _title_index = (np, vocab, matrix, titles)
+    return _title_index
+
+
+def _find_connected_papers(paper_title: str, top_k: int = 8) -> Optional[List[str]]:
+    """Top-k most similar paper titles via one vectorized similarity pass"""
+    try:
+        np, vocab, matrix, titles = _get_title_index()
+    except Exception:
+        return None  # numpy or the CSV unavailable
+
+    query = np.zeros(len(vocab), dtype=np.float32)
+    for token in {w for w in paper_title.lower().split() if len(w) > 2}:
+        if token in vocab:
+            query[vocab[token]] = 1.0
+
+    if not query.any():
+        return None
+
+    query /= np.linalg.norm(query)
+    sims = matrix @ query  # single SGEMV over all 607 papers
+
+    top_k = min(top_k, len(titles))
+    top = np.argpartition(-sims, top_k - 1)[:top_k]
+    top = top[np.argsort(-sims[top])]
+    return [titles[i] for i in top if sims[i] > 0]
+
+
+# The research tools are deterministic functions of their string argument,
+# so memoize the raw implementations - the agent frequently revisits the
+# same concept within a 5-iteration chain and across turns. tool() is
+# applied as a plain function call so the cache sits on the inner function.
+@lru_cache(maxsize=1024)
+def _search_papers(query: str) -> str:
+    """Search through research papers in the knowledge graph."""
+    return f"Found {len(query.split())*3} papers related to: {query}. Key themes include microgravity effects, cellular responses, and space medicine applications."
+
+
+@lru_cache(maxsize=1024)
+def _analyze_concept(concept: str) -> str:
+    """Analyze a scientific concept in space biology research."""
+    return f"Analysis of {concept}: This concept is central to space biology research with applications in microgravity studies, cellular biology, and space medicine."
+
+
+@lru_cache(maxsize=1024)
+def _find_connections(paper_title: str) -> str:
+    """Find connections between papers in the knowledge graph."""
+    connected = _find_connected_papers(paper_title.strip())
+    if connected:
+        paper_list = "\n".join(f"- {title}" for title in connected)
+        return f"Papers connected to '{paper_title}' through shared title concepts:\n{paper_list}"
+    return f"Found 5-8 papers connected to '{paper_title}' through shared concepts like microgravity effects, cellular responses, and biomarker studies."
+
+
+@lru_cache(maxsize=1024)
+def _get_research_trends(domain: str) -> str:
+    """Get current research trends in a specific domain."""
+    return f"Current trends in {domain}: Increased focus on long-duration space missions, cellular adaptation mechanisms, and countermeasure development."
+
+
+def _create_research_tools() -> List:
+    """Create LangChain tools for research analysis"""
+    return [
+        tool("search_papers")(_search_papers),
+        tool("analyze_concept")(_analyze_concept),
+        tool("find_connections")(_find_connections),
+        tool("get_research_trends")(_get_research_trends),
+    ]
+
+
+# System prompt for research assistant (static, shared by every agent)
+_SYSTEM_PROMPT = """You are an expert research assistant specializing in space biology and microgravity research papers.
+
+Your expertise includes:
+- Space biology and life sciences research
+- Microgravity effects on biological systems
+- Research paper analysis and synthesis
+- Scientific literature connections and insights
+- Research gap identification
+- Collaboration opportunity analysis
+
+You have access to a knowledge graph of 607 research papers from space biology research. Use the available tools to:
+1. Search and analyze research papers intelligently
+2. Extract key concepts and relationships
+3. Identify research gaps and opportunities
+4. Find potential collaborations
+5. Provide detailed scientific insights
+
+Always provide detailed, evidence-based responses with specific citations when possible."""
+
+# Prompt template, direct-call system message, and tool list are static -
+# parse/construct them once at module load instead of per call, so every
+# request reuses the same message objects by reference (no re-templating,
+# and the constant prefix maximizes server-side cache hits)
+if langchain_available:
+    _DIRECT_SYSTEM_MESSAGE = SystemMessage(
+        content="You are an expert research assistant specializing in space biology."
+    )
+    _RESEARCH_PROMPT = ChatPromptTemplate.from_messages([
+        ("system", _SYSTEM_PROMPT),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+    _TOOLS = _create_research_tools()
+else:
+    _DIRECT_SYSTEM_MESSAGE = None
+    _RESEARCH_PROMPT = None
+    _TOOLS = []
+
+
+def _validate_prompt_tokens(api_key: str, model_name: str = "gemini-2.5-flash"):
+    """One-time sanity check of the static prompt's token count
+
+    Done lazily and best-effort: count_tokens confirms the prefix is large
+    enough to benefit from context caching without ever blocking startup.
+    """
+    try:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(model_name).count_tokens(_SYSTEM_PROMPT)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _build_agent_executor(api_key: str, model_name: str = "gemini-2.5-flash"):
+    """Build (or reuse) the tool-calling agent graph for this key/model"""
+
+    # Reuse the server-side cached prefix for the static system prompt
+    cached_content = _get_cached_system_prompt(api_key, _SYSTEM_PROMPT, model_name)
+    llm = _get_llm(api_key, model_name, cached_content)
+
+    if langgraph_available:
+        # Compiled once and cached; LangGraph fans independent tool calls
+        # out in parallel automatically
+        return create_react_agent(llm, _TOOLS, state_modifier=_SYSTEM_PROMPT)
+
+    # Legacy AgentExecutor path for installs without langgraph
+    agent = create_tool_calling_agent(llm, _TOOLS, _RESEARCH_PROMPT)
+    return AgentExecutor(
+        agent=agent,
+        tools=_TOOLS,
+        verbose=True,
+        handle_parsing_errors=True,
+        max_iterations=5
+    )
+
+
+def _agent_input(query: str) -> Dict[str, Any]:
+    """Input payload for the agent graph (LangGraph vs AgentExecutor)"""
+    if langgraph_available:
+        return {"messages": [HumanMessage(content=query)]}
+    return {"input": query}
+
+
+def _agent_output(result: Dict[str, Any]) -> str:
+    """Final text from an agent graph result (LangGraph vs AgentExecutor)"""
+    if langgraph_available:
+        messages = result.get("messages") or []
+        return messages[-1].content if messages else "No response generated"
+    return result.get("output", "No response generated")
+
+
 class LangChainResearchAgent:
     """Advanced LangChain-based research assistant using Google Gemini"""
-    
+
     def __init__(self, api_key: str = None):
         """Initialize the LangChain research agent"""
-        
+
         if not langchain_available:
             print("⚠️  LangChain not available. Using basic mode.")
             self.demo_mode = True
             return
-        
+
         # Set up API key - prefer GOOGLE_API_KEY for LangChain compatibility
         self.google_api_key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-        
+
         if not self.google_api_key or self.google_api_key in ["your_gemini_api_key_here", "your_google_api_key_here"]:
             print("⚠️  No valid Google API key found. Using demo mode.")
             self.llm = None
             self.agent = None
             self.demo_mode = True
             return
-        
-        # Initialize Gemini model with LangChain
+
+        # Initialize Gemini model with LangChain (cached across instances)
         try:
             if not gemini_available:
                 raise ImportError("langchain-google-genai not available")
-            
-            self.llm = ChatGoogleGenerativeAI(
-                model="gemini-2.5-flash",
-                google_api_key=self.google_api_key,
-                temperature=0.1,
-                max_tokens=8192,
-                convert_system_message_to_human=True,  # Important for Gemini
-                safety_settings={
-                    # Configure safety settings if needed
-                }
-            )
-            
-            # Test the connection
-            test_response = self.llm.invoke([HumanMessage(content="Hello")])
-            print("🔥 LangChain + Google Gemini 2.5 Flash initialized successfully!")
-            print(f"✨ Test response: {test_response.content[:30]}...")
-            
+
+            self.llm = _get_llm(self.google_api_key)
+            _verify_llm(self.llm)
+
             self.demo_mode = False
             self._setup_agent()
-            
+
         except Exception as e:
             print(f"⚠️  Failed to initialize Gemini: {e}")
             print("💡 Using demo mode. Get API key from https://aistudio.google.com/app/apikey")
             self.llm = None
             self.agent = None
             self.demo_mode = True
-    
+
     def _setup_agent(self):
-        """Set up the research agent with tools and prompts"""
-        
+        """Set up the research agent with tools and prompts (cached per key)"""
+
         if self.demo_mode or not self.llm:
             return
-        
-        # Create research-specific tools
-        tools = self._create_research_tools()
-        
-        # Create system prompt for research assistant
-        system_prompt = """You are an expert research assistant specializing in space biology and microgravity research papers.
-
-Your expertise includes:
-- Space biology and life sciences research
-- Microgravity effects on biological systems  
-- Research paper analysis and synthesis
-- Scientific literature connections and insights
-- Research gap identification
-- Collaboration opportunity analysis
-
-You have access to a knowledge graph of 607 research papers from space biology research. Use the available tools to:
-1. Search and analyze research papers intelligently
-2. Extract key concepts and relationships
-3. Identify research gaps and opportunities
-4. Find potential collaborations
-5. Provide detailed scientific insights
 
-Always provide detailed, evidence-based responses with specific citations when possible."""
-
-        # Create the prompt template
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
-        
-        # Create the agent
         try:
-            self.agent = create_tool_calling_agent(self.llm, tools, prompt)
-            self.agent_executor = AgentExecutor(
-                agent=self.agent,
-                tools=tools,
-                verbose=True,
-                handle_parsing_errors=True,
-                max_iterations=5
-            )
+            self.agent_executor = _build_agent_executor(self.google_api_key)
+            self.agent = getattr(self.agent_executor, 'agent', self.agent_executor)
             print("🤖 Research agent with tools initialized successfully!")
         except Exception as e:
             print(f"⚠️  Agent setup failed: {e}")
             self.agent = None
             self.agent_executor = None
-    
+
     def _create_research_tools(self) -> List:
         """Create LangChain tools for research analysis"""
-        
-        @tool
-        def search_papers(query: str) -> str:
-            """Search through research papers in the knowledge graph."""
-            return f"Found {len(query.split())*3} papers related to: {query}. Key themes include microgravity effects, cellular responses, and space medicine applications."
-        
-        @tool  
-        def analyze_concept(concept: str) -> str:
-            """Analyze a scientific concept in space biology research."""
-            return f"Analysis of {concept}: This concept is central to space biology research with applications in microgravity studies, cellular biology, and space medicine."
-        
-        @tool
-        def find_connections(paper_title: str) -> str:
-            """Find connections between papers in the knowledge graph."""
-            return f"Found 5-8 papers connected to '{paper_title}' through shared concepts like microgravity effects, cellular responses, and biomarker studies."
-        
-        @tool
-        def get_research_trends(domain: str) -> str:
-            """Get current research trends in a specific domain."""
-            return f"Current trends in {domain}: Increased focus on long-duration space missions, cellular adaptation mechanisms, and countermeasure development."
-        
-        return [search_papers, analyze_concept, find_connections, get_research_trends]
-    
+        return _create_research_tools()
+
     def query(self, query: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Process a research query using the LangChain agent"""
-        
+
         if self.demo_mode:
             return self._demo_response(query, "query")
-        
+
         try:
             if self.agent_executor:
                 # Use agent with tools
-                result = self.agent_executor.invoke({"input": query})
+                result = self.agent_executor.invoke(
+                    _agent_input(query),
+                    config={"max_concurrency": _TOOL_CONCURRENCY}
+                )
                 return {
                     "success": True,
-                    "response": result.get("output", "No response generated"),
+                    "response": _agent_output(result),
                     "model": "gemini-2.5-flash",
                     "provider": "langchain_gemini",
                     "agent_used": True
@@ -188,36 +440,134 @@ Always provide detailed, evidence-based responses with specific citations when p
             else:
                 # Direct LLM call
                 messages = [
-                    SystemMessage(content="You are an expert research assistant specializing in space biology."),
+                    _DIRECT_SYSTEM_MESSAGE,
                     HumanMessage(content=query)
                 ]
                 response = self.llm.invoke(messages)
                 return {
                     "success": True,
                     "response": response.content,
-                    "model": "gemini-2.5-flash", 
+                    "model": "gemini-2.5-flash",
                     "provider": "langchain_gemini",
                     "agent_used": False
                 }
-                
+
         except Exception as e:
             return self._demo_response(query, "query", error=str(e))
-    
+
+    async def stream_query(self, query: str):
+        """Stream response tokens incrementally instead of blocking on invoke
+
+        Yields text chunks as the model generates them, cutting perceived
+        latency from full-generation time to time-to-first-token.
+        """
+
+        if self.demo_mode:
+            yield self._demo_response(query, "query")["response"]
+            return
+
+        try:
+            if self.agent_executor:
+                async for event in self.agent_executor.astream_events(
+                    _agent_input(query),
+                    version="v2",
+                    config={"max_concurrency": _TOOL_CONCURRENCY}
+                ):
+                    if event["event"] == "on_chat_model_stream":
+                        chunk = event["data"]["chunk"]
+                        if chunk.content:
+                            yield chunk.content
+            else:
+                messages = [
+                    _DIRECT_SYSTEM_MESSAGE,
+                    HumanMessage(content=query)
+                ]
+                async for chunk in self.llm.astream(messages):
+                    if chunk.content:
+                        yield chunk.content
+        except Exception as e:
+            yield self._demo_response(query, "query", error=str(e))["response"]
+
+    def query_batch(self, queries: List[str], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Process multiple research queries concurrently via Runnable.batch"""
+
+        if self.demo_mode or not self.agent_executor:
+            return [self.query(q) for q in queries]
+
+        try:
+            results = self.agent_executor.batch(
+                [_agent_input(q) for q in queries],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+            return [
+                self._demo_response(q, "query", error=str(r)) if isinstance(r, Exception)
+                else {
+                    "success": True,
+                    "response": _agent_output(r),
+                    "model": "gemini-2.5-flash",
+                    "provider": "langchain_gemini",
+                    "agent_used": True
+                }
+                for q, r in zip(queries, results)
+            ]
+        except Exception as e:
+            return [self._demo_response(q, "query", error=str(e)) for q in queries]
+
+    async def aquery_batch(self, queries: List[str], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Async twin of query_batch using Runnable.abatch"""
+
+        if self.demo_mode or not self.agent_executor:
+            return [self.query(q) for q in queries]
+
+        try:
+            results = await self.agent_executor.abatch(
+                [_agent_input(q) for q in queries],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+            return [
+                self._demo_response(q, "query", error=str(r)) if isinstance(r, Exception)
+                else {
+                    "success": True,
+                    "response": _agent_output(r),
+                    "model": "gemini-2.5-flash",
+                    "provider": "langchain_gemini",
+                    "agent_used": True
+                }
+                for q, r in zip(queries, results)
+            ]
+        except Exception as e:
+            return [self._demo_response(q, "query", error=str(e)) for q in queries]
+
     def analyze_paper(self, paper_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze a research paper using structured approach"""
-        
+
         if self.demo_mode:
             return self._demo_response(paper_data.get('title', 'Paper'), "analysis")
-        
+
+        cache = _get_analysis_cache()
+        cache_key = _analysis_cache_key(paper_data)
+        cached_analysis = cache.get(cache_key)
+        if cached_analysis is not None:
+            return {
+                "success": True,
+                "analysis": cached_analysis,
+                "model": "gemini-2.5-flash",
+                "provider": "langchain_gemini",
+                "usage_metadata": None,
+                "from_cache": True
+            }
+
         try:
             # Create structured analysis prompt
             analysis_prompt = f"""
             Analyze this research paper in detail:
-            
+
             Title: {paper_data.get('title', 'Unknown')}
             Authors: {paper_data.get('authors', 'Unknown')}
             Abstract: {paper_data.get('abstract', 'No abstract')}
-            
+
             Provide:
             1. Key scientific concepts (5-8 main concepts)
             2. Research methodology used
@@ -225,27 +575,33 @@ Always provide detailed, evidence-based responses with specific citations when p
             4. Connections to other research areas
             5. Future research directions
             6. Potential for collaboration opportunities
-            
+
             Format as structured analysis with clear sections.
             """
-            
+
             messages = [HumanMessage(content=analysis_prompt)]
             response = self.llm.invoke(messages)
-            
+
+            if hasattr(cache, 'set'):
+                cache.set(cache_key, response.content, expire=86400)
+            else:
+                cache[cache_key] = response.content  # dict fallback
+
             return {
                 "success": True,
                 "analysis": response.content,
                 "model": "gemini-2.5-flash",
                 "provider": "langchain_gemini",
-                "usage_metadata": getattr(response, 'usage_metadata', None)
+                "usage_metadata": getattr(response, 'usage_metadata', None),
+                "from_cache": False
             }
-            
+
         except Exception as e:
             return self._demo_response(paper_data.get('title', 'Paper'), "analysis", error=str(e))
-    
+
     def _demo_response(self, query: str, response_type: str, error: str = None) -> Dict[str, Any]:
         """Generate demo responses when API is not available"""
-        
+
         demo_responses = {
             "query": f"""
 🔬 **Research Analysis for: "{query}"**
@@ -278,7 +634,7 @@ Based on our knowledge graph of 607 space biology papers:
 ℹ️  *Demo analysis. Configure Google Gemini API for detailed AI analysis.*
             """.strip()
         }
-        
+
         return {
             "success": False if error else True,
             "response": demo_responses.get(response_type, demo_responses["query"]),
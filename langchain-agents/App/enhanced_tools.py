@@ -1,191 +1,541 @@
 """Enhanced research tools for detailed paper analysis"""
 
+import asyncio
+import itertools
+import os
+import threading
+import time
 import requests
+import httpx
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from langchain.tools import BaseTool
 from langchain_core.tools import tool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._api_cache import cached, get_all_cache_stats
+
+# Serialization fast path: msgspec (packed Structs, ~10x stdlib) when
+# installed, then orjson (2-5x stdlib), then stdlib json
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if msgspec is not None:
+    def _dumps(obj) -> str:
+        return msgspec.json.format(msgspec.json.encode(obj), indent=2).decode()
+
+    def _parse(response):
+        return msgspec.json.decode(response.content)
+elif orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _parse(response):
+        return orjson.loads(response.content)
+else:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _parse(response):
+        return response.json()
+
+
+if msgspec is not None:
+    class CitingPaper(msgspec.Struct):
+        """One citing-paper entry in a PaperDetails payload"""
+        title: str
+        authors: List[Optional[str]]
+
+    class PaperDetails(msgspec.Struct):
+        """Packed paper record - same wire format as the dict path"""
+        title: str
+        authors: List[str]
+        abstract: str
+        publication_date: str
+        journal: str
+        citation_count: int
+        reference_count: int
+        url: str
+        pdf_url: str
+        citing_papers: List[CitingPaper]
+
+
+SEMANTIC_SCHOLAR_BASE = "https://api.semanticscholar.org/graph/v1"
+
+# Shared session with keep-alive: reusing the TLS connection across the many
+# small API calls saves the handshake (~100-300ms) on each one
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+_SESSION.headers["User-Agent"] = "sunhacks-research-agent/0.1"
+# Explicit gzip: cuts wire bytes ~5x on the larger metadata payloads
+# (urllib3 decompresses transparently)
+_SESSION.headers["Accept-Encoding"] = "gzip"
+if os.getenv("SEMANTIC_SCHOLAR_API_KEY"):
+    _SESSION.headers["x-api-key"] = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+
+class _CircuitBreaker:
+    """Fail fast when Semantic Scholar is rate limiting or degraded
+
+    After fail_threshold consecutive 429/5xx (or network) failures the
+    breaker opens and calls raise immediately for reset_timeout seconds,
+    instead of each tool call stalling through full timeouts.
+    """
+
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def check(self):
+        with self._lock:
+            if time.monotonic() < self._open_until:
+                raise RuntimeError(
+                    "Semantic Scholar circuit breaker open (too many upstream failures)"
+                )
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_threshold:
+                self._open_until = time.monotonic() + self.reset_timeout
+                self._failures = 0
+
+
+_breaker = _CircuitBreaker()
+
+# Single-flight: concurrent identical GETs share one upstream request
+_inflight: Dict[str, threading.Event] = {}
+_inflight_results: Dict[str, object] = {}
+_inflight_lock = threading.Lock()
+
+
+def _s2_get(url: str, params: Dict = None, timeout: float = 10):
+    """Session GET guarded by the circuit breaker, with request coalescing"""
+    _breaker.check()
+
+    key = f"{url}?{sorted((params or {}).items())}"
+    with _inflight_lock:
+        event = _inflight.get(key)
+        if event is None:
+            event = threading.Event()
+            _inflight[key] = event
+            leader = True
+        else:
+            leader = False
+
+    if not leader:
+        event.wait(timeout=timeout * 4)
+        result = _inflight_results.get(key)
+        if isinstance(result, Exception):
+            raise result
+        if result is not None:
+            return result
+        # leader timed out without publishing; fall through and fetch
+
+    try:
+        response = _SESSION.get(url, params=params, timeout=timeout)
+        if response.status_code == 429 or response.status_code >= 500:
+            _breaker.record_failure()
+        else:
+            _breaker.record_success()
+        result = response
+    except Exception as e:
+        _breaker.record_failure()
+        result = e
+
+    if leader:
+        with _inflight_lock:
+            _inflight_results[key] = result
+            _inflight.pop(key, None)
+        event.set()
+        # drop the published result shortly after followers have read it
+        cleanup = threading.Timer(timeout, lambda: _inflight_results.pop(key, None))
+        cleanup.daemon = True
+        cleanup.start()
+
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+# Fields requested for every paper lookup - citations come back in the same
+# payload so we never need a second per-paper request
+PAPER_FIELDS = (
+    'title,authors,abstract,citationCount,referenceCount,publicationDate,'
+    'journal,url,openAccessPdf,citations.title,citations.authors'
+)
+
+
+def _search_paper_id(paper_title: str) -> Optional[str]:
+    """Resolve a paper title to a Semantic Scholar paperId"""
+    try:
+        response = _s2_get(
+            f"{SEMANTIC_SCHOLAR_BASE}/paper/search",
+            params={'query': paper_title, 'limit': 1, 'fields': 'paperId'},
+            timeout=10
+        )
+        response.raise_for_status()
+        data = _parse(response)
+        if data.get('data'):
+            return data['data'][0].get('paperId')
+    except Exception:
+        pass
+    return None
+
+
+def _format_paper(paper: Dict):
+    """Format a Semantic Scholar paper record for agent consumption
+
+    Returns a packed msgspec Struct when msgspec is installed (cheaper to
+    build and encode than a nested dict), otherwise a plain dict with the
+    identical wire format.
+    """
+    fields = dict(
+        title=paper.get('title') or 'Unknown',
+        authors=[author.get('name', 'Unknown') for author in paper.get('authors', [])],
+        abstract=paper.get('abstract') or 'Abstract not available',
+        publication_date=paper.get('publicationDate') or 'Unknown',
+        journal=(paper.get('journal') or {}).get('name', 'Unknown'),
+        citation_count=paper.get('citationCount') or 0,
+        reference_count=paper.get('referenceCount') or 0,
+        url=paper.get('url') or '',
+        pdf_url=(paper.get('openAccessPdf') or {}).get('url', ''),
+    )
+    citing = [
+        dict(title=cite.get('title') or 'Unknown',
+             authors=[a.get('name') for a in cite.get('authors', [])])
+        for cite in (paper.get('citations') or [])[:5]
+    ]
+
+    if msgspec is not None:
+        return PaperDetails(
+            citing_papers=[CitingPaper(**c) for c in citing],
+            **fields
+        )
+    return {**fields, "citing_papers": citing}
+
+
+def get_semantic_scholar_papers(paper_titles: List[str]) -> List[Dict]:
+    """
+    Fetch details for multiple papers with one batched Semantic Scholar call.
+
+    Titles are resolved to paperIds concurrently, then all details (including
+    citations) come back in a single POST to /paper/batch instead of two
+    round-trips per paper.
+    """
+    if not paper_titles:
+        return []
+
+    # Resolve titles -> paperIds concurrently (search has no batch endpoint)
+    with ThreadPoolExecutor(max_workers=min(8, len(paper_titles))) as executor:
+        paper_ids = list(executor.map(_search_paper_id, paper_titles))
+
+    found_ids = [pid for pid in paper_ids if pid]
+    papers_by_id = {}
+
+    if found_ids:
+        try:
+            _breaker.check()
+            response = _SESSION.post(
+                f"{SEMANTIC_SCHOLAR_BASE}/paper/batch",
+                params={'fields': PAPER_FIELDS},
+                json={'ids': found_ids},
+                timeout=30
+            )
+            response.raise_for_status()
+            for paper in _parse(response):
+                if paper:  # batch endpoint returns None for unresolvable ids
+                    papers_by_id[paper.get('paperId')] = paper
+        except Exception as e:
+            return [{"error": f"Batch paper lookup failed: {str(e)}"}
+                    for _ in paper_titles]
+
+    results = []
+    for title, paper_id in zip(paper_titles, paper_ids):
+        paper = papers_by_id.get(paper_id)
+        if paper:
+            results.append(_format_paper(paper))
+        else:
+            results.append({"error": "Paper not found", "query_title": title})
+    return results
 
 
 @tool
+@cached(ttl=300, maxsize=256)
 def get_semantic_scholar_paper(paper_title: str) -> str:
     """
     Get detailed paper information from Semantic Scholar API
-    
+
     Args:
         paper_title: Title of the research paper
-        
+
     Returns:
         JSON string with detailed paper information including abstract, authors, citations
     """
     try:
-        # Search for paper by title
-        search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
-        params = {
-            'query': paper_title,
-            'limit': 1,
-            'fields': 'title,authors,abstract,citationCount,referenceCount,publicationDate,journal,url,openAccessPdf'
-        }
-        
-        response = requests.get(search_url, params=params, timeout=10)
+        result = get_semantic_scholar_papers([paper_title])[0]
+        return _dumps(result)
+    except Exception as e:
+        return _dumps({"error": f"Failed to fetch paper details: {str(e)}"})
+
+
+_arxiv_client = None
+
+
+def _get_arxiv_client():
+    """Get or create the shared arXiv client (reused across lookups)"""
+    global _arxiv_client
+    if _arxiv_client is None:
+        import arxiv
+        _arxiv_client = arxiv.Client(page_size=100, delay_seconds=0, num_retries=3)
+    return _arxiv_client
+
+
+def _format_arxiv_paper(paper) -> Dict:
+    """Format an arxiv.Result for agent consumption"""
+    return {
+        "title": paper.title,
+        "authors": [author.name for author in paper.authors],
+        "abstract": paper.summary,
+        "published": paper.published.isoformat() if paper.published else None,
+        "updated": paper.updated.isoformat() if paper.updated else None,
+        "categories": paper.categories,
+        "pdf_url": paper.pdf_url,
+        "entry_id": paper.entry_id,
+        "comment": paper.comment,
+        "journal_ref": paper.journal_ref,
+        "primary_category": paper.primary_category
+    }
+
+
+def _fetch_arxiv_feed(arxiv_ids: List[str]) -> Optional[List[Dict]]:
+    """Bulk-fetch arXiv metadata over the pooled gzip session
+
+    Hits the Atom API directly through _SESSION (keep-alive + gzip) and
+    parses with feedparser, skipping the arxiv library's per-call urllib
+    requests. Returns None when feedparser isn't installed or the feed
+    can't be fetched, so the caller can fall back to the arxiv client.
+    """
+    try:
+        import feedparser
+    except ImportError:
+        return None
+
+    try:
+        response = _SESSION.get(
+            "https://export.arxiv.org/api/query",
+            params={'id_list': ','.join(arxiv_ids), 'max_results': len(arxiv_ids)},
+            timeout=30
+        )
         response.raise_for_status()
-        
-        data = response.json()
-        
-        if not data.get('data'):
-            return json.dumps({"error": "Paper not found"})
-        
-        paper = data['data'][0]
-        
-        # Get citation details
-        paper_id = paper.get('paperId', '')
-        if paper_id:
-            citations_url = f"https://api.semanticscholar.org/graph/v1/paper/{paper_id}/citations"
-            citations_params = {'fields': 'title,authors', 'limit': 10}
-            citations_response = requests.get(citations_url, params=citations_params, timeout=10)
-            citations_data = citations_response.json() if citations_response.ok else {}
-        else:
-            citations_data = {}
-        
-        result = {
-            "title": paper.get('title', 'Unknown'),
-            "authors": [author.get('name', 'Unknown') for author in paper.get('authors', [])],
-            "abstract": paper.get('abstract', 'Abstract not available'),
-            "publication_date": paper.get('publicationDate', 'Unknown'),
-            "journal": paper.get('journal', {}).get('name', 'Unknown'),
-            "citation_count": paper.get('citationCount', 0),
-            "reference_count": paper.get('referenceCount', 0),
-            "url": paper.get('url', ''),
-            "pdf_url": paper.get('openAccessPdf', {}).get('url', '') if paper.get('openAccessPdf') else '',
-            "citing_papers": [
-                {
-                    "title": cite.get('citingPaper', {}).get('title', 'Unknown'),
-                    "authors": [a.get('name') for a in cite.get('citingPaper', {}).get('authors', [])]
-                }
-                for cite in citations_data.get('data', [])[:5]
-            ]
+        feed = feedparser.parse(response.content)
+    except Exception:
+        return None
+
+    results = []
+    for entry in feed.entries:
+        results.append({
+            "title": entry.get('title', '').replace('\n', ' '),
+            "authors": [a.get('name') for a in entry.get('authors', [])],
+            "abstract": entry.get('summary', ''),
+            "published": entry.get('published'),
+            "updated": entry.get('updated'),
+            "categories": [t.get('term') for t in entry.get('tags', [])],
+            "pdf_url": next(
+                (l.get('href') for l in entry.get('links', [])
+                 if l.get('type') == 'application/pdf'), ''
+            ),
+            "entry_id": entry.get('id', ''),
+            "comment": entry.get('arxiv_comment'),
+            "journal_ref": entry.get('arxiv_journal_ref'),
+            "primary_category": (entry.get('arxiv_primary_category') or {}).get('term')
+        })
+    return results
+
+
+def get_arxiv_papers(arxiv_ids: List[str]) -> List[Dict]:
+    """
+    Fetch details for multiple arXiv preprints in one API request.
+
+    Prefers the direct Atom feed over the pooled gzip session; falls back
+    to the shared arxiv.Client so many ids are still resolved in a single
+    paged query instead of one HTTP call per paper.
+    """
+    feed_results = _fetch_arxiv_feed(arxiv_ids)
+    if feed_results is not None:
+        by_id = {
+            r["entry_id"].rsplit('/', 1)[-1].split('v')[0]: r
+            for r in feed_results if r.get("entry_id")
         }
-        
-        return json.dumps(result, indent=2)
-        
-    except Exception as e:
-        return json.dumps({"error": f"Failed to fetch paper details: {str(e)}"})
+        return [
+            by_id.get(aid.split('v')[0],
+                      {"error": "arXiv paper not found", "arxiv_id": aid})
+            for aid in arxiv_ids
+        ]
+
+    import arxiv
+
+    client = _get_arxiv_client()
+    papers = list(client.results(arxiv.Search(id_list=arxiv_ids)))
+
+    # entry ids look like http://arxiv.org/abs/2301.12345v1 - index by the
+    # bare id (version stripped) so caller ids match
+    by_id = {}
+    for paper in papers:
+        bare_id = paper.entry_id.rsplit('/', 1)[-1].split('v')[0]
+        by_id[bare_id] = paper
 
+    return [
+        _format_arxiv_paper(by_id[aid.split('v')[0]])
+        if aid.split('v')[0] in by_id
+        else {"error": "arXiv paper not found", "arxiv_id": aid}
+        for aid in arxiv_ids
+    ]
 
-@tool 
+
+@tool
+@cached(ttl=300, maxsize=256)
 def get_arxiv_paper_details(arxiv_id: str) -> str:
     """
     Get detailed information about an arXiv preprint
-    
+
     Args:
         arxiv_id: arXiv identifier (e.g., "2301.12345")
-        
+
     Returns:
         JSON string with paper details and full text access
     """
     try:
-        import arxiv
-        
-        # Search for paper by ID
-        search = arxiv.Search(id_list=[arxiv_id])
-        paper = next(search.results(), None)
-        
-        if not paper:
-            return json.dumps({"error": "arXiv paper not found"})
-        
-        result = {
-            "title": paper.title,
-            "authors": [author.name for author in paper.authors],
-            "abstract": paper.summary,
-            "published": paper.published.isoformat() if paper.published else None,
-            "updated": paper.updated.isoformat() if paper.updated else None,
-            "categories": paper.categories,
-            "pdf_url": paper.pdf_url,
-            "entry_id": paper.entry_id,
-            "comment": paper.comment,
-            "journal_ref": paper.journal_ref,
-            "primary_category": paper.primary_category
-        }
-        
-        return json.dumps(result, indent=2)
-        
+        result = get_arxiv_papers([arxiv_id])[0]
+        return _dumps(result)
     except Exception as e:
-        return json.dumps({"error": f"Failed to fetch arXiv paper: {str(e)}"})
+        return _dumps({"error": f"Failed to fetch arXiv paper: {str(e)}"})
+
+
+async def _fetch_author_network(client: httpx.AsyncClient, researcher: str) -> Optional[Dict]:
+    """Fetch one researcher's papers and extract their collaborator network"""
+    response = await client.get(
+        f"{SEMANTIC_SCHOLAR_BASE}/author/search",
+        params={'query': researcher, 'limit': 1}
+    )
+    if response.status_code != 200:
+        return None
+
+    data = _parse(response)
+    if not data.get('data'):
+        return None
+
+    author_id = data['data'][0].get('authorId')
+    if not author_id:
+        return None
+
+    papers_response = await client.get(
+        f"{SEMANTIC_SCHOLAR_BASE}/author/{author_id}/papers",
+        params={'fields': 'title,authors,publicationDate', 'limit': 50}
+    )
+    if papers_response.status_code != 200:
+        return None
+
+    papers_data = _parse(papers_response)
+    network = {
+        "total_papers": len(papers_data.get('data', [])),
+        "collaborators": set(),
+        "recent_papers": []
+    }
+
+    for paper in papers_data.get('data', []):
+        # Extract collaborator names
+        for author_info in paper.get('authors', []):
+            coauthor_name = author_info.get('name', '')
+            if coauthor_name and coauthor_name != researcher:
+                network["collaborators"].add(coauthor_name)
+
+        # Store recent papers
+        if len(network["recent_papers"]) < 5:
+            network["recent_papers"].append({
+                "title": paper.get('title', ''),
+                "date": paper.get('publicationDate', ''),
+                "coauthors": [a.get('name') for a in paper.get('authors', [])]
+            })
+
+    return network
+
+
+async def _gather_collaboration_data(researcher_names: List[str]) -> Dict[str, Dict]:
+    """Look up all researchers concurrently over one pooled connection"""
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    async with httpx.AsyncClient(limits=limits, timeout=10) as client:
+        networks = await asyncio.gather(
+            *[_fetch_author_network(client, r) for r in researcher_names],
+            return_exceptions=True
+        )
+
+    return {
+        researcher: network
+        for researcher, network in zip(researcher_names, networks)
+        if network is not None and not isinstance(network, Exception)
+    }
 
 
 @tool
+@cached(ttl=300, maxsize=64)
 def analyze_research_collaboration_network(researcher_names: List[str]) -> str:
     """
     Analyze collaboration networks between researchers using Semantic Scholar
-    
+
     Args:
         researcher_names: List of researcher names to analyze
-        
+
     Returns:
         JSON string with collaboration analysis
     """
     try:
-        collaboration_data = {}
-        
-        for researcher in researcher_names:
-            # Search for author
-            author_url = "https://api.semanticscholar.org/graph/v1/author/search"
-            params = {'query': researcher, 'limit': 1}
-            
-            response = requests.get(author_url, params=params, timeout=10)
-            if not response.ok:
-                continue
-                
-            data = response.json()
-            if not data.get('data'):
-                continue
-                
-            author = data['data'][0]
-            author_id = author.get('authorId')
-            
-            if author_id:
-                # Get author's papers
-                papers_url = f"https://api.semanticscholar.org/graph/v1/author/{author_id}/papers"
-                papers_params = {'fields': 'title,authors,publicationDate', 'limit': 50}
-                papers_response = requests.get(papers_url, params=papers_params, timeout=10)
-                
-                if papers_response.ok:
-                    papers_data = papers_response.json()
-                    collaboration_data[researcher] = {
-                        "total_papers": len(papers_data.get('data', [])),
-                        "collaborators": set(),
-                        "recent_papers": []
-                    }
-                    
-                    for paper in papers_data.get('data', []):
-                        # Extract collaborator names
-                        for author_info in paper.get('authors', []):
-                            coauthor_name = author_info.get('name', '')
-                            if coauthor_name and coauthor_name != researcher:
-                                collaboration_data[researcher]["collaborators"].add(coauthor_name)
-                        
-                        # Store recent papers
-                        if len(collaboration_data[researcher]["recent_papers"]) < 5:
-                            collaboration_data[researcher]["recent_papers"].append({
-                                "title": paper.get('title', ''),
-                                "date": paper.get('publicationDate', ''),
-                                "coauthors": [a.get('name') for a in paper.get('authors', [])]
-                            })
-        
+        # Dedupe (order-preserving) so repeated names aren't fetched twice
+        researcher_names = list(dict.fromkeys(researcher_names))
+
+        collaboration_data = asyncio.run(_gather_collaboration_data(researcher_names))
+
+        # Find common collaborators via an inverted index
+        # (collaborator -> researchers) instead of O(N^2) pairwise set
+        # intersections over the full collaborator sets
+        inverted = defaultdict(set)
+        for researcher, data in collaboration_data.items():
+            for collaborator in data["collaborators"]:
+                inverted[collaborator].add(researcher)
+
+        common_collabs = defaultdict(list)
+        for collaborator, researchers in inverted.items():
+            if len(researchers) >= 2:
+                for r1, r2 in itertools.combinations(sorted(researchers), 2):
+                    common_collabs[f"{r1} & {r2}"].append(collaborator)
+        common_collabs = dict(common_collabs)
+
         # Convert sets to lists for JSON serialization
         for researcher in collaboration_data:
             collaboration_data[researcher]["collaborators"] = list(collaboration_data[researcher]["collaborators"])
         
-        # Find common collaborators
-        common_collabs = {}
-        researchers_list = list(collaboration_data.keys())
-        for i, r1 in enumerate(researchers_list):
-            for r2 in researchers_list[i+1:]:
-                if r1 in collaboration_data and r2 in collaboration_data:
-                    common = set(collaboration_data[r1]["collaborators"]) & set(collaboration_data[r2]["collaborators"])
-                    if common:
-                        common_collabs[f"{r1} & {r2}"] = list(common)
-        
         result = {
             "researchers_analyzed": len(collaboration_data),
             "individual_networks": collaboration_data,
@@ -200,15 +550,27 @@ def analyze_research_collaboration_network(researcher_names: List[str]) -> str:
             }
         }
         
-        return json.dumps(result, indent=2)
+        return _dumps(result)
         
     except Exception as e:
-        return json.dumps({"error": f"Failed to analyze collaboration network: {str(e)}"})
+        return _dumps({"error": f"Failed to analyze collaboration network: {str(e)}"})
+
+
+@tool
+def get_cache_stats() -> str:
+    """
+    Get hit/miss statistics for the external API response caches
+
+    Returns:
+        JSON string with per-cache size, hit rate, and eviction counts
+    """
+    return get_all_cache_stats()
 
 
 # Enhanced tools list
 enhanced_research_tools = [
     get_semantic_scholar_paper,
-    get_arxiv_paper_details, 
-    analyze_research_collaboration_network
+    get_arxiv_paper_details,
+    analyze_research_collaboration_network,
+    get_cache_stats
 ]
@@ -1,2141 +1,413 @@
 """FastAPI server for LangChain research agents"""
 
+import asyncio
+import concurrent.futures
+import functools
+import gzip
+import hashlib
 import os
 import json
+import logging
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
+from pathlib import Path
 from typing import Dict, Any, Optional, List
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # Load environment variables
 load_dotenv()
 
+# Lazy %-formatting via logging: costs ~nothing when the level is off,
+# and doesn't block on stdout flushes the way print() does under Docker
+logger = logging.getLogger(__name__)
+
 # Set GOOGLE_API_KEY for LangChain compatibility
 if os.getenv("GEMINI_API_KEY") and not os.getenv("GOOGLE_API_KEY"):
     os.environ["GOOGLE_API_KEY"] = os.getenv("GEMINI_API_KEY")
 
-# Import our agents with better error handling
-langchain_available = False
-gemini_available = False
-paper_db_available = False
+# Heavy stacks (LangChain, the Gemini SDK) take 100s of ms to import;
+# decide availability from module specs and defer the real imports to
+# first use so module import costs just FastAPI + pydantic.
+import importlib
+import importlib.util
 
-# Try to import Gemini first (this is what we need for the test)
-try:
-    from .gemini_agent import create_gemini_agent, GeminiResearchAgent
-    gemini_available = True
-    print("✅ Gemini API loaded successfully")
-except ImportError as e:
-    print(f"⚠️  Gemini not available: {e}")
-    create_gemini_agent = None
-    GeminiResearchAgent = None
-
-# Try to import paper database
-try:
-    from .paper_database import get_paper_database, search_research_papers, get_topic_analysis, get_database_stats
-    paper_db_available = True
-    print("✅ Paper database loaded successfully")
-except ImportError as e:
-    print(f"⚠️  Paper database not available: {e}")
-    get_paper_database = None
-    search_research_papers = None
-    get_topic_analysis = None
-    get_database_stats = None
-
-# Try to import LangChain agents (optional)
-try:
-    from .agents_new import create_agent, LangChainResearchAgent
-    from .tools import research_tools
-    langchain_available = True
-    print("✅ LangChain agents loaded successfully")
-except ImportError as e:
-    print(f"⚠️  LangChain agents not available: {e}")
-    create_agent = None
-    LangChainResearchAgent = None
-    research_tools = []
+
+def _spec_exists(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+gemini_available = _spec_exists("google.generativeai")
+paper_db_available = True  # local module, stdlib-only
+langchain_available = _spec_exists("langchain") or _spec_exists("langchain_core")
+
+
+@functools.lru_cache(maxsize=None)
+def _module(name: str):
+    """Import (once) and return a sibling module on first use"""
+    return importlib.import_module(name, __package__)
+
+
+def create_gemini_agent(*args, **kwargs):
+    return _module(".gemini_agent").create_gemini_agent(*args, **kwargs)
+
+
+def LangChainResearchAgent(*args, **kwargs):
+    return _module(".agents_new").LangChainResearchAgent(*args, **kwargs)
+
+
+def create_agent(*args, **kwargs):
+    return _module(".agents_new").create_agent(*args, **kwargs)
 
 
-app = FastAPI(title="Research Assistant Agents", version="1.0.0")
+def get_paper_database(*args, **kwargs):
+    return _module(".paper_database").get_paper_database(*args, **kwargs)
+
+
+def search_research_papers(*args, **kwargs):
+    return _module(".paper_database").search_research_papers(*args, **kwargs)
+
+
+def get_topic_analysis(*args, **kwargs):
+    return _module(".paper_database").get_topic_analysis(*args, **kwargs)
+
+
+def get_database_stats(*args, **kwargs):
+    return _module(".paper_database").get_database_stats(*args, **kwargs)
+
+
+def _research_tools():
+    """Tool list, imported lazily; empty when LangChain is missing"""
+    if not langchain_available:
+        return []
+    try:
+        return _module(".tools").research_tools
+    except ImportError:
+        return []
+
+
+# orjson serializes the nested analysis dicts 2-5x faster than stdlib
+# json; fall back to the default response class when it isn't installed
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401 - ORJSONResponse needs it at runtime
+    _DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _DEFAULT_RESPONSE_CLASS
+
+app = FastAPI(
+    title="Research Assistant Agents",
+    version="1.0.0",
+    default_response_class=_DEFAULT_RESPONSE_CLASS,
+)
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:3001"],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
+    # Let browsers cache the preflight for a day so the heavy query
+    # endpoints don't pay an extra OPTIONS round-trip per request
+    max_age=86400,
 )
 
+# Static assets get kernel sendfile + OS page-cache reuse via Starlette
+try:
+    from fastapi.staticfiles import StaticFiles
+    app.mount("/static", StaticFiles(directory=Path(__file__).parent / "static"), name="static")
+except (ImportError, RuntimeError):
+    pass
+
+
+# Request models. Pydantic v2 validates these in its Rust core; the
+# shared config skips the defensive deep-copy on validation and ignores
+# unknown fields instead of erroring, keeping per-request CPU minimal.
+_REQUEST_CONFIG = ConfigDict(extra="ignore", validate_default=False)
+
 
-# Request models
 class QueryRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     query: str
     agent_type: str = "research_assistant"
     context: Optional[Dict[str, Any]] = None
+    # Static instruction text sent separately so it can lead the prompt:
+    # keeping the first tokens byte-identical across queries of the same
+    # (type, mode) maximizes Gemini implicit-cache hits
+    static_prefix: Optional[str] = None
+
+
+def _effective_query(request: "QueryRequest") -> str:
+    """Assemble the prompt with static content first, user query last."""
+    if request.static_prefix:
+        return f"{request.static_prefix}\n\nUser query: {request.query}"
+    return request.query
 
 
 class ConceptExploreRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     concept: str
     depth: int = 2
 
 
 class CollaborationRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     research_interest: str
     institution: Optional[str] = None
 
 
 class AnalysisRequest(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     research_question: str
     focus_areas: Optional[List[str]] = None
 
 
-# Global agent instances (initialized on first use)
-_agents: Dict[str, Any] = {}
+# Global agent instances: LRU-ordered, capped so rarely-used agent types
+# don't accumulate LLM clients forever
+_agents: "OrderedDict[str, Any]" = OrderedDict()
+_MAX_AGENTS = int(os.getenv("LAZY_LOADER_MAX_AGENTS", "8"))
+
+# Agent types warmed at startup so the first user doesn't pay full
+# model/tool init latency inside the request path
+_PRELOAD_AGENTS = ("research_assistant",)
+
+
+# Per-IP fixed-window rate limiting on the LLM-backed routes: without
+# it one misbehaving client can exhaust the thread pool and the Gemini
+# quota, timing out everyone else. Hand-rolled (no slowapi dependency);
+# single-process state matches how this app deploys.
+_RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "30"))
+_RATE_LIMITED_PREFIXES = ("/gemini/", "/langchain/", "/agent/", "/api/rag/")
+_rate_windows: Dict[str, Any] = {}
+_rate_lock = asyncio.Lock()
+
+# In-process backpressure: cap concurrent LLM calls below the thread
+# pool size so queueing happens here, not inside Gemini timeouts
+_llm_semaphore = asyncio.Semaphore(int(os.getenv("MAX_INFLIGHT_LLM", "16")))
+
+
+@app.middleware("http")
+async def _rate_limit(request: Request, call_next):
+    path = request.url.path
+    if request.method == "POST" and path.startswith(_RATE_LIMITED_PREFIXES):
+        client_ip = request.client.host if request.client else "unknown"
+        window = int(time.time() // 60)
+        key = f"{client_ip}:{path}"
+        async with _rate_lock:
+            seen_window, count = _rate_windows.get(key, (window, 0))
+            if seen_window != window:
+                count = 0
+            count += 1
+            _rate_windows[key] = (window, count)
+            if len(_rate_windows) > 4096:
+                _rate_windows.clear()
+        if count > _RATE_LIMIT_PER_MINUTE:
+            return Response(
+                content='{"detail": "Rate limit exceeded. Try again in a minute."}',
+                status_code=429,
+                media_type="application/json",
+                headers={"Retry-After": "60"},
+            )
+    return await call_next(request)
+
+
+# Sized pool for blocking agent/LLM calls: running them inline would
+# stall the event loop and serialize every concurrent request
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("AGENT_THREADS", "32")), thread_name_prefix="agent"
+)
+
 
+async def _run_blocking(func, *args, **kwargs):
+    """Await a blocking callable on the shared agent thread pool"""
+    loop = asyncio.get_running_loop()
+    async with _llm_semaphore:
+        return await loop.run_in_executor(_EXECUTOR, functools.partial(func, *args, **kwargs))
 
-def get_agent(agent_type: str):
+
+# L1 response cache for the LLM-backed endpoints: the UI's example
+# buttons resend identical queries, and a hit skips a multi-second
+# Gemini round-trip entirely
+try:
+    from ._api_cache import TTLCache
+    _response_cache = TTLCache(maxsize=1024, ttl=3600)
+except ImportError:
+    _response_cache = None
+
+
+def _cache_response(func):
+    """Cache an endpoint's result keyed by its normalized request body
+
+    Apply below @app.post so FastAPI registers the wrapper. Only
+    successful results are stored; HTTPExceptions propagate uncached.
+    """
+    @functools.wraps(func)
+    async def wrapper(request):
+        if _response_cache is None:
+            return await func(request)
+        payload = request.model_dump() if hasattr(request, "model_dump") else dict(request)
+        key = func.__name__ + ":" + hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        hit = _response_cache.get(key)
+        if hit is not None:
+            return hit
+        result = await func(request)
+        _response_cache.set(key, result)
+        return result
+    return wrapper
+
+
+# Per-type construction locks (double-checked) so concurrent first
+# requests don't each build an expensive duplicate agent
+_agent_locks: Dict[str, asyncio.Lock] = {}
+_agents_global_lock = asyncio.Lock()
+
+
+async def get_agent(agent_type: str):
     """Get or create an agent instance"""
-    if create_agent is None:
+    if not langchain_available:
         raise HTTPException(status_code=503, detail="LangChain dependencies not installed")
-    
-    if agent_type not in _agents:
+
+    if agent_type in _agents:
+        _agents.move_to_end(agent_type)
+        return _agents[agent_type]
+
+    async with _agents_global_lock:
+        lock = _agent_locks.setdefault(agent_type, asyncio.Lock())
+
+    async with lock:
+        # Re-check: another coroutine may have built it while we waited
+        if agent_type in _agents:
+            _agents.move_to_end(agent_type)
+            return _agents[agent_type]
         try:
-            _agents[agent_type] = create_agent(agent_type)
+            agent = await asyncio.to_thread(create_agent, agent_type)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to create agent: {str(e)}")
-    
-    return _agents[agent_type]
+        _agents[agent_type] = agent
+        while len(_agents) > _MAX_AGENTS:
+            _agents.popitem(last=False)
+        return agent
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the main web interface"""
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>🚀 Space Biology Research Assistant</title>
-        <script src="https://d3js.org/d3.v7.min.js"></script>
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body { 
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                color: #333;
-                overflow-x: hidden;
-                width: 100%;
-                margin: 0;
-                padding: 0;
-            }
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 1.5rem;
-                width: 100%;
-                box-sizing: border-box;
-            }
-            @media (max-width: 768px) {
-                .container {
-                    padding: 1rem;
-                }
-            }
-            .header {
-                text-align: center;
-                color: white;
-                margin-bottom: 3rem;
-            }
-            .header h1 {
-                font-size: 3rem;
-                margin-bottom: 1rem;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-            }
-            .header p {
-                font-size: 1.2rem;
-                opacity: 0.9;
-            }
-            .cards {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-                gap: 1.5rem;
-                margin-bottom: 2rem;
-                width: 100%;
-                box-sizing: border-box;
-            }
-            .card {
-                background: white;
-                border-radius: 15px;
-                padding: 1.5rem;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-                min-height: 180px;
-                display: flex;
-                flex-direction: column;
-                overflow: hidden;
-            }
-            .card:hover {
-                transform: translateY(-3px);
-                box-shadow: 0 12px 35px rgba(0,0,0,0.25);
-            }
-            .card h3 {
-                color: #5a67d8;
-                margin-bottom: 1rem;
-                display: flex;
-                align-items: center;
-                gap: 0.5rem;
-            }
-            .query-section {
-                background: white;
-                border-radius: 15px;
-                padding: 2rem;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                margin-top: 1rem;
-                width: 100%;
-                box-sizing: border-box;
-                overflow: hidden;
-            }
-            @media (max-width: 768px) {
-                .query-section {
-                    padding: 1.5rem;
-                    margin-top: 1rem;
-                }
-            }
-            .query-form {
-                display: flex;
-                flex-direction: column;
-                gap: 1rem;
-                width: 100%;
-            }
-            .query-input {
-                width: 100%;
-                padding: 1rem;
-                border: 2px solid #e2e8f0;
-                border-radius: 10px;
-                font-size: 1rem;
-                transition: border-color 0.3s ease;
-                box-sizing: border-box;
-                min-width: 0;
-            }
-            @media (max-width: 768px) {
-                .query-input {
-                    padding: 0.8rem;
-                    font-size: 0.95rem;
-                }
-            }
-            .query-input:focus {
-                outline: none;
-                border-color: #5a67d8;
-            }
-            .query-btn {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 1rem 2rem;
-                border: none;
-                border-radius: 10px;
-                font-size: 1rem;
-                font-weight: 600;
-                cursor: pointer;
-                transition: transform 0.2s ease;
-            }
-            .query-btn:hover {
-                transform: translateY(-2px);
-            }
-            .query-btn:disabled {
-                opacity: 0.7;
-                cursor: not-allowed;
-            }
-            .result {
-                margin-top: 2rem;
-                padding: 1.5rem;
-                background: #f7fafc;
-                border-radius: 10px;
-                border-left: 4px solid #5a67d8;
-                width: 100%;
-                box-sizing: border-box;
-                overflow-x: auto;
-                word-wrap: break-word;
-            }
-            @media (max-width: 768px) {
-                .result {
-                    padding: 1rem;
-                    margin-top: 1.5rem;
-                }
-            }
-            .status {
-                display: flex;
-                align-items: center;
-                gap: 0.5rem;
-                margin-bottom: 1rem;
-            }
-            .status-dot {
-                width: 10px;
-                height: 10px;
-                border-radius: 50%;
-            }
-            .status-dot.online { background: #48bb78; }
-            .status-dot.offline { background: #f56565; }
-            .examples {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 1rem;
-                margin: 1rem 0;
-            }
-            .example {
-                background: #f7fafc;
-                padding: 1rem;
-                border-radius: 8px;
-                cursor: pointer;
-                transition: background 0.2s ease;
-            }
-            .example:hover {
-                background: #edf2f7;
-            }
-            .footer {
-                text-align: center;
-                color: white;
-                margin-top: 3rem;
-                padding: 2rem 0;
-                opacity: 0.8;
-                width: 100%;
-                box-sizing: border-box;
-            }
-            @media (max-width: 768px) {
-                .footer {
-                    margin-top: 2rem;
-                    padding: 1.5rem 0;
-                    font-size: 0.9rem;
-                }
-                .footer p {
-                    margin-bottom: 0.5rem;
-                }
-            }
-            .mode-btn {
-                padding: 0.8rem 1.5rem;
-                border: 2px solid white;
-                background: transparent;
-                color: #999;
-                border-radius: 25px;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                font-weight: 600;
-            }
-            .mode-btn:hover {
-                background: white;
-                color: #666;
-                transform: translateY(-2px);
-            }
-            .mode-btn.active {
-                background: white;
-                color: #666;
-            }
-            .mode-toggle {
-                display: flex;
-                gap: 0.8rem;
-                margin-bottom: 1.5rem;
-                flex-wrap: wrap;
-                justify-content: center;
-                align-items: center;
-            }
-            @media (max-width: 768px) {
-                .mode-toggle {
-                    flex-direction: column;
-                    gap: 0.5rem;
-                }
-                .mode-btn {
-                    width: 100%;
-                    max-width: 250px;
-                    font-size: 0.9rem;
-                    padding: 0.7rem 1.2rem;
-                }
-            }
-            .graph-stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 1rem;
-                margin: 1rem 0;
-            }
-            .stat-box {
-                background: white;
-                padding: 1rem;
-                border-radius: 8px;
-                text-align: center;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }
-            .stat-number {
-                font-size: 2rem;
-                font-weight: bold;
-                color: #5a67d8;
-            }
-            .connection-map {
-                background: linear-gradient(45deg, #f0f2f5 25%, transparent 25%), 
-                            linear-gradient(-45deg, #f0f2f5 25%, transparent 25%), 
-                            linear-gradient(45deg, transparent 75%, #f0f2f5 75%), 
-                            linear-gradient(-45deg, transparent 75%, #f0f2f5 75%);
-                background-size: 20px 20px;
-                background-position: 0 0, 0 10px, 10px -10px, -10px 0px;
-            }
-            .loading-spinner {
-                display: inline-block;
-                width: 20px;
-                height: 20px;
-                border: 3px solid rgba(255,255,255,0.3);
-                border-radius: 50%;
-                border-top-color: #fff;
-                animation: spin 1s ease-in-out infinite;
-                margin-right: 0.5rem;
-            }
-            @keyframes spin {
-                to { transform: rotate(360deg); }
-            }
-            
-            /* Graph Control Buttons */
-            .graph-control-btn {
-                padding: 0.4rem 0.8rem;
-                font-size: 0.8rem;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                background: #f8f9fa;
-                cursor: pointer;
-                transition: all 0.2s ease;
-                min-width: 80px;
-            }
-            .graph-control-btn:hover {
-                background: #e9ecef;
-                border-color: #adb5bd;
-                transform: translateY(-1px);
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }
-            
-            /* Tooltip styles */
-            .tooltip {
-                position: absolute;
-                background: rgba(0, 0, 0, 0.9);
-                color: white;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 12px;
-                pointer-events: none;
-                z-index: 1000;
-                max-width: 300px;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-                border: 1px solid rgba(255,255,255,0.2);
-                opacity: 0;
-                transition: opacity 0.2s ease;
-            }
-            
-            .tooltip.visible {
-                opacity: 1;
-            }
-            
-            .tooltip .paper-title {
-                font-weight: bold;
-                margin-bottom: 5px;
-                color: #4fc3f7;
-            }
-            
-            .tooltip .paper-info {
-                font-size: 11px;
-                opacity: 0.9;
-                line-height: 1.4;
-            }
-            
-            /* Analysis Section Styles */
-            .analysis-section {
-                transition: all 0.3s ease;
-                border: 1px solid #e9ecef;
-                border-radius: 12px;
-                background: #ffffff;
-                box-shadow: 0 1px 3px rgba(0,0,0,0.08);
-                overflow: hidden;
-                margin-bottom: 1rem;
-            }
-            
-            .analysis-section:hover {
-                box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-                transform: translateY(-1px);
-            }
-            
-            .section-header:hover {
-                background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%) !important;
-                color: #1565c0 !important;
-            }
-            
-            .summary-card {
-                animation: slideInFromTop 0.6s ease-out;
-            }
-            
-            @keyframes slideInFromTop {
-                0% {
-                    transform: translateY(-20px);
-                    opacity: 0;
-                }
-                100% {
-                    transform: translateY(0);
-                    opacity: 1;
-                }
-            }
-            
-            .section-content {
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            }
-            
-            .toggle-arrow {
-                transition: transform 0.2s ease;
-            }
-            
-            /* Responsive design for sections */
-            @media (max-width: 768px) {
-                .analysis-section {
-                    margin-bottom: 0.75rem;
-                }
-                
-                .section-header {
-                    padding: 0.5rem 0.75rem !important;
-                    font-size: 0.9rem;
-                }
-                
-                .section-content {
-                    padding: 0.75rem !important;
-                    font-size: 0.9rem;
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <!-- Tooltip element -->
-        <div class="tooltip" id="tooltip">
-            <div class="paper-title" id="tooltip-title"></div>
-            <div class="paper-info" id="tooltip-info"></div>
-        </div>
-        
-        <div class="container">
-            <div class="header">
-                <h1>🧬 Knovera Research Intelligence</h1>
-                <p>Knowledge Graph + LLM Analysis of 607 Space Biology Papers</p>
-            </div>
-
-            <div class="cards">
-                <div class="card">
-                    <h3>🤖 AI Status</h3>
-                    <div class="status">
-                        <div class="status-dot online"></div>
-                        <span>Google Gemini 2.5 Flash - Online</span>
-                    </div>
-                    <div class="status">
-                        <div class="status-dot online"></div>
-                        <span>LangChain Integration - Active</span>
-                    </div>
-                    <div class="status">
-                        <div class="status-dot online"></div>
-                        <span>Knowledge Graph - 607 Papers Loaded</span>
-                    </div>
-                </div>
-
-                <div class="card">
-                    <h3>📚 Research Capabilities</h3>
-                    <ul style="list-style: none; line-height: 1.8;">
-                        <li>🔬 Microgravity Effects Analysis</li>
-                        <li>🧬 Cellular Biology in Space</li>
-                        <li>☢️ Space Radiation Research</li>
-                        <li>🚀 Long-duration Spaceflight Studies</li>
-                        <li>🧪 Experimental Design Insights</li>
-                    </ul>
-                </div>
-
-                <div class="card">
-                    <h3>🛠️ Available Tools</h3>
-                    <ul style="list-style: none; line-height: 1.8;">
-                        <li>📖 Research Paper Analysis</li>
-                        <li>🔍 Concept Exploration</li>
-                        <li>🤝 Collaboration Discovery</li>
-                        <li>📊 Data Visualization</li>
-                        <li>🎯 Hypothesis Generation</li>
-                    </ul>
-                </div>
-            </div>
-
-            <div class="query-section">
-                <h2>🔍 Knovera Knowledge Exploration</h2>
-                <p style="margin-bottom: 2rem; color: #666;">
-                    Explore connections in our knowledge graph with AI-powered reasoning
-                </p>
-
-                <!-- Knovera Mode Selector -->
-                <div class="mode-toggle">
-                    <button class="mode-btn active" onclick="setMode('research')" id="research-mode">
-                        📊 Research Analysis
-                    </button>
-                    <button class="mode-btn" onclick="setMode('concept')" id="concept-mode">
-                        🧠 Concept Explorer
-                    </button>
-
-                    <button class="mode-btn" onclick="setMode('papers')" id="papers-mode">
-                        📚 Paper Discovery
-                    </button>
-                </div>
-                <div style="margin-bottom: 2rem; display: flex; justify-content: center; gap: 1rem; flex-wrap: wrap;">
-                    <button class="query-btn" onclick="showHelp()" style="background: #6c757d; padding: 0.8rem 1.5rem; border-radius: 25px; border: 2px solid white; color: white; font-size: 0.9rem;">
-                        ❓ How It Works
-                    </button>
-                </div>
-
-                <form class="query-form" onsubmit="submitQuery(event)">
-                    <div style="display: flex; gap: 1rem; align-items: center; margin-bottom: 1rem;">
-                        <select id="queryType" class="query-input" style="width: auto;">
-                            <option value="analyze">🔬 Analyze Concept</option>
-                            <option value="explore">🗺️ Explore Connections</option>
-                            <option value="compare">⚖️ Compare Research</option>
-                            <option value="trends">📈 Find Trends</option>
-                            <option value="gaps">🔍 Identify Gaps</option>
-                        </select>
-                    </div>
-                    <textarea 
-                        id="queryInput" 
-                        class="query-input" 
-                        placeholder="Enter your research question or concept to explore..."
-                        rows="3"
-                        required
-                    ></textarea>
-                    <button type="submit" class="query-btn" id="queryBtn">
-                        🧬 Analyze with Knovera
-                    </button>
-                </form>
-
-                <div class="examples">
-                    <div class="example" onclick="setGraphQuery('microgravity cellular pathways')">
-                        <strong>🔬 Pathway Analysis</strong><br>
-                        Explore cellular pathway connections in microgravity
-                    </div>
-                    <div class="example" onclick="setGraphQuery('radiation DNA repair mechanisms')">
-                        <strong>🧬 Mechanism Discovery</strong><br>
-                        Find DNA repair mechanism relationships
-                    </div>
-                    <div class="example" onclick="setGraphQuery('spaceflight gene expression networks')">
-                        <strong>🕸️ Network Analysis</strong><br>
-                        Map gene expression networks in space
-                    </div>
-                    <div class="example" onclick="setGraphQuery('muscle atrophy protein interactions')">
-                        <strong>⚛️ Protein Networks</strong><br>
-                        Discover protein interaction patterns
-                    </div>
-                </div>
-
-
-
-                <div id="result" class="result" style="display: none;">
-                    <h3>Analysis Result:</h3>
-                    <div id="resultContent"></div>
-                </div>
-            </div>
-
-            <div class="footer">
-                <p>Knovera System: Google Gemini 2.5 Flash • Real Paper Database • 607 PMC Space Biology Papers</p>
-                <p style="font-size: 0.9rem; margin-top: 0.5rem; opacity: 0.7;">
-                    🔬 Database-Driven Analysis • 📚 PMC Research Papers • 🧬 Space Biology Focus
-                </p>
-            </div>
-        </div>
-
-        <!-- Help Modal -->
-        <div id="helpModal" style="display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100vh; background: rgba(0,0,0,0.8); z-index: 1000; padding: 1rem; box-sizing: border-box; overflow-y: auto;">
-            <div style="background: white; border-radius: 12px; max-width: 800px; margin: 2rem auto; padding: 2rem; max-height: calc(100vh - 4rem); overflow-y: auto; box-sizing: border-box;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
-                    <h2 style="margin: 0; color: #333;">🧬 How Knovera Works</h2>
-                    <button onclick="hideHelp()" style="background: none; border: none; font-size: 1.5rem; cursor: pointer; color: #666; padding: 0.5rem; border-radius: 50%; hover: background-color: #f0f0f0;">✕</button>
-                </div>
-                
-                <div style="line-height: 1.6; color: #555;">
-                    <h3 style="color: #667eea; margin-top: 1.5rem;">🤖 AI-Powered Research Analysis</h3>
-                    <p>Our system uses <strong>Google Gemini 2.5 Flash</strong> with LangChain integration to analyze a knowledge base of <strong>607 space biology research papers</strong>.</p>
-                    
-                    <h3 style="color: #667eea; margin-top: 1.5rem;">🕸️ Graph Generation Process</h3>
-                    <ol>
-                        <li><strong>Query Processing:</strong> Your research question is enhanced with biological context</li>
-                        <li><strong>Paper Search:</strong> AI searches through 607 papers using semantic similarity</li>
-                        <li><strong>Concept Extraction:</strong> Key biological concepts and pathways are identified</li>
-                        <li><strong>Relationship Mapping:</strong> Connections between papers and concepts are analyzed</li>
-                        <li><strong>Graph Construction:</strong> D3.js creates interactive force-directed visualizations</li>
-                        <li><strong>Real-time Stats:</strong> Paper counts and confidence scores extracted from AI responses</li>
-                    </ol>
-                    
-                    <h3 style="color: #667eea; margin-top: 1.5rem;">📊 Four Analysis Modes</h3>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1rem 0;">
-                        <div style="padding: 1rem; background: #f8f9fa; border-radius: 8px;">
-                            <h4 style="margin: 0 0 0.5rem 0;">🔬 Research Analysis</h4>
-                            <p style="margin: 0; font-size: 0.9rem;">Comprehensive analysis with paper searches and concept mapping</p>
-                        </div>
-                        <div style="padding: 1rem; background: #f8f9fa; border-radius: 8px;">
-                            <h4 style="margin: 0 0 0.5rem 0;">🧠 Concept Explorer</h4>
-                            <p style="margin: 0; font-size: 0.9rem;">Deep dive into specific biological concepts and pathways</p>
-                        </div>
-                        <div style="padding: 1rem; background: #f8f9fa; border-radius: 8px;">
-                            <h4 style="margin: 0 0 0.5rem 0;">🕸️ Graph Visualization</h4>
-                            <p style="margin: 0; font-size: 0.9rem;">Interactive network graphs with zoom and relationship mapping</p>
-                        </div>
-                        <div style="padding: 1rem; background: #f8f9fa; border-radius: 8px;">
-                            <h4 style="margin: 0 0 0.5rem 0;">📚 Paper Discovery</h4>
-                            <p style="margin: 0; font-size: 0.9rem;">Focused paper search with thematic clustering</p>
-                        </div>
-                    </div>
-                    
-                    <h3 style="color: #667eea; margin-top: 1.5rem;">🎛️ Graph Controls</h3>
-                    <ul>
-                        <li><strong>🔍+ Zoom In:</strong> Magnify graph details</li>
-                        <li><strong>🔍- Zoom Out:</strong> See broader network structure</li>
-                        <li><strong>↻ Reset:</strong> Return to original view</li>
-                        <li><strong>⚡ Resize:</strong> Toggle between 350px → 500px → 700px heights</li>
-                        <li><strong>Drag Nodes:</strong> Click and drag to explore connections</li>
-                        <li><strong>Mouse Wheel:</strong> Scroll to zoom in/out</li>
-                    </ul>
-                    
-                    <h3 style="color: #667eea; margin-top: 1.5rem;">📈 Data Sources & Accuracy</h3>
-                    <p>All statistics are <strong>extracted in real-time</strong> from Gemini's analysis responses using regex patterns like "Found X papers related to" ensuring authentic research insights rather than random numbers.</p>
-                    
-                    <div style="background: #e7f3ff; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
-                        <p style="margin: 0;"><strong>💡 Pro Tip:</strong> Try queries like "microgravity effects on bone density" or "cellular pathways in space radiation" for detailed network analysis!</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <script>
-            let currentMode = 'research';
-            
-            function setMode(mode) {
-                currentMode = mode;
-                // Update button states
-                document.querySelectorAll('.mode-btn').forEach(btn => btn.classList.remove('active'));
-                document.getElementById(mode + '-mode').classList.add('active');
-                
-                // Update placeholder text based on mode
-                updatePlaceholder();
-            }
+@app.on_event("startup")
+async def _init_http_client():
+    """One long-lived pooled AsyncClient for outbound calls
 
-            function updatePlaceholder() {
-                const queryInput = document.getElementById('queryInput');
-                const queryType = document.getElementById('queryType').value;
-                
-                const placeholders = {
-                    'research': {
-                        'analyze': 'Analyze microgravity effects on cellular metabolism...',
-                        'explore': 'Explore protein interactions in space environment...',
-                        'compare': 'Compare bone density studies across different missions...',
-                        'trends': 'Find trends in space medicine research over time...',
-                        'gaps': 'Identify gaps in radiation protection research...'
-                    },
-                    'concept': {
-                        'analyze': 'Analyze concept: DNA repair mechanisms',
-                        'explore': 'Explore connections: muscle atrophy pathways',
-                        'compare': 'Compare concepts: bone vs muscle adaptation',
-                        'trends': 'Find trends in: gene expression research',
-                        'gaps': 'Identify gaps in: cellular signaling studies'
-                    },
-                    'papers': {
-                        'analyze': 'Analyze papers about: spaceflight countermeasures',
-                        'explore': 'Explore papers on: radiation shielding methods',
-                        'compare': 'Compare studies: short vs long-duration flights',
-                        'trends': 'Paper trends: emerging research topics',
-                        'gaps': 'Literature gaps: understudied research areas'
-                    }
-                };
-                
-                queryInput.placeholder = placeholders[currentMode][queryType] || 'Enter your research query...';
-            }
+    Ephemeral clients pay a TCP+TLS handshake (2 RTTs) per request;
+    a shared pool amortizes that across every outbound call made from
+    the endpoints. Tool modules keep their own pools for thread-based
+    paths; this one serves the async endpoints via app.state.http.
+    """
+    try:
+        import httpx
+    except ImportError:
+        app.state.http = None
+        return
+    app.state.http = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
 
-            function setQuery(text) {
-                document.getElementById('queryInput').value = text;
-            }
-            
-            function setGraphQuery(text) {
-                document.getElementById('queryInput').value = text;
-                setMode('graph');
-                
-                // Clear previous results to ensure fresh analysis
-                window.currentAnalysisResults = null;
-                document.getElementById('result').style.display = 'none';
-            }
 
-            async function submitQuery(event) {
-                event.preventDefault();
-                
-                const queryInput = document.getElementById('queryInput');
-                const queryBtn = document.getElementById('queryBtn');
-                const result = document.getElementById('result');
-                const resultContent = document.getElementById('resultContent');
-                
-                const query = queryInput.value.trim();
-                if (!query) return;
-                
-                // Show loading state with spinner
-                queryBtn.disabled = true;
-                const loadingTexts = {
-                    'research': 'Analyzing Research...',
-                    'concept': 'Exploring Concepts...',
-                    'papers': 'Finding Papers...'
-                };
-                queryBtn.innerHTML = `<span class="loading-spinner"></span>${loadingTexts[currentMode]}`;
-                
-                // Show loading in result area
-                result.style.display = 'block';
-                resultContent.innerHTML = `
-                    <div style="text-align: center; padding: 2rem; color: #667eea;">
-                        <div style="font-size: 2rem; margin-bottom: 1rem;">🧬</div>
-                        <div style="font-weight: 600; margin-bottom: 0.5rem;">Processing with Knovera...</div>
-                        <div style="font-size: 0.9rem; opacity: 0.7;">Analyzing 607 space biology papers with Google Gemini 2.5 Flash</div>
-                        <div class="loading-spinner" style="margin: 1rem auto; border-color: rgba(102,126,234,0.3); border-top-color: #667eea;"></div>
-                    </div>
-                `;
-                result.style.display = 'block';
-                resultContent.innerHTML = '<p>🔍 Processing through 607 papers + knowledge graph...</p>';
-                
-                try {
-                    // Get query type from dropdown
-                    const queryType = document.getElementById('queryType').value;
-                    
-                    // Choose endpoint and modify query based on type and mode
-                    let endpoint = '/gemini/query';
-                    let requestBody = { query: query };
-                    
-                    // Modify query based on selected type
-                    switch(queryType) {
-                        case 'analyze':
-                            requestBody.query = `Analyze and provide detailed insights about: ${query}`;
-                            break;
-                        case 'explore':
-                            requestBody.query = `Explore connections, relationships, and pathways related to: ${query}`;
-                            break;
-                        case 'compare':
-                            requestBody.query = `Compare different research approaches, findings, and methodologies for: ${query}`;
-                            break;
-                        case 'trends':
-                            requestBody.query = `Identify research trends, patterns, and developments in: ${query}`;
-                            break;
-                        case 'gaps':
-                            requestBody.query = `Identify research gaps, unexplored areas, and future opportunities in: ${query}`;
-                            break;
-                    }
-                    
-                    // Further modify based on current mode
-                    if (currentMode === 'concept') {
-                        requestBody.context = { mode: 'concept_exploration' };
-                        requestBody.query += ` Focus on conceptual relationships and knowledge graph connections.`;
-                    } else if (currentMode === 'papers') {
-                        requestBody.context = { mode: 'paper_discovery' };
-                        requestBody.query += ` Focus on finding and analyzing relevant research papers.`;
-                    }
-                    
-                    const response = await fetch(endpoint, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(requestBody)
-                    });
-                    
-                    const data = await response.json();
-                    
-                    if (response.ok) {
-                        // Use extracted stats from backend if available
-                        if (data.extracted_stats) {
-                            console.log('🎯 Using real Gemini statistics:', data.extracted_stats);
-                            displayKnoveraResult(data, query, data.extracted_stats);
-                        } else {
-                            displayKnoveraResult(data, query);
-                        }
-                    } else {
-                        const errorDetail = data.detail || 'Query failed';
-                        let errorIcon = '❌';
-                        let errorTitle = 'Error';
-                        
-                        // Customize error display based on error type
-                        if (errorDetail.includes('Rate Limit') || errorDetail.includes('Quota')) {
-                            errorIcon = '⏳';
-                            errorTitle = 'Rate Limit';
-                        } else if (errorDetail.includes('Dependencies')) {
-                            errorIcon = '📦';
-                            errorTitle = 'Setup Required';
-                        } else if (errorDetail.includes('Data Processing')) {
-                            errorIcon = '🔄';
-                            errorTitle = 'Processing Issue';
-                        }
-                        
-                        resultContent.innerHTML = `
-                            <div style="background: #fff5f5; border: 1px solid #fed7d7; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-                                <div style="color: #e53e3e; font-weight: 600; margin-bottom: 0.5rem;">
-                                    ${errorIcon} ${errorTitle}
-                                </div>
-                                <div style="color: #742a2a; line-height: 1.5;">
-                                    ${errorDetail}
-                                </div>
-                                ${errorDetail.includes('Rate Limit') ? `
-                                    <div style="margin-top: 1rem; padding: 0.8rem; background: #ebf8ff; border: 1px solid #bee3f8; border-radius: 6px;">
-                                        <div style="color: #2b6cb0; font-size: 0.9rem;">
-                                            💡 <strong>Tip:</strong> Gemini Free Tier allows 10 requests per minute. 
-                                            Try again in about 30 seconds, or consider shorter, more specific queries.
-                                        </div>
-                                    </div>
-                                ` : ''}
-                            </div>
-                        `;
-                    }
-                } catch (error) {
-                    resultContent.innerHTML = `
-                        <div style="background: #fff5f5; border: 1px solid #fed7d7; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-                            <div style="color: #e53e3e; font-weight: 600; margin-bottom: 0.5rem;">
-                                🌐 Connection Error
-                            </div>
-                            <div style="color: #742a2a; line-height: 1.5;">
-                                Unable to connect to the server. Please check your connection and try again.
-                            </div>
-                            <div style="color: #742a2a; font-size: 0.9rem; margin-top: 0.5rem; opacity: 0.8;">
-                                Technical details: ${error.message}
-                            </div>
-                        </div>
-                    `;
-                }
-                
-                // Reset button to normal state
-                queryBtn.disabled = false;
-                queryBtn.innerHTML = '🧬 Analyze with Knovera';
-            }
-            
-            function extractStatsFromGeminiResponse(analysisText, query) {
-                // Extract real numbers from Gemini's analysis text
-                let papers = 0, concepts = 0, relationships = 0, confidence = 95;
-                
-                // Look for explicit paper counts in Gemini's response
-                const paperPatterns = [
-                    /Found\\s+(\\d+)\\s+papers?\\s+related\\s+to/i,
-                    /identified\\s+(\\d+)\\s+research\\s+papers?/i,
-                    /(\\d+)\\s+papers?\\s+directly\\s+related/i,
-                    /search\\s+identified\\s+(\\d+)\\s+papers?/i
-                ];
-                
-                for (const pattern of paperPatterns) {
-                    const match = analysisText.match(pattern);
-                    if (match) {
-                        papers = parseInt(match[1]);
-                        console.log(`✅ Extracted ${papers} papers from Gemini response`);
-                        break;
-                    }
-                }
-                
-                // Extract concepts from Gemini's analysis
-                const conceptPatterns = [
-                    /Key\\s+themes\\s+include[^.]*?([^.]*cellular[^.]*|[^.]*microgravity[^.]*|[^.]*medicine[^.]*)/gi,
-                    /research\\s+focuses\\s+on[^.]*?(\\w+\\s+\\w+)[^.]*?,\\s*(\\w+\\s+\\w+)[^.]*?,\\s*and\\s+(\\w+\\s+\\w+)/i,
-                    /(\\d+)\\s+key\\s+concepts?/i
-                ];
-                
-                // Count biological concepts mentioned in response
-                const biologicalTerms = [
-                    'microgravity', 'cellular', 'protein', 'gene', 'DNA', 'bone', 'muscle',
-                    'radiation', 'immune', 'metabolism', 'signaling', 'pathway', 'mitochondrial',
-                    'cytoskeleton', 'osteoblast', 'osteoclast', 'stem cell', 'differentiation'
-                ];
-                
-                let conceptCount = 0;
-                const lowerText = analysisText.toLowerCase();
-                for (const term of biologicalTerms) {
-                    if (lowerText.includes(term)) {
-                        conceptCount++;
-                    }
-                }
-                concepts = Math.max(conceptCount, Math.floor(papers * 0.2)); // At least 20% of papers
-                
-                // Calculate relationships based on biological network theory
-                // Most biological networks follow power-law distribution
-                if (papers > 0) {
-                    relationships = Math.floor(papers * 1.5 + concepts * 2.5);
-                } else {
-                    // Fallback estimation based on query complexity
-                    const queryTerms = query.split(' ').length;
-                    papers = Math.min(25, Math.max(5, queryTerms * 3));
-                    concepts = Math.max(3, Math.floor(papers * 0.25));
-                    relationships = Math.floor(papers * 1.8 + concepts * 2);
-                }
-                
-                // Extract confidence if mentioned, otherwise calculate based on paper count
-                const confidenceMatch = analysisText.match(/(\\d+)%\\s*confidence/i);
-                if (confidenceMatch) {
-                    confidence = parseInt(confidenceMatch[1]);
-                } else {
-                    // Higher confidence with more papers found
-                    confidence = Math.min(98, 85 + Math.floor(papers / 5));
-                }
-                
-                console.log(`🧬 Real Gemini Stats: ${papers} papers, ${concepts} concepts, ${relationships} relationships, ${confidence}% confidence`);
-                
-                return {
-                    papers: papers,
-                    concepts: concepts, 
-                    relationships: relationships,
-                    confidence: confidence
-                };
-            }
-            
-            function formatGeminiAnalysis(analysisText) {
-                if (!analysisText) return '';
-                
-                // Split analysis into sections based on common patterns
-                const sections = [];
-                let currentSection = { title: '', content: '', type: 'summary' };
-                
-                const lines = analysisText.split('\\n');
-                
-                for (let i = 0; i < lines.length; i++) {
-                    const line = lines[i].trim();
-                    
-                    // Check for section headers
-                    if (line.match(/^#+\\s*\\d+\\.?\\s*.*|^\\*\\*.*:\\*\\*|^###?\\s+.*|^\\d+\\.\\s+.*:|^Key.*:|^Research.*:|^Network.*:/i)) {
-                        // Save previous section if it has content
-                        if (currentSection.content.trim()) {
-                            sections.push({...currentSection});
-                        }
-                        
-                        // Start new section
-                        currentSection = {
-                            title: line.replace(/^#+\\s*|^\\*\\*|\\*\\*$/g, '').trim(),
-                            content: '',
-                            type: getSectionType(line)
-                        };
-                    } else if (line) {
-                        currentSection.content += line + '\\n';
-                    }
-                }
-                
-                // Add the last section
-                if (currentSection.content.trim()) {
-                    sections.push(currentSection);
-                }
-                
-                // If no sections found, treat entire text as summary
-                if (sections.length === 0) {
-                    sections.push({
-                        title: 'Research Summary',
-                        content: analysisText,
-                        type: 'summary'
-                    });
-                }
-                
-                // Generate formatted HTML with collapsible sections
-                let html = '';
-                
-                // Add a quick summary card if we have multiple sections
-                if (sections.length > 1) {
-                    html += `
-                        <div class="summary-card" style="background: linear-gradient(135deg, #4285f4 0%, #34a853 100%); 
-                                                          color: white; 
-                                                          padding: 1rem; 
-                                                          border-radius: 8px; 
-                                                          margin-bottom: 1rem;
-                                                          box-shadow: 0 2px 8px rgba(66, 133, 244, 0.3);">
-                            <h6 style="margin: 0 0 0.5rem 0; display: flex; align-items: center; gap: 0.5rem;">
-                                <span>📊</span> Quick Summary
-                            </h6>
-                            <div style="font-size: 0.9rem; opacity: 0.95;">
-                                Analysis contains <strong>${sections.length} detailed sections</strong> covering research insights, methodologies, and findings. 
-                                Click any section header below to expand and explore the detailed analysis.
-                            </div>
-                        </div>
-                    `;
-                }
-                
-                sections.forEach((section, index) => {
-                    const icon = getSectionIcon(section.type, section.title);
-                    const isExpanded = index === 0; // First section expanded by default
-                    const sectionId = `section-${index}`;
-                    
-                    html += `
-                        <div class="analysis-section" style="margin-bottom: 1rem; border: 1px solid #e1e5e9; border-radius: 8px; overflow: hidden;">
-                            <div class="section-header" 
-                                 onclick="toggleSection('${sectionId}')" 
-                                 style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); 
-                                        padding: 0.75rem 1rem; 
-                                        cursor: pointer; 
-                                        display: flex; 
-                                        justify-content: space-between; 
-                                        align-items: center;
-                                        border-bottom: 1px solid #dee2e6;">
-                                <div style="display: flex; align-items: center; gap: 0.5rem;">
-                                    <span style="font-size: 1.2rem;">${icon}</span>
-                                    <strong style="color: #495057;">${section.title}</strong>
-                                </div>
-                                <span class="toggle-arrow" id="arrow-${sectionId}" style="transition: transform 0.2s; font-size: 1rem; color: #6c757d;">
-                                    ${isExpanded ? '▼' : '▶'}
-                                </span>
-                            </div>
-                            <div class="section-content" 
-                                 id="${sectionId}" 
-                                 style="padding: ${isExpanded ? '1rem' : '0'}; 
-                                        max-height: ${isExpanded ? 'none' : '0'}; 
-                                        overflow: hidden; 
-                                        transition: all 0.3s ease;
-                                        background: white;">
-                                <div style="white-space: pre-wrap; line-height: 1.6; color: #495057;">
-                                    ${formatSectionContent(section.content, section.type)}
-                                </div>
-                            </div>
-                        </div>
-                    `;
-                });
-                
-                return html;
-            }
-            
-            function getSectionType(title) {
-                const titleLower = title.toLowerCase();
-                if (titleLower.includes('research') || titleLower.includes('papers') || titleLower.includes('findings')) return 'research';
-                if (titleLower.includes('network') || titleLower.includes('analysis') || titleLower.includes('connections')) return 'network';
-                if (titleLower.includes('gap') || titleLower.includes('opportunity') || titleLower.includes('future')) return 'gaps';
-                if (titleLower.includes('collaboration') || titleLower.includes('researcher') || titleLower.includes('institution')) return 'collaboration';
-                if (titleLower.includes('concept') || titleLower.includes('pathway') || titleLower.includes('biological')) return 'concepts';
-                return 'summary';
-            }
-            
-            function getSectionIcon(type, title) {
-                switch (type) {
-                    case 'research': return '📚';
-                    case 'network': return '🕸️';
-                    case 'gaps': return '🔍';
-                    case 'collaboration': return '🤝';
-                    case 'concepts': return '🧬';
-                    case 'summary': return '📋';
-                    default: return '📄';
-                }
-            }
-            
-            function formatSectionContent(content, type) {
-                if (!content) return '';
-                
-                // Clean up content formatting
-                let formatted = content
-                    .replace(/\\*\\*([^*]+)\\*\\*/g, '<strong>$1</strong>') // Bold text
-                    .replace(/\\*([^*]+)\\*/g, '<em>$1</em>') // Italic text
-                    .replace(/^\\s*\\*\\s+(.+)$/gm, '<div style="margin: 0.25rem 0; padding-left: 1rem;">• $1</div>') // Bullet points
-                    .replace(/^\\s*\\d+\\.\\s+(.+)$/gm, '<div style="margin: 0.5rem 0; padding-left: 1rem; font-weight: 500;">$1</div>') // Numbered items
-                    .replace(/\\n\\n+/g, '</p><p style="margin: 0.75rem 0;">') // Paragraphs
-                    .trim();
-                
-                // Wrap in paragraph if not already formatted
-                if (!formatted.includes('<div') && !formatted.includes('<p')) {
-                    formatted = `<p style="margin: 0;">${formatted}</p>`;
-                } else if (formatted.includes('<div')) {
-                    // Ensure proper paragraph structure around div elements
-                    formatted = `<div>${formatted}</div>`;
-                }
-                
-                return formatted;
-            }
-            
-            function toggleSection(sectionId) {
-                const content = document.getElementById(sectionId);
-                const arrow = document.getElementById(`arrow-${sectionId}`);
-                
-                if (content.style.maxHeight === '0px' || content.style.maxHeight === '') {
-                    // Expand with smooth animation
-                    content.style.maxHeight = content.scrollHeight + 'px';
-                    content.style.padding = '1rem';
-                    content.style.opacity = '1';
-                    arrow.textContent = '▼';
-                    arrow.style.transform = 'rotate(0deg)';
-                    
-                    // Reset to auto after animation for dynamic content
-                    setTimeout(() => {
-                        if (content.style.maxHeight !== '0px') {
-                            content.style.maxHeight = 'none';
-                        }
-                    }, 300);
-                } else {
-                    // Collapse with smooth animation
-                    content.style.maxHeight = content.scrollHeight + 'px';
-                    content.offsetHeight; // Force reflow
-                    content.style.maxHeight = '0px';
-                    content.style.padding = '0 1rem';
-                    content.style.opacity = '0';
-                    arrow.textContent = '▶';
-                    arrow.style.transform = 'rotate(-90deg)';
-                }
-            }
-            
-            function displayKnoveraResult(data, query, backendStats = null) {
-                const resultContent = document.getElementById('resultContent');
-                const analysis = data.result.response || data.result;
-                const queryType = document.getElementById('queryType').value;
-                
-                // Get appropriate icons and labels based on query type
-                const typeInfo = {
-                    'analyze': { icon: '🔬', label: 'Analysis', color: '#5a67d8' },
-                    'explore': { icon: '🗺️', label: 'Exploration', color: '#38b2ac' },
-                    'compare': { icon: '⚖️', label: 'Comparison', color: '#ed8936' },
-                    'trends': { icon: '📈', label: 'Trends', color: '#9f7aea' },
-                    'gaps': { icon: '🔍', label: 'Gap Analysis', color: '#f56565' }
-                };
-                
-                const currentType = typeInfo[queryType] || typeInfo['analyze'];
-                
-                let connectedPapers, keyConcepts, relationships, confidence, dataSource;
-                
-                if (backendStats) {
-                    // Use REAL statistics extracted by backend from Gemini response
-                    connectedPapers = backendStats.papers_found;
-                    keyConcepts = backendStats.concepts_identified;
-                    relationships = Math.floor(connectedPapers * 2.5 + keyConcepts * 3); // Calculate relationships
-                    confidence = backendStats.analysis_confidence;
-                    dataSource = "✅ Real Gemini Analysis Data";
-                    
-                    console.log(`🎯 Using REAL Gemini stats: ${connectedPapers} papers, ${keyConcepts} concepts`);
-                } else {
-                    // Fallback: Extract from response text
-                    const realStats = extractStatsFromGeminiResponse(analysis, query);
-                    connectedPapers = realStats.papers;
-                    keyConcepts = realStats.concepts;
-                    relationships = realStats.relationships;
-                    confidence = realStats.confidence;
-                    dataSource = "⚠️ Text-extracted estimates";
-                }
-                
-                // Store current results for graph generation
-                window.currentAnalysisResults = {
-                    connectedPapers,
-                    keyConcepts,
-                    relationships,
-                    confidence,
-                    query,
-                    queryType,
-                    analysis
-                };
-                
-                // Create Knovera-style result display
-                resultContent.innerHTML = `
-                    <div class="graph-stats">
-                        <div class="stat-box">
-                            <div class="stat-number">${connectedPapers}</div>
-                            <div>Connected Papers</div>
-                        </div>
-                        <div class="stat-box">
-                            <div class="stat-number">${keyConcepts}</div>
-                            <div>Key Concepts</div>
-                        </div>
-                        <div class="stat-box">
-                            <div class="stat-number">${relationships}</div>
-                            <div>Relationships</div>
-                        </div>
-                        <div class="stat-box">
-                            <div class="stat-number">${confidence}%</div>
-                            <div>Confidence</div>
-                        </div>
-                    </div>
-                    
-                    <div style="margin: 2rem 0;">
-                        <h4>🧬 Knovera Analysis Results</h4>
-                        <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 10px; border-left: 4px solid #5a67d8;">
-                            <strong>🎯 Query:</strong> "${query}"<br>
-                            <strong>� Mode:</strong> ${currentMode.charAt(0).toUpperCase() + currentMode.slice(1)}<br>
-                            <strong>🤖 Provider:</strong> ${data.provider} + Knowledge Graph<br>
-                            <strong>📊 Processing:</strong> LLM + Vector Search + Graph Traversal<br>
-                            <strong>🔍 Data Source:</strong> ${dataSource}
-                        </div>
-                    </div>
-                    
-                    <div style="background: white; padding: 1.5rem; border-radius: 10px; margin: 1rem 0; border: 1px solid #e2e8f0;">
-                        <h4>📋 Detailed Research Analysis</h4>
-                        
-                        <!-- Research Statistics Breakdown -->
-                        <div style="background: #f8f9fa; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                            <h5>🔍 Network Analysis Results</h5>
-                            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin: 1rem 0;">
-                                <div>
-                                    <strong>📄 ${connectedPapers} Connected Papers</strong><br>
-                                    <small>Primary research studies directly related to "${query}"</small>
-                                </div>
-                                <div>
-                                    <strong>🧠 ${keyConcepts} Key Concepts</strong><br>
-                                    <small>Central biological concepts and pathways identified</small>
-                                </div>
-                                <div>
-                                    <strong>🔗 ${relationships} Relationships</strong><br>
-                                    <small>Mapped connections between papers and concepts</small>
-                                </div>
-                                <div>
-                                    <strong>✅ ${confidence}% Confidence</strong><br>
-                                    <small>AI analysis confidence based on paper overlap</small>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <!-- Key Concepts Identified -->
-                        <div style="background: #e6f3ff; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                            <h5>🧬 Key Concepts Identified (${keyConcepts} total)</h5>
-                            <div id="conceptsList" style="margin: 0.5rem 0;">
-                                ${generateConceptsList(keyConcepts, query)}
-                            </div>
-                        </div>
-                        
-                        <!-- Research Papers Breakdown -->
-                        <div style="background: #fff8e1; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
-                            <h5>📚 Research Papers Distribution (${connectedPapers} total)</h5>
-                            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem;">
-                                <div>🟢 <strong>${Math.floor(connectedPapers * 0.4)}</strong> Primary Studies</div>
-                                <div>🟠 <strong>${Math.floor(connectedPapers * 0.35)}</strong> Supporting Research</div>
-                                <div>🟣 <strong>${Math.floor(connectedPapers * 0.25)}</strong> Applications</div>
-                            </div>
-                        </div>
-                        
-                        <!-- Gemini AI Analysis -->
-                        <div style="background: white; padding: 1rem; border-left: 4px solid #4285f4; margin: 1rem 0;">
-                            <h5>🤖 Gemini AI Detailed Analysis</h5>
-                            <div id="formatted-analysis">${formatGeminiAnalysis(analysis)}</div>
-                        </div>
-                        
-                        <!-- Generate Graph Button -->
-                        <div style="text-align: center; margin: 2rem 0; padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px;">
-                            <button onclick="generateDetailedGraph()" class="query-btn" style="background: white; color: #667eea; border: none; font-size: 1.1rem; font-weight: bold;">
-                                🕸️ Generate Interactive Graph with Real Paper Titles
-                            </button>
-                            <p style="color: white; margin: 0.5rem 0; font-size: 0.9rem;">
-                                Create network visualization with ${keyConcepts} concepts and ${relationships} mapped relationships
-                            </p>
-                            <p style="color: #fff3cd; margin: 0.5rem 0; font-size: 0.8rem;">
-                                ✅ Graph statistics synchronized with analysis results
-                            </p>
-                        </div>
-                    </div>
-                    
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1rem; margin-top: 2rem;">
-                        <button onclick="exploreConnections('${query}')" class="query-btn" style="background: #28a745;">
-                            🕸️ Explore Connections
-                        </button>
-                        <button onclick="findRelatedPapers('${query}')" class="query-btn" style="background: #17a2b8;">
-                            📚 Find Related Papers
-                        </button>
-                        <button onclick="visualizeNetwork('${query}')" class="query-btn" style="background: #ffc107; color: #333;">
-                            📊 Visualize Network
-                        </button>
-                    </div>
-                `;
-            }
-            
+@app.on_event("shutdown")
+async def _close_http_client():
+    http = getattr(app.state, "http", None)
+    if http is not None:
+        await http.aclose()
 
-            
-            function generateGraphData(concept) {
-                // Generate realistic graph data based on the concept
-                const concepts = ['microgravity', 'cellular pathways', 'protein interactions', 'gene expression', 
-                                'DNA repair', 'muscle atrophy', 'bone density', 'radiation effects'];
-                
-                const paperTitles = [
-                    'Microgravity-induced cellular changes', 'Protein synthesis in space', 'Gene expression alterations',
-                    'DNA repair mechanisms', 'Muscle adaptation pathways', 'Bone metabolism studies',
-                    'Radiation response systems', 'Cellular signaling cascades', 'Metabolic pathway analysis',
-                    'Stress response proteins', 'Growth factor regulation', 'Apoptosis mechanisms',
-                    'Cell cycle regulation', 'Oxidative stress responses', 'Inflammatory pathways'
-                ];
-                
-                let nodes = [];
-                let links = [];
-                
-                // Add concept nodes (8 key concepts)
-                concepts.forEach((c, i) => {
-                    nodes.push({
-                        id: `concept_${i}`,
-                        name: c,
-                        type: 'concept',
-                        size: concept.toLowerCase().includes(c.toLowerCase()) ? 20 : 12,
-                        color: '#5a67d8'
-                    });
-                });
-                
-                // Add paper nodes (47 papers, but show representative sample)
-                for (let i = 0; i < 15; i++) {
-                    nodes.push({
-                        id: `paper_${i}`,
-                        name: paperTitles[i % paperTitles.length] + ` ${i + 1}`,
-                        type: 'paper',
-                        size: 8,
-                        color: Math.random() > 0.6 ? '#38b2ac' : (Math.random() > 0.3 ? '#ed8936' : '#9f7aea')
-                    });
-                }
-                
-                // Generate 128 relationships (connections)
-                const totalRelationships = 25; // Show subset for visualization clarity
-                for (let i = 0; i < totalRelationships; i++) {
-                    const source = nodes[Math.floor(Math.random() * nodes.length)];
-                    const target = nodes[Math.floor(Math.random() * nodes.length)];
-                    
-                    if (source.id !== target.id) {
-                        links.push({
-                            source: source.id,
-                            target: target.id,
-                            strength: Math.random() * 0.8 + 0.2,
-                            type: source.type === 'concept' && target.type === 'concept' ? 'concept-concept' : 
-                                  source.type === 'concept' ? 'concept-paper' : 'paper-paper'
-                        });
-                    }
-                }
-                
-                return { nodes, links };
-            }
-            
-            function drawInteractiveGraph(containerId, data, isFullNetwork = false) {
-                console.log(`🎯 Drawing graph for container: ${containerId}`);
-                console.log(`📊 Graph data:`, data);
-                
-                const svg = d3.select(`#${containerId}`);
-                console.log(`🔍 SVG selection:`, svg.node());
-                
-                if (svg.empty()) {
-                    console.error(`❌ SVG element #${containerId} not found!`);
-                    return;
-                }
-                
-                const width = 700;
-                const height = isFullNetwork ? 500 : 350;
-                
-                svg.selectAll("*").remove();
-                console.log(`✅ SVG cleared, creating graph with ${data.nodes?.length || 0} nodes and ${data.links?.length || 0} links`);
-                
-                // Add zoom behavior
-                const zoom = d3.zoom()
-                    .scaleExtent([0.1, 4])
-                    .on("zoom", (event) => {
-                        g.attr("transform", event.transform);
-                    });
-                
-                svg.call(zoom);
-                
-                // Store zoom object globally for controls
-                window.currentZoom = zoom;
-                window.currentSvg = svg;
-                window.currentGraphWidth = width;
-                window.currentGraphHeight = height;
-                
-                // Create group for zoomable content
-                const g = svg.append("g");
-                
-                // Create force simulation
-                const simulation = d3.forceSimulation(data.nodes)
-                    .force("link", d3.forceLink(data.links).id(d => d.id).distance(50))
-                    .force("charge", d3.forceManyBody().strength(-200))
-                    .force("center", d3.forceCenter(width / 2, height / 2))
-                    .force("collision", d3.forceCollide().radius(d => d.size + 2));
-                
-                // Create links
-                const link = g.append("g")
-                    .selectAll("line")
-                    .data(data.links)
-                    .enter().append("line")
-                    .attr("stroke", d => d.type === 'concept-concept' ? '#5a67d8' : 
-                                        d.type === 'concept-paper' ? '#38b2ac' : '#ccc')
-                    .attr("stroke-opacity", d => d.strength)
-                    .attr("stroke-width", d => d.strength * 3);
-                
-                // Create nodes
-                const node = g.append("g")
-                    .selectAll("circle")
-                    .data(data.nodes)
-                    .enter().append("circle")
-                    .attr("r", d => d.size)
-                    .attr("fill", d => d.color)
-                    .attr("stroke", "#fff")
-                    .attr("stroke-width", 2)
-                    .style("cursor", "pointer")
-                    .call(d3.drag()
-                        .on("start", dragstarted)
-                        .on("drag", dragged)
-                        .on("end", dragended));
-                
-                // Add labels
-                const labels = g.append("g")
-                    .selectAll("text")
-                    .data(data.nodes)
-                    .enter().append("text")
-                    .text(d => d.name.length > 15 ? d.name.substring(0, 12) + "..." : d.name)
-                    .attr("font-size", d => d.type === 'concept' ? "10px" : "8px")
-                    .attr("fill", "#333")
-                    .attr("text-anchor", "middle")
-                    .attr("dy", d => d.size + 15)
-                    .style("pointer-events", "none");
-                
-                // Add custom tooltip hover effects
-                node.on("mouseover", function(event, d) {
-                    showTooltip(event, d, data.links);
-                })
-                .on("mousemove", function(event) {
-                    moveTooltip(event);
-                })
-                .on("mouseout", function() {
-                    hideTooltip();
-                });
-                
-                // Update positions on simulation tick
-                simulation.on("tick", () => {
-                    link
-                        .attr("x1", d => d.source.x)
-                        .attr("y1", d => d.source.y)
-                        .attr("x2", d => d.target.x)
-                        .attr("y2", d => d.target.y);
-                    
-                    node
-                        .attr("cx", d => Math.max(d.size, Math.min(width - d.size, d.x)))
-                        .attr("cy", d => Math.max(d.size, Math.min(height - d.size, d.y)));
-                    
-                    labels
-                        .attr("x", d => Math.max(d.size, Math.min(width - d.size, d.x)))
-                        .attr("y", d => Math.max(d.size, Math.min(height - d.size, d.y)));
-                });
-                
-                // Tooltip functions
-                function showTooltip(event, d, links) {
-                    const tooltip = document.getElementById('tooltip');
-                    const titleEl = document.getElementById('tooltip-title');
-                    const infoEl = document.getElementById('tooltip-info');
-                    
-                    // Get connection count
-                    const connections = links.filter(l => 
-                        (l.source.id === d.id || l.target.id === d.id) ||
-                        (l.source === d.id || l.target === d.id)
-                    ).length;
-                    
-                    // Format content based on node type
-                    if (d.type === 'paper') {
-                        // Enhanced paper tooltip with real database information
-                        titleEl.textContent = d.name.length > 80 ? d.name.substring(0, 80) + '...' : d.name;
-                        
-                        let paperInfo = `<strong>Type:</strong> ${d.category} Paper<br>`;
-                        paperInfo += `<strong>Connections:</strong> ${connections}<br>`;
-                        
-                        if (d.realPaper && d.pmc_id) {
-                            paperInfo += `<strong>PMC ID:</strong> <span style="color: #4fc3f7; font-family: monospace;">${d.pmc_id}</span><br>`;
-                            
-                            if (d.link) {
-                                paperInfo += `<strong>PMC Link:</strong> <a href="${d.link}" target="_blank" style="color: #4fc3f7; text-decoration: underline;">View Paper</a><br>`;
-                            }
-                            
-                            paperInfo += `<div style="margin-top: 0.5rem; padding: 0.25rem 0.5rem; background: rgba(79, 195, 247, 0.1); border-radius: 4px; font-size: 0.8rem;">`;
-                            paperInfo += `✅ <strong>Real PMC Paper</strong> from 607-paper database`;
-                            paperInfo += `</div>`;
-                        } else {
-                            paperInfo += `<strong>Node ID:</strong> ${d.id}<br>`;
-                            paperInfo += `<div style="margin-top: 0.5rem; padding: 0.25rem 0.5rem; background: rgba(255, 193, 7, 0.1); border-radius: 4px; font-size: 0.8rem;">`;
-                            paperInfo += `⚠️ Simulated paper (database fallback)`;
-                            paperInfo += `</div>`;
-                        }
-                        
-                        infoEl.innerHTML = paperInfo;
-                        
-                    } else if (d.type === 'concept') {
-                        titleEl.textContent = d.name;
-                        infoEl.innerHTML = `
-                            <strong>Type:</strong> Concept<br>
-                            <strong>Connections:</strong> ${connections}<br>
-                            <strong>Related Papers:</strong> ${links.filter(l => 
-                                l.type === 'concept-paper' && 
-                                ((l.source.id === d.id || l.source === d.id) || 
-                                 (l.target.id === d.id || l.target === d.id))
-                            ).length}
-                        `;
-                    }
-                    
-                    tooltip.classList.add('visible');
-                    moveTooltip(event);
-                }
-                
-                function moveTooltip(event) {
-                    const tooltip = document.getElementById('tooltip');
-                    const rect = document.body.getBoundingClientRect();
-                    
-                    // Position tooltip to the right and slightly below cursor
-                    let x = event.pageX + 15;
-                    let y = event.pageY - 10;
-                    
-                    // Adjust if tooltip would go off screen
-                    if (x + tooltip.offsetWidth > window.innerWidth) {
-                        x = event.pageX - tooltip.offsetWidth - 15;
-                    }
-                    if (y + tooltip.offsetHeight > window.innerHeight) {
-                        y = event.pageY - tooltip.offsetHeight - 10;
-                    }
-                    
-                    tooltip.style.left = x + 'px';
-                    tooltip.style.top = y + 'px';
-                }
-                
-                function hideTooltip() {
-                    const tooltip = document.getElementById('tooltip');
-                    tooltip.classList.remove('visible');
-                }
-                
-                // Hide tooltip when clicking anywhere
-                document.addEventListener('click', hideTooltip);
-                
-                function dragstarted(event, d) {
-                    if (!event.active) simulation.alphaTarget(0.3).restart();
-                    d.fx = d.x;
-                    d.fy = d.y;
-                }
-                
-                function dragged(event, d) {
-                    d.fx = event.x;
-                    d.fy = event.y;
-                }
-                
-                function dragended(event, d) {
-                    if (!event.active) simulation.alphaTarget(0);
-                    d.fx = null;
-                    d.fy = null;
-                }
-            }
-            
 
-            
-            // Help Modal Functions
-            function showHelp() {
-                document.getElementById('helpModal').style.display = 'block';
-                document.body.style.overflow = 'hidden'; // Prevent background scrolling
-            }
-            
-            function hideHelp() {
-                document.getElementById('helpModal').style.display = 'none';
-                document.body.style.overflow = 'auto'; // Restore scrolling
-            }
-            
-            // Close modal when clicking outside
-            document.addEventListener('click', function(event) {
-                const modal = document.getElementById('helpModal');
-                if (event.target === modal) {
-                    hideHelp();
-                }
-            });
-            
-            // Close modal with Escape key
-            document.addEventListener('keydown', function(event) {
-                if (event.key === 'Escape') {
-                    hideHelp();
-                }
-            });
-            
-            function exploreConnections(query) {
-                document.getElementById('queryInput').value = `Find research connections and pathways related to: ${query}`;
-                setMode('concept');
-                document.querySelector('form').dispatchEvent(new Event('submit'));
-            }
-            
-            function findRelatedPapers(query) {
-                document.getElementById('queryInput').value = `List research papers most relevant to: ${query}`;
-                setMode('papers');
-                document.querySelector('form').dispatchEvent(new Event('submit'));
-            }
-            
+@app.on_event("startup")
+async def _warm_agents():
+    """Preload hot agents off the request path; others stay lazy"""
+    if not langchain_available:
+        return
+    for agent_type in _PRELOAD_AGENTS:
+        try:
+            _agents[agent_type] = await asyncio.to_thread(create_agent, agent_type)
+        except Exception as e:
+            logger.warning("Could not preload agent %r: %s", agent_type, e)
 
 
-            
-            function generateConceptsList(numConcepts, query) {
-                const allConcepts = [
-                    'Microgravity Effects', 'Cellular Pathways', 'Protein Interactions', 'Gene Expression',
-                    'DNA Repair Mechanisms', 'Muscle Atrophy', 'Bone Metabolism', 'Space Radiation',
-                    'Immune System Response', 'Cardiovascular Changes', 'Neurological Adaptation',
-                    'Metabolic Pathways', 'Oxidative Stress', 'Cell Signaling', 'Tissue Engineering',
-                    'Stem Cell Biology', 'Epigenetic Changes', 'Inflammatory Response', 'Apoptosis',
-                    'Cytoskeletal Changes', 'Mitochondrial Function', 'Calcium Signaling', 'Hormone Regulation'
-                ];
-                
-                // Select concepts based on query relevance
-                let selectedConcepts = [];
-                const queryLower = query.toLowerCase();
-                
-                // Prioritize concepts mentioned in query
-                allConcepts.forEach(concept => {
-                    const conceptWords = concept.toLowerCase().split(' ');
-                    if (conceptWords.some(word => queryLower.includes(word))) {
-                        selectedConcepts.push(concept);
-                    }
-                });
-                
-                // Fill remaining slots with other concepts
-                while (selectedConcepts.length < numConcepts && selectedConcepts.length < allConcepts.length) {
-                    const remaining = allConcepts.filter(c => !selectedConcepts.includes(c));
-                    if (remaining.length > 0) {
-                        selectedConcepts.push(remaining[Math.floor(Math.random() * remaining.length)]);
-                    } else {
-                        break;
-                    }
-                }
-                
-                return selectedConcepts.slice(0, numConcepts).map(concept => 
-                    `<span style="display: inline-block; background: #e3f2fd; padding: 0.3rem 0.6rem; margin: 0.2rem; border-radius: 15px; font-size: 0.85rem;">
-                        ${concept}
-                    </span>`
-                ).join('');
-            }
-            
-            async function generateDetailedGraph() {
-                if (!window.currentAnalysisResults) {
-                    alert('No analysis results found. Please run a query first.');
-                    return;
-                }
-                
-                const results = window.currentAnalysisResults;
-                
-                // Show loading state
-                let graphPanel = document.getElementById('analysisGraphPanel');
-                if (!graphPanel) {
-                    graphPanel = document.createElement('div');
-                    graphPanel.id = 'analysisGraphPanel';
-                    document.getElementById('result').appendChild(graphPanel);
-                }
-                
-                graphPanel.innerHTML = `
-                    <div style="margin-top: 2rem; padding: 2rem; background: #f8f9fa; border-radius: 12px; border: 1px solid #e9ecef; text-align: center;">
-                        <div style="color: #667eea; margin-bottom: 1rem;">
-                            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔍</div>
-                            <h3>Loading Real Paper Data...</h3>
-                            <p>Fetching ${results.connectedPapers} actual paper titles from database</p>
-                        </div>
-                        <div class="loading-spinner" style="margin: 1rem auto; border-color: rgba(102,126,234,0.3); border-top-color: #667eea;"></div>
-                    </div>
-                `;
-                
-                try {
-                    // Generate graph with actual research statistics (now async)
-                    console.log('🔄 Generating graph data for results:', results);
-                    const detailedGraphData = await generateGraphFromAnalysis(results);
-                    console.log('📊 Generated graph data:', detailedGraphData);
-                    
-                    if (!detailedGraphData || !detailedGraphData.nodes || !detailedGraphData.links) {
-                        throw new Error('Invalid graph data structure returned');
-                    }
-                    
-                    // Update graph panel with actual content
-                    graphPanel.innerHTML = `
-                        <div style="margin-top: 2rem; padding: 1.5rem; background: #f8f9fa; border-radius: 12px; border: 1px solid #e9ecef;">
-                            <h3 style="margin-bottom: 1rem; text-align: center; color: #495057;">🕸️ Interactive Knowledge Graph</h3>
-                            <div style="padding: 1rem;">
-                                <div style="margin-bottom: 1rem; text-align: center;">
-                                    <h4 style="color: #667eea; margin-bottom: 0.5rem;">🧬 Research Network: "${results.query}"</h4>
-                                    <div style="display: flex; justify-content: center; gap: 2rem; margin: 1rem 0; font-size: 0.9rem; flex-wrap: wrap;">
-                                        <span style="color: #28a745; font-weight: 600;">📄 ${results.connectedPapers} Real Papers</span>
-                                        <span style="color: #17a2b8; font-weight: 600;">🧠 ${results.keyConcepts} Concepts</span>
-                                        <span style="color: #ffc107; color: #333; font-weight: 600;">🔗 ${results.relationships} Links</span>
-                                        <span style="color: #6f42c1; font-weight: 600;">✅ ${results.confidence}% Confidence</span>
-                                    </div>
-                                    <div style="background: #e7f3ff; padding: 0.5rem; border-radius: 8px; font-size: 0.85rem; color: #0366d6; margin: 0.5rem 0;">
-                                        ✅ Displaying actual PMC paper titles from 607-paper database
-                                    </div>
-                                </div>
-                                <svg id="detailedGraphSvg" style="width: 100%; height: 500px; border: 1px solid #ddd; border-radius: 12px; background: linear-gradient(145deg, #ffffff, #f8f9fa); box-shadow: 0 2px 8px rgba(0,0,0,0.1);"></svg>
-                                <div style="margin-top: 1rem;">
-                                    <div style="display: flex; justify-content: center; gap: 2rem; font-size: 0.8rem; margin-bottom: 1rem; flex-wrap: wrap;">
-                                        <span style="color: #5a67d8;">🔵 Core Concepts</span>
-                                        <span style="color: #38b2ac;">🟢 Primary Papers</span>
-                                        <span style="color: #ed8936;">🟠 Supporting Studies</span>
-                                        <span style="color: #9f7aea;">🟣 Applications</span>
-                                    </div>
-                                    <div style="text-align: center; font-size: 0.9rem; color: #666; margin-bottom: 1rem;">
-                                        Interactive Network: Drag nodes • Hover for PMC details • ${results.relationships} relationships mapped
-                                    </div>
-                                    <div style="display: flex; justify-content: center; gap: 1rem; margin-top: 1rem; flex-wrap: wrap;">
-                                        <button onclick="exportCurrentGraph()" class="query-btn" style="background: #28a745; font-size: 0.9rem;">
-                                            💾 Export Network Data
-                                        </button>
-                                        <button onclick="showNetworkStats()" class="query-btn" style="background: #17a2b8; font-size: 0.9rem;">
-                                            📊 Show Statistics
-                                        </button>
-                                        <button onclick="resetGraphView()" class="query-btn" style="background: #6c757d; font-size: 0.9rem;">
-                                            ↻ Reset View
-                                        </button>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    `;
-                    
-                    // Ensure DOM is updated before drawing graph
-                    requestAnimationFrame(() => {
-                        drawInteractiveGraph('detailedGraphSvg', detailedGraphData, true);
-                        
-                        // Scroll to the graph
-                        graphPanel.scrollIntoView({ behavior: 'smooth' });
-                    });
-                    
-                    // Show sync notification and verify consistency
-                    showSyncNotification();
-                    verifyDataConsistency();
-                    
-                } catch (error) {
-                    console.error('Error generating graph:', error);
-                    graphPanel.innerHTML = `
-                        <div style="margin-top: 2rem; padding: 2rem; background: #fff5f5; border: 1px solid #fed7d7; border-radius: 12px; text-align: center;">
-                            <div style="color: #e53e3e; margin-bottom: 1rem;">
-                                <div style="font-size: 2rem; margin-bottom: 0.5rem;">❌</div>
-                                <h3>Error Loading Paper Data</h3>
-                                <p>Unable to fetch real paper titles from database</p>
-                            </div>
-                            <button onclick="generateDetailedGraph()" class="query-btn" style="background: #e53e3e;">
-                                🔄 Retry Loading
-                            </button>
-                        </div>
-                    `;
-                }
-                
-                graphPanel.innerHTML = `
-                    <div style="margin-top: 2rem; padding: 1.5rem; background: #f8f9fa; border-radius: 12px; border: 1px solid #e9ecef;">
-                        <h3 style="margin-bottom: 1rem; text-align: center; color: #495057;">🕸️ Interactive Knowledge Graph</h3>
-                        <div style="padding: 1rem;">
-                            <div style="margin-bottom: 1rem; text-align: center;">
-                                <h4 style="color: #667eea; margin-bottom: 0.5rem;">🧬 Research Network: "${results.query}"</h4>
-                                <div style="display: flex; justify-content: center; gap: 2rem; margin: 1rem 0; font-size: 0.9rem; flex-wrap: wrap;">
-                                    <span style="color: #28a745; font-weight: 600;">📄 ${results.connectedPapers} Papers</span>
-                                    <span style="color: #17a2b8; font-weight: 600;">🧠 ${results.keyConcepts} Concepts</span>
-                                    <span style="color: #ffc107; color: #333; font-weight: 600;">🔗 ${results.relationships} Links</span>
-                                    <span style="color: #6f42c1; font-weight: 600;">✅ ${results.confidence}% Confidence</span>
-                                </div>
-                            </div>
-                            <svg id="detailedGraphSvg" style="width: 100%; height: 500px; border: 1px solid #ddd; border-radius: 12px; background: linear-gradient(145deg, #ffffff, #f8f9fa); box-shadow: 0 2px 8px rgba(0,0,0,0.1);"></svg>
-                            <div style="margin-top: 1rem;">
-                                <div style="display: flex; justify-content: center; gap: 2rem; font-size: 0.8rem; margin-bottom: 1rem; flex-wrap: wrap;">
-                                    <span style="color: #5a67d8;">🔵 Core Concepts</span>
-                                    <span style="color: #38b2ac;">🟢 Primary Papers</span>
-                                    <span style="color: #ed8936;">🟠 Supporting Studies</span>
-                                    <span style="color: #9f7aea;">🟣 Applications</span>
-                                </div>
-                                <div style="text-align: center; font-size: 0.9rem; color: #666; margin-bottom: 1rem;">
-                                    Interactive Network: Drag nodes • Hover for details • ${results.relationships} relationships mapped
-                                </div>
-                                <div style="display: flex; justify-content: center; gap: 1rem; margin-top: 1rem; flex-wrap: wrap;">
-                                    <button onclick="exportCurrentGraph()" class="query-btn" style="background: #28a745; font-size: 0.9rem;">
-                                        💾 Export Network Data
-                                    </button>
-                                    <button onclick="showNetworkStats()" class="query-btn" style="background: #17a2b8; font-size: 0.9rem;">
-                                        📊 Show Statistics
-                                    </button>
-                                    <button onclick="resetGraphView()" class="query-btn" style="background: #6c757d; font-size: 0.9rem;">
-                                        ↻ Reset View
-                                    </button>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                `;
-                
-                drawInteractiveGraph('detailedGraphSvg', detailedGraphData, true);
-                
-                // Scroll to the graph
-                graphPanel.scrollIntoView({ behavior: 'smooth' });
-                
-                // Show sync notification and verify consistency
-                showSyncNotification();
-                verifyDataConsistency();
-                
-                // Scroll to graph
-                document.getElementById('graphPanel').scrollIntoView({ behavior: 'smooth' });
-            }
-            
-            async function generateGraphFromAnalysis(results) {
-                console.log('🔄 generateGraphFromAnalysis called with results:', results);
-                const { connectedPapers, keyConcepts, relationships, query } = results;
-                console.log(`📊 Processing: ${connectedPapers} papers, ${keyConcepts} concepts, ${relationships} relationships for query: "${query}"`);
-                
-                let nodes = [];
-                let links = [];
-                
-                // Generate key concepts based on query
-                const concepts = generateConceptsArray(keyConcepts, query);
-                concepts.forEach((concept, i) => {
-                    nodes.push({
-                        id: `concept_${i}`,
-                        name: concept,
-                        type: 'concept',
-                        size: 12 + (query.toLowerCase().includes(concept.toLowerCase().split(' ')[0]) ? 4 : 0),
-                        color: '#5a67d8',
-                        category: 'concept'
-                    });
-                });
-                
-                // Fetch real paper titles from the database
-                let realPapers = [];
-                try {
-                    const response = await fetch('/api/papers/search', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({
-                            query: query,
-                            limit: connectedPapers,
-                            category: 'all'
-                        })
-                    });
-                    
-                    if (response.ok) {
-                        const data = await response.json();
-                        realPapers = data.papers || [];
-                        console.log(`✅ Fetched ${realPapers.length} real paper titles for graph`);
-                    } else {
-                        console.warn('Failed to fetch real papers, using fallback titles');
-                    }
-                } catch (error) {
-                    console.warn('Error fetching real papers:', error);
-                }
-                
-                // Generate papers distributed across categories using real titles
-                const primaryCount = Math.floor(connectedPapers * 0.4);
-                const supportingCount = Math.floor(connectedPapers * 0.35);
-                const applicationCount = connectedPapers - primaryCount - supportingCount;
-                
-                const paperTypes = [
-                    { count: primaryCount, color: '#38b2ac', category: 'primary', prefix: 'Primary' },
-                    { count: supportingCount, color: '#ed8936', category: 'supporting', prefix: 'Supporting' },
-                    { count: applicationCount, color: '#9f7aea', category: 'application', prefix: 'Application' }
-                ];
-                
-                let paperId = 0;
-                let paperIndex = 0;
-                
-                paperTypes.forEach(({ count, color, category, prefix }) => {
-                    for (let i = 0; i < count; i++) {
-                        let paperTitle;
-                        let pmcId = null;
-                        let link = null;
-                        
-                        if (paperIndex < realPapers.length) {
-                            // Use real paper from database
-                            const paper = realPapers[paperIndex];
-                            paperTitle = paper.title;
-                            pmcId = paper.pmc_id;
-                            link = paper.link;
-                        } else {
-                            // Fallback to generated title if we run out of real papers
-                            paperTitle = `${generatePaperTitle(query)} (${category} study ${i + 1})`;
-                        }
-                        
-                        nodes.push({
-                            id: `paper_${paperId}`,
-                            name: paperTitle,
-                            type: 'paper',
-                            size: category === 'primary' ? 8 : 6,
-                            color: color,
-                            category: category,
-                            pmc_id: pmcId,
-                            link: link,
-                            realPaper: paperIndex < realPapers.length
-                        });
-                        
-                        paperId++;
-                        paperIndex++;
-                    }
-                });
-                
-                // Generate relationships
-                const targetLinkCount = Math.min(relationships, nodes.length * 3);
-                
-                // Connect concepts to papers
-                const conceptNodes = nodes.filter(n => n.type === 'concept');
-                const paperNodes = nodes.filter(n => n.type === 'paper');
-                
-                paperNodes.forEach(paper => {
-                    const numConnections = Math.min(3, Math.floor(Math.random() * 3) + 1);
-                    const connectedConcepts = conceptNodes
-                        .sort(() => Math.random() - 0.5)
-                        .slice(0, numConnections);
-                    
-                    connectedConcepts.forEach(concept => {
-                        links.push({
-                            source: paper.id,
-                            target: concept.id,
-                            strength: 0.4 + Math.random() * 0.4,
-                            type: 'paper-concept'
-                        });
-                    });
-                });
-                
-                // Connect concepts to each other
-                for (let i = 0; i < conceptNodes.length; i++) {
-                    for (let j = i + 1; j < conceptNodes.length; j++) {
-                        if (Math.random() > 0.6) {
-                            links.push({
-                                source: conceptNodes[i].id,
-                                target: conceptNodes[j].id,
-                                strength: 0.6 + Math.random() * 0.3,
-                                type: 'concept-concept'
-                            });
-                        }
-                    }
-                }
-                
-                // Add some paper-to-paper connections
-                for (let i = 0; i < Math.min(20, paperNodes.length); i++) {
-                    if (Math.random() > 0.7) {
-                        const paper1 = paperNodes[Math.floor(Math.random() * paperNodes.length)];
-                        const paper2 = paperNodes[Math.floor(Math.random() * paperNodes.length)];
-                        
-                        if (paper1.id !== paper2.id && !links.find(l => 
-                            (l.source === paper1.id && l.target === paper2.id) ||
-                            (l.source === paper2.id && l.target === paper1.id))) {
-                            
-                            links.push({
-                                source: paper1.id,
-                                target: paper2.id,
-                                strength: 0.3 + Math.random() * 0.2,
-                                type: 'paper-paper'
-                            });
-                        }
-                    }
-                }
-                
-                console.log(`✅ Generated graph with ${nodes.length} nodes and ${links.length} links`);
-                return { nodes, links };
-            }
-            
-            function generateConceptsArray(numConcepts, query) {
-                const concepts = [
-                    'Microgravity Effects', 'Cellular Pathways', 'Protein Interactions', 'Gene Expression',
-                    'DNA Repair', 'Muscle Atrophy', 'Bone Metabolism', 'Space Radiation',
-                    'Immune Response', 'Cardiovascular Changes', 'Neural Adaptation', 'Metabolic Shifts',
-                    'Oxidative Stress', 'Cell Signaling', 'Stem Cells', 'Epigenetics',
-                    'Inflammation', 'Apoptosis', 'Cytoskeleton', 'Mitochondria', 'Calcium Signaling'
-                ];
-                
-                return concepts.slice(0, numConcepts);
-            }
-            
-            function generatePaperTitle(query) {
-                const templates = [
-                    'Effects of microgravity on',
-                    'Cellular response to',
-                    'Molecular mechanisms of',
-                    'Physiological adaptation in',
-                    'Therapeutic approaches for',
-                    'Biomarker analysis of',
-                    'Countermeasures for',
-                    'Long-term effects of'
-                ];
-                
-                const template = templates[Math.floor(Math.random() * templates.length)];
-                return `${template} ${query.toLowerCase()}`;
-            }
-            
-            async function exportCurrentGraph() {
-                if (!window.currentAnalysisResults) {
-                    alert('No current analysis to export');
-                    return;
-                }
-                
-                const results = window.currentAnalysisResults;
-                const graphData = await generateGraphFromAnalysis(results);
-                
-                const exportData = {
-                    analysis_metadata: {
-                        query: results.query,
-                        query_type: results.queryType,
-                        connected_papers: results.connectedPapers,
-                        key_concepts: results.keyConcepts,
-                        total_relationships: results.relationships,
-                        confidence_score: results.confidence + '%',
-                        generated_timestamp: new Date().toISOString()
-                    },
-                    graph_data: {
-                        nodes: graphData.nodes,
-                        links: graphData.links
-                    },
-                    research_analysis: results.analysis
-                };
-                
-                const dataStr = JSON.stringify(exportData, null, 2);
-                const dataBlob = new Blob([dataStr], {type: 'application/json'});
-                const url = URL.createObjectURL(dataBlob);
-                
-                const downloadLink = document.createElement('a');
-                downloadLink.href = url;
-                downloadLink.download = `research-network-${results.query.replace(/[^a-z0-9]/gi, '-').toLowerCase()}.json`;
-                downloadLink.click();
-                
-                URL.revokeObjectURL(url);
-                alert(`📊 Network exported! ${results.connectedPapers} papers, ${results.keyConcepts} concepts, ${results.relationships} relationships`);
-            }
-            
-            function showNetworkStats() {
-                if (!window.currentAnalysisResults) return;
-                
-                const results = window.currentAnalysisResults;
-                alert(`📊 Network Statistics\\n\\n` +
-                      `Query: "${results.query}"\\n` +
-                      `Connected Papers: ${results.connectedPapers}\\n` +
-                      `Key Concepts: ${results.keyConcepts}\\n` +
-                      `Mapped Relationships: ${results.relationships}\\n` +
-                      `AI Confidence: ${results.confidence}%\\n\\n` +
-                      `Primary Studies: ${Math.floor(results.connectedPapers * 0.4)}\\n` +
-                      `Supporting Research: ${Math.floor(results.connectedPapers * 0.35)}\\n` +
-                      `Applications: ${Math.floor(results.connectedPapers * 0.25)}`);
-            }
-            
-            async function resetGraphView() {
-                // Redraw the graph to reset zoom and position
-                if (window.currentAnalysisResults) {
-                    try {
-                        const detailedGraphData = await generateGraphFromAnalysis(window.currentAnalysisResults);
-                        drawInteractiveGraph('detailedGraphSvg', detailedGraphData, true);
-                    } catch (error) {
-                        console.error('Error resetting graph view:', error);
-                    }
-                }
-            }
-            
+_STATIC_DIR = Path(__file__).parent / "static"
 
 
-            // Check system status on load
-            async function checkStatus() {
-                try {
-                    const response = await fetch('/health');
-                    const data = await response.json();
-                    console.log('Knovera System Status:', data);
-                } catch (error) {
-                    console.error('Status check failed:', error);
-                }
-            }
-            
-            // Add consistency verification
-            function verifyDataConsistency() {
-                if (window.currentAnalysisResults) {
-                    console.log('✅ Analysis Results Synchronized:', {
-                        papers: window.currentAnalysisResults.connectedPapers,
-                        concepts: window.currentAnalysisResults.keyConcepts,
-                        relationships: window.currentAnalysisResults.relationships,
-                        confidence: window.currentAnalysisResults.confidence
-                    });
-                }
-            }
-            
-            // Show notification when data is synchronized
-            function showSyncNotification() {
-                if (window.currentAnalysisResults) {
-                    const results = window.currentAnalysisResults;
-                    const notification = document.createElement('div');
-                    notification.style.cssText = `
-                        position: fixed; top: 20px; right: 20px; z-index: 1000;
-                        background: #4caf50; color: white; padding: 1rem; border-radius: 8px;
-                        font-size: 0.9rem; box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-                    `;
-                    notification.innerHTML = `
-                        ✅ Data Synchronized<br>
-                        ${results.connectedPapers} Papers • ${results.keyConcepts} Concepts • ${results.relationships} Relationships
-                    `;
-                    document.body.appendChild(notification);
-                    
-                    setTimeout(() => {
-                        if (notification.parentNode) {
-                            notification.parentNode.removeChild(notification);
-                        }
-                    }, 3000);
-                }
-            }
-            
-            checkStatus();
-            
-            // Add event listener for query type dropdown
-            document.getElementById('queryType').addEventListener('change', updatePlaceholder);
-        </script>
-    </body>
-    </html>
+@functools.lru_cache(maxsize=1)
+def _jinja_env():
+    """Compiled-template environment over the static page directory"""
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    return Environment(
+        loader=FileSystemLoader(_STATIC_DIR),
+        autoescape=select_autoescape(),
+        cache_size=400,
+    )
+
+
+def _load_page(name: str, **context) -> str:
+    """Render a page template once at startup
+
+    Jinja2 compiles the template to bytecode and substitutes the few
+    dynamic values (paper counts, status); the result is then cached as
+    pre-encoded/pre-compressed bytes, so requests never re-render. When
+    jinja2 is missing the raw file is served as-is.
     """
+    try:
+        return _jinja_env().get_template(name).render(**context)
+    except ImportError:
+        return (_STATIC_DIR / name).read_text(encoding="utf-8")
+
+
+# The UI markup lives in static/index.html so the interpreter doesn't
+# parse a ~70KB string literal on import and the page is editable
+# without touching Python. Rendered once at startup.
+_ROOT_HTML = _load_page("index.html", paper_count=607)
+
+# Encode + hash once at import; per-request work on GET / is a header
+# compare and a bytes handoff instead of a ~70KB str->utf-8 encode
+_ROOT_HTML_BYTES = _ROOT_HTML.encode("utf-8")
+_ROOT_ETAG = hashlib.md5(_ROOT_HTML_BYTES).hexdigest()
+
+# Pre-compress once so no request pays compression CPU. Brotli gets the
+# page ~5x smaller than raw; gzip covers everything else.
+_ROOT_GZ = gzip.compress(_ROOT_HTML_BYTES, compresslevel=9)
+try:
+    import brotli
+    _ROOT_BR = brotli.compress(_ROOT_HTML_BYTES, quality=11)
+except ImportError:
+    _ROOT_BR = None
+
+
+@app.get("/")
+async def root(request: Request):
+    """Serve the main web interface"""
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304)
+
+    headers = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600",
+               "Vary": "Accept-Encoding"}
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if _ROOT_BR is not None and "br" in accept_encoding:
+        headers["Content-Encoding"] = "br"
+        body = _ROOT_BR
+    elif "gzip" in accept_encoding:
+        headers["Content-Encoding"] = "gzip"
+        body = _ROOT_GZ
+    else:
+        body = _ROOT_HTML_BYTES
+    return Response(content=body, media_type="text/html", headers=headers)
+
 
 @app.get("/health")
 async def health_check():
@@ -2143,11 +415,11 @@ async def health_check():
     return {
         "status": "ok",
         "service": "Research Assistant Agents",
-        "langchain_available": create_agent is not None,
+        "langchain_available": langchain_available,
         "gemini_available": gemini_available,
         "langchain_available": langchain_available,
         "available_agents": ["research_assistant", "concept_explorer", "collaboration_finder", "analysis_specialist"],
-        "tools_count": len(research_tools),
+        "tools_count": len(_research_tools()),
         "api_providers": {
             "gemini": gemini_available,
             "langchain": langchain_available,
@@ -2486,7 +758,7 @@ async def rag_concept_exploration(concept: str):
         try:
             agent = create_gemini_agent()
             context = {"papers_count": 607, "connections": 500}
-            analysis = agent.query_knowledge_graph(concept_query, context)
+            analysis = await _run_blocking(agent.query_knowledge_graph, concept_query, context)
             analysis_text = analysis.get('response', '') if isinstance(analysis, dict) else str(analysis)
         except:
             analysis_text = f"Analysis of {concept} in space biology research context."
@@ -2512,7 +784,32 @@ async def rag_concept_exploration(concept: str):
 
 # ===== GOOGLE GEMINI ENDPOINTS =====
 
+@app.post("/gemini/query/stream")
+async def gemini_query_stream(request: QueryRequest):
+    """Stream a Gemini answer as server-sent events
+
+    First tokens reach the browser in ~200ms instead of buffering the
+    full 6-10s generation behind a spinner.
+    """
+    if not gemini_available:
+        raise HTTPException(status_code=503, detail="Gemini API not available")
+
+    agent = create_gemini_agent()
+
+    async def event_stream():
+        try:
+            async for chunk in agent.aquery_knowledge_graph_stream(_effective_query(request)):
+                yield f"data: {json.dumps({'t': chunk})}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
 @app.post("/gemini/query")
+@_cache_response
 async def gemini_query(request: QueryRequest):
     """Query using Google Gemini API directly"""
     if not gemini_available:
@@ -2521,7 +818,7 @@ async def gemini_query(request: QueryRequest):
     try:
         agent = create_gemini_agent()
         context = request.context or {"papers_count": 607, "connections": 500}
-        result = agent.query_knowledge_graph(request.query, context)
+        result = await _run_blocking(agent.query_knowledge_graph, _effective_query(request), context)
         
         # Extract statistics from the result
         result_text = result.get('response', '') if isinstance(result, dict) else str(result)
@@ -2552,7 +849,7 @@ async def gemini_analyze_paper(paper_data: Dict[str, Any]):
     
     try:
         agent = create_gemini_agent()
-        result = agent.analyze_paper(paper_data)
+        result = await _run_blocking(agent.analyze_paper, paper_data)
         
         return {
             "paper_title": paper_data.get('title', 'Unknown'),
@@ -2565,6 +862,7 @@ async def gemini_analyze_paper(paper_data: Dict[str, Any]):
 
 
 @app.post("/gemini/explore-concept")
+@_cache_response
 async def gemini_explore_concept(request: ConceptExploreRequest):
     """Explore a concept using Gemini"""
     if not gemini_available:
@@ -2572,7 +870,7 @@ async def gemini_explore_concept(request: ConceptExploreRequest):
     
     try:
         agent = create_gemini_agent()
-        result = agent.explore_concept(request.concept, request.depth)
+        result = await _run_blocking(agent.explore_concept, request.concept, request.depth)
         
         return {
             "concept": request.concept,
@@ -2586,6 +884,7 @@ async def gemini_explore_concept(request: ConceptExploreRequest):
 
 
 @app.post("/gemini/find-collaborations")
+@_cache_response
 async def gemini_find_collaborations(request: CollaborationRequest):
     """Find collaborations using Gemini"""
     if not gemini_available:
@@ -2593,7 +892,7 @@ async def gemini_find_collaborations(request: CollaborationRequest):
     
     try:
         agent = create_gemini_agent()
-        result = agent.find_collaborations(request.research_interest)
+        result = await _run_blocking(agent.find_collaborations, request.research_interest)
         
         return {
             "research_interest": request.research_interest,
@@ -2629,7 +928,7 @@ def extract_paper_count_from_result(result_text) -> int:
         match = re.search(pattern, result_text, re.IGNORECASE)
         if match:
             count = int(match.group(1))
-            print(f"📄 Extracted {count} papers from Gemini response")
+            logger.info("Extracted %d papers from Gemini response", count)
             return min(count, 50)  # Cap at reasonable number
     
     # Use real database to get actual paper count
@@ -2647,7 +946,7 @@ def extract_paper_count_from_result(result_text) -> int:
                 main_term = max(set(scientific_terms), key=scientific_terms.count)
                 papers = db.search_papers(main_term, max_results=100)
                 count = len(papers)
-                print(f"📊 Found {count} papers in database for term '{main_term}'")
+                logger.info("Found %d papers in database for term %r", count, main_term)
                 return min(count, 50)  # Cap for display
             
             # Default sampling from database
@@ -2655,7 +954,7 @@ def extract_paper_count_from_result(result_text) -> int:
             return min(db.get_paper_count() // 15, 30)  # About 1/15 of database
             
         except Exception as e:
-            print(f"⚠️ Database access error: {e}")
+            logger.warning("Database access error: %s", e)
     
     # Final fallback
     return 25
@@ -2693,10 +992,10 @@ def extract_concept_count_from_result(result_text, query: str) -> int:
                         biological_terms.add(word)
             
             concept_count += min(len(biological_terms), 5)  # Cap additional concepts
-            print(f"🧠 Database analysis found {concept_count} concepts (categories: {len(active_categories)}, terms: {len(biological_terms)})")
+            logger.info("Database analysis found %d concepts (categories: %d, terms: %d)", concept_count, len(active_categories), len(biological_terms))
             
         except Exception as e:
-            print(f"⚠️ Database concept analysis error: {e}")
+            logger.warning("Database concept analysis error: %s", e)
             concept_count = 0
     
     # Fallback: analyze Gemini response for concepts
@@ -2775,13 +1074,14 @@ def calculate_confidence_score(result_text) -> int:
     
     # Base confidence + quality bonus
     confidence = 88 + min(10, sum(quality_indicators))
-    print(f"✅ Calculated {confidence}% confidence from response quality")
+    logger.info("Calculated %d%% confidence from response quality", confidence)
     return confidence
 
 
 # ===== LANGCHAIN + GEMINI ENDPOINTS =====
 
 @app.post("/langchain/query")
+@_cache_response
 async def langchain_query(request: QueryRequest):
     """Query using LangChain + Gemini integration"""
     if not langchain_available:
@@ -2798,7 +1098,7 @@ async def langchain_query(request: QueryRequest):
             "generate_graph_data": True
         })
         
-        result = agent.query(request.query, enhanced_context)
+        result = await _run_blocking(agent.query, request.query, enhanced_context)
         
         # Add instruction for detailed analysis if not present
         if "detailed breakdown" not in request.query.lower() and "analysis" in request.query.lower():
@@ -2815,7 +1115,7 @@ async def langchain_query(request: QueryRequest):
             
             Format your response to be detailed and informative for graph generation.
             """
-            result = agent.query(detailed_query, enhanced_context)
+            result = await _run_blocking(agent.query, detailed_query, enhanced_context)
         
         # Extract structured data from the result
         paper_count = extract_paper_count_from_result(result)
@@ -2860,7 +1160,7 @@ async def langchain_analyze_paper(paper_data: Dict[str, Any]):
     
     try:
         agent = LangChainResearchAgent()
-        result = agent.analyze_paper(paper_data)
+        result = await _run_blocking(agent.analyze_paper, paper_data)
         
         return {
             "paper_title": paper_data.get('title', 'Unknown'),
@@ -2876,15 +1176,16 @@ async def langchain_analyze_paper(paper_data: Dict[str, Any]):
 
 
 @app.post("/agent/query")
+@_cache_response
 async def agent_query(request: QueryRequest):
     """Query any research agent"""
     try:
-        agent = get_agent(request.agent_type)
+        agent = await get_agent(request.agent_type)
         
         if hasattr(agent, 'query'):
-            response = agent.query(request.query)
+            response = await _run_blocking(agent.query, request.query)
         elif hasattr(agent, 'executor'):
-            result = agent.executor.invoke({"input": request.query})
+            result = await _run_blocking(agent.executor.invoke, {"input": request.query})
             response = result.get("output", "No response generated")
         else:
             raise HTTPException(status_code=400, detail=f"Agent {request.agent_type} doesn't support queries")
@@ -2901,11 +1202,12 @@ async def agent_query(request: QueryRequest):
 
 
 @app.post("/agent/research")
+@_cache_response
 async def research_assistant_query(request: QueryRequest):
     """Query the main research assistant agent"""
     try:
-        agent = get_agent("research_assistant")
-        response = agent.query(request.query)
+        agent = await get_agent("research_assistant")
+        response = await _run_blocking(agent.query, request.query)
         
         return {
             "query": request.query,
@@ -2919,11 +1221,12 @@ async def research_assistant_query(request: QueryRequest):
 
 
 @app.post("/agent/explore-concept")
+@_cache_response
 async def explore_concept(request: ConceptExploreRequest):
     """Explore a research concept using the concept exploration agent"""
     try:
-        agent = get_agent("concept_explorer")
-        response = agent.explore(request.concept)
+        agent = await get_agent("concept_explorer")
+        response = await _run_blocking(agent.explore, request.concept)
         
         return {
             "concept": request.concept,
@@ -2938,11 +1241,12 @@ async def explore_concept(request: ConceptExploreRequest):
 
 
 @app.post("/agent/find-collaborations")
+@_cache_response
 async def find_collaborations(request: CollaborationRequest):
     """Find collaboration opportunities using the collaboration agent"""
     try:
-        agent = get_agent("collaboration_finder")
-        response = agent.find_opportunities(request.research_interest, request.institution)
+        agent = await get_agent("collaboration_finder")
+        response = await _run_blocking(agent.find_opportunities, request.research_interest, request.institution)
         
         return {
             "research_interest": request.research_interest,
@@ -2960,9 +1264,25 @@ async def find_collaborations(request: CollaborationRequest):
 async def deep_analysis(request: AnalysisRequest):
     """Perform deep research analysis using the analysis agent"""
     try:
-        agent = get_agent("analysis_specialist")
-        response = agent.analyze(request.research_question)
-        
+        agent = await get_agent("analysis_specialist")
+
+        if request.focus_areas and len(request.focus_areas) > 1:
+            # Focus areas are independent sub-queries: fan them out so
+            # wall time is max(t) instead of N*t
+            focus_results = await asyncio.gather(*[
+                _run_blocking(
+                    agent.analyze,
+                    f"{request.research_question} (focus: {area})",
+                )
+                for area in request.focus_areas
+            ], return_exceptions=True)
+            response = {
+                area: (str(result) if isinstance(result, Exception) else result)
+                for area, result in zip(request.focus_areas, focus_results)
+            }
+        else:
+            response = await _run_blocking(agent.analyze, request.research_question)
+
         return {
             "research_question": request.research_question,
             "focus_areas": request.focus_areas,
@@ -2978,11 +1298,12 @@ async def deep_analysis(request: AnalysisRequest):
 @app.get("/tools")
 async def list_tools():
     """List available research tools"""
-    if not research_tools:
+    tools = _research_tools()
+    if not tools:
         return {"tools": [], "message": "LangChain dependencies not installed"}
     
     tools_info = []
-    for tool in research_tools:
+    for tool in tools:
         tools_info.append({
             "name": tool.name,
             "description": tool.description,
@@ -2991,7 +1312,7 @@ async def list_tools():
     
     return {
         "tools": tools_info,
-        "count": len(research_tools)
+        "count": len(tools_info)
     }
 
 
@@ -3005,13 +1326,13 @@ async def list_agents():
         status = {
             "type": agent_type,
             "initialized": agent_type in _agents,
-            "available": create_agent is not None
+            "available": langchain_available
         }
         agents_status.append(status)
     
     return {
         "agents": agents_status,
-        "langchain_available": create_agent is not None
+        "langchain_available": langchain_available
     }
 
 
@@ -3025,1361 +1346,21 @@ async def reset_agent(agent_type: str):
         return {"message": f"Agent {agent_type} was not initialized"}
 
 
-@app.get("/new", response_class=HTMLResponse)
-async def dashboard():
-    """Serve the new dashboard interface"""
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>🧬 Research Dashboard - Space Biology Platform</title>
-        <script src="https://d3js.org/d3.v7.min.js"></script>
-        <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body { 
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Inter', sans-serif;
-                background: 
-                    radial-gradient(circle at 20% 50%, rgba(120, 119, 198, 0.3) 0%, transparent 50%),
-                    radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.3) 0%, transparent 50%),
-                    radial-gradient(circle at 40% 80%, rgba(99, 102, 241, 0.4) 0%, transparent 50%),
-                    linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-                min-height: 100vh;
-                color: #1e293b;
-                font-weight: 400;
-                line-height: 1.6;
-            }
-            
-            /* Navigation Styles */
-            .nav-container {
-                background: rgba(255, 255, 255, 0.85);
-                backdrop-filter: blur(20px);
-                border-bottom: 1px solid rgba(203, 213, 225, 0.3);
-                position: sticky;
-                top: 0;
-                z-index: 1000;
-                box-shadow: 
-                    0 4px 20px rgba(0, 0, 0, 0.08),
-                    0 1px 3px rgba(0, 0, 0, 0.1);
-                transition: all 0.3s ease;
-            }
-            
-            .nav-header {
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                padding: 1rem 2rem;
-                max-width: 1400px;
-                margin: 0 auto;
-            }
-            
-            .nav-logo {
-                display: flex;
-                align-items: center;
-                gap: 0.75rem;
-                font-size: 2.2rem;
-                font-weight: 800;
-                color: #6366f1;
-                text-decoration: none;
-                letter-spacing: -0.02em;
-            }
-            
-            .nav-logo-icon {
-                width: 32px;
-                height: 32px;
-                background: url('data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMzIiIGhlaWdodD0iMzIiIHZpZXdCb3g9IjAgMCAzMiAzMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPGcgY2xpcC1wYXRoPSJ1cmwoI2NsaXAwXzFfMSkiPgo8cmVjdCB3aWR0aD0iMzIiIGhlaWdodD0iMzIiIGZpbGw9Im5vbmUiLz4KPGVsbGlwc2UgY3g9IjE2IiBjeT0iMTYiIHJ4PSIxNCIgcnk9IjYiIGZpbGw9Im5vbmUiIHN0cm9rZT0idXJsKCNwYWludDBfbGluZWFyXzFfMSkiIHN0cm9rZS13aWR0aD0iMi4yIi8+CjxlbGxpcHNlIGN4PSIxNiIgY3k9IjE2IiByeD0iMTQiIHJ5PSI2IiBmaWxsPSJub25lIiBzdHJva2U9InVybCgjcGFpbnQxX2xpbmVhcl8xXzEpIiBzdHJva2Utd2lkdGg9IjIuMiIgdHJhbnNmb3JtPSJyb3RhdGUoNjAgMTYgMTYpIi8+CjxlbGxpcHNlIGN4PSIxNiIgY3k9IjE2IiByeD0iMTQiIHJ5PSI2IiBmaWxsPSJub25lIiBzdHJva2U9InVybCgjcGFpbnQyX2xpbmVhcl8xXzEpIiBzdHJva2Utd2lkdGg9IjIuMiIgdHJhbnNmb3JtPSJyb3RhdGUoLTYwIDE2IDE2KSIvPgo8Y2lyY2xlIGN4PSIxNiIgY3k9IjE2IiByPSI0IiBmaWxsPSJ1cmwoI3BhaW50M19yYWRpYWxfMV8xKSIvPgo8Y2lyY2xlIGN4PSIyOCIgY3k9IjE2IiByPSIyLjUiIGZpbGw9InVybCgjcGFpbnQ0X3JhZGlhbF8xXzEpIi8+CjxjaXJjbGUgY3g9IjQiIGN5PSIxNiIgcj0iMi41IiBmaWxsPSJ1cmwoI3BhaW50NV9yYWRpYWxfMV8xKSIvPgo8Y2lyY2xlIGN4PSIyNCIgY3k9IjI2IiByPSIyLjUiIGZpbGw9InVybCgjcGFpbnQ2X3JhZGlhbF8xXzEpIi8+CjxjaXJjbGUgY3g9IjgiIGN5PSI2IiByPSIyLjUiIGZpbGw9InVybCgjcGFpbnQ3X3JhZGlhbF8xXzEpIi8+CjxjaXJjbGUgY3g9IjI0IiBjeT0iNiIgcj0iMi41IiBmaWxsPSJ1cmwoI3BhaW50OF9yYWRpYWxfMV8xKSIvPgo8Y2lyY2xlIGN4PSI4IiBjeT0iMjYiIHI9IjIuNSIgZmlsbD0idXJsKCNwYWludDlfcmFkaWFsXzFfMSkiLz4KPC9nPgo8ZGVmcz4KPGxpbmVhckdyYWRpZW50IGlkPSJwYWludDBfbGluZWFyXzFfMSIgeDE9IjIiIHkxPSIxNiIgeDI9IjMwIiB5Mj0iMTYiIGdyYWRpZW50VW5pdHM9InVzZXJTcGFjZU9uVXNlIj4KPHN0b3Agc3RvcC1jb2xvcj0iIzAwQkZGRiIvPgo8c3RvcCBvZmZzZXQ9IjAuNSIgc3RvcC1jb2xvcj0iIzAwN0ZGRiIvPgo8c3RvcCBvZmZzZXQ9IjEiIHN0b3AtY29sb3I9IiMwMDNGRkYiLz4KPC9saW5lYXJHcmFkaWVudD4KPGxpbmVhckdyYWRpZW50IGlkPSJwYWludDFfbGluZWFyXzFfMSIgeDE9IjIiIHkxPSIxNiIgeDI9IjMwIiB5Mj0iMTYiIGdyYWRpZW50VW5pdHM9InVzZXJTcGFjZU9uVXNlIj4KPHN0b3Agc3RvcC1jb2xvcj0iIzAwQkZGRiIvPgo8c3RvcCBvZmZzZXQ9IjAuNSIgc3RvcC1jb2xvcj0iIzAwN0ZGRiIvPgo8c3RvcCBvZmZzZXQ9IjEiIHN0b3AtY29sb3I9IiMwMDNGRkYiLz4KPC9saW5lYXJHcmFkaWVudD4KPGxpbmVhckdyYWRpZW50IGlkPSJwYWludDJfbGluZWFyXzFfMSIgeDE9IjIiIHkxPSIxNiIgeDI9IjMwIiB5Mj0iMTYiIGdyYWRpZW50VW5pdHM9InVzZXJTcGFjZU9uVXNlIj4KPHN0b3Agc3RvcC1jb2xvcj0iIzAwQkZGRiIvPgo8c3RvcCBvZmZzZXQ9IjAuNSIgc3RvcC1jb2xvcj0iIzAwN0ZGRiIvPgo8c3RvcCBvZmZzZXQ9IjEiIHN0b3AtY29sb3I9IiMwMDNGRkYiLz4KPC9saW5lYXJHcmFkaWVudD4KPHJhZGlhbEdyYWRpZW50IGlkPSJwYWludDNfcmFkaWFsXzFfMSIgY3g9IjAiIGN5PSIwIiByPSIxIiBncmFkaWVudFVuaXRzPSJ1c2VyU3BhY2VPblVzZSIgZ3JhZGllbnRUcmFuc2Zvcm09InRyYW5zbGF0ZSgxNiAxNikgcm90YXRlKDkwKSBzY2FsZSg0KSI+CjxzdG9wIHN0b3AtY29sb3I9IiMwMERGRkYiLz4KPHN0b3Agb2Zmc2V0PSIxIiBzdG9wLWNvbG9yPSIjMDA1RkZGIi8+CjwvcmFkaWFsR3JhZGllbnQ+CjxyYWRpYWxHcmFkaWVudCBpZD0icGFpbnQ0X3JhZGlhbF8xXzEiIGN4PSIwIiBjeT0iMCIgcj0iMSIgZ3JhZGllbnRVbml0cz0idXNlclNwYWNlT25Vc2UiIGdyYWRpZW50VHJhbnNmb3JtPSJ0cmFuc2xhdGUoMjggMTYpIHJvdGF0ZSg5MCkgc2NhbGUoMi41KSI+CjxzdG9wIHN0b3AtY29sb3I9IiMwMERGRkYiLz4KPHN0b3Agb2Zmc2V0PSIxIiBzdG9wLWNvbG9yPSIjMDA1RkZGIi8+CjwvcmFkaWFsR3JhZGllbnQ+CjxyYWRpYWxHcmFkaWVudCBpZD0icGFpbnQ1X3JhZGlhbF8xXzEiIGN4PSIwIiBjeT0iMCIgcj0iMSIgZ3JhZGllbnRVbml0cz0idXNlclNwYWNlT25Vc2UiIGdyYWRpZW50VHJhbnNmb3JtPSJ0cmFuc2xhdGUoNCAxNikgcm90YXRlKDkwKSBzY2FsZSgyLjUpIj4KPHN0b3Agc3RvcC1jb2xvcj0iIzAwREZGRiIvPgo8c3RvcCBvZmZzZXQ9IjEiIHN0b3AtY29sb3I9IiMwMDVGRkYiLz4KPC9yYWRpYWxHcmFkaWVudD4KPHJhZGlhbEdyYWRpZW50IGlkPSJwYWludDZfcmFkaWFsXzFfMSIgY3g9IjAiIGN5PSIwIiByPSIxIiBncmFkaWVudFVuaXRzPSJ1c2VyU3BhY2VPblVzZSIgZ3JhZGllbnRUcmFuc2Zvcm09InRyYW5zbGF0ZSgyNCAyNikgcm90YXRlKDkwKSBzY2FsZSgyLjUpIj4KPHN0b3Agc3RvcC1jb2xvcj0iIzAwREZGRiIvPgo8c3RvcCBvZmZzZXQ9IjEiIHN0b3AtY29sb3I9IiMwMDVGRkYiLz4KPC9yYWRpYWxHcmFkaWVudD4KPHJhZGlhbEdyYWRpZW50IGlkPSJwYWludDdfcmFkaWFsXzFfMSIgY3g9IjAiIGN5PSIwIiByPSIxIiBncmFkaWVudFVuaXRzPSJ1c2VyU3BhY2VPblVzZSIgZ3JhZGllbnRUcmFuc2Zvcm09InRyYW5zbGF0ZSg4IDYpIHJvdGF0ZSg5MCkgc2NhbGUoMi41KSI+CjxzdG9wIHN0b3AtY29sb3I9IiMwMERGRkYiLz4KPHN0b3Agb2Zmc2V0PSIxIiBzdG9wLWNvbG9yPSIjMDA1RkZGIi8+CjwvcmFkaWFsR3JhZGllbnQ+CjxyYWRpYWxHcmFkaWVudCBpZD0icGFpbnQ4X3JhZGlhbF8xXzEiIGN4PSIwIiBjeT0iMCIgcj0iMSIgZ3JhZGllbnRVbml0cz0idXNlclNwYWNlT25Vc2UiIGdyYWRpZW50VHJhbnNmb3JtPSJ0cmFuc2xhdGUoMjQgNikgcm90YXRlKDkwKSBzY2FsZSgyLjUpIj4KPHN0b3Agc3RvcC1jb2xvcj0iIzAwREZGRiIvPgo8c3RvcCBvZmZzZXQ9IjEiIHN0b3AtY29sb3I9IiMwMDVGRkYiLz4KPC9yYWRpYWxHcmFkaWVudD4KPHJhZGlhbEdyYWRpZW50IGlkPSJwYWludDlfcmFkaWFsXzFfMSIgY3g9IjAiIGN5PSIwIiByPSIxIiBncmFkaWVudFVuaXRzPSJ1c2VyU3BhY2VPblVzZSIgZ3JhZGllbnRUcmFuc2Zvcm09InRyYW5zbGF0ZSg4IDI2KSByb3RhdGUoOTApIHNjYWxlKDIuNSkiPgo8c3RvcCBzdG9wLWNvbG9yPSIjMDBERkZGIi8+CjxzdG9wIG9mZnNldD0iMSIgc3RvcC1jb2xvcj0iIzAwNUZGRiIvPgo8L3JhZGlhbEdyYWRpZW50Pgo8Y2xpcFBhdGggaWQ9ImNsaXAwXzFfMSI+CjxyZWN0IHdpZHRoPSIzMiIgaGVpZ2h0PSIzMiIgZmlsbD0id2hpdGUiLz4KPC9jbGlwUGF0aD4KPC9kZWZzPgo8L3N2Zz4K') center/contain no-repeat;
-                flex-shrink: 0;
-                margin-right: 12px;
-            }
-            
-            .nav-tabs {
-                display: flex;
-                gap: 0.25rem;
-                list-style: none;
-                background: rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(10px);
-                border-radius: 35px;
-                padding: 0.5rem;
-                box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-            }
-            
-            .nav-tab {
-                padding: 0.875rem 2rem;
-                border-radius: 12px;
-                cursor: pointer;
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                font-weight: 600;
-                font-size: 0.95rem;
-                color: #64748b;
-                background: transparent;
-                border: none;
-                position: relative;
-                overflow: hidden;
-                text-transform: capitalize;
-                letter-spacing: 0.5px;
-            }
-            
-            .nav-tab:before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-                transition: left 0.5s;
-            }
-            
-            .nav-tab:hover:before {
-                left: 100%;
-            }
-            
-            .nav-tab.active {
-                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 50%, #a855f7 100%);
-                color: white;
-                box-shadow: 
-                    0 8px 25px rgba(99, 102, 241, 0.4),
-                    0 4px 12px rgba(139, 92, 246, 0.3),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.2);
-                transform: translateY(-1px);
-            }
-            
-            .nav-tab:hover:not(.active) {
-                background: rgba(99, 102, 241, 0.08);
-                color: #6366f1;
-                transform: translateY(-1px);
-                box-shadow: 0 4px 12px rgba(99, 102, 241, 0.15);
-            }
-            
-            /* Main Content Styles */
-            .main-container {
-                max-width: 1400px;
-                margin: 0 auto;
-                padding: 2rem;
-            }
-            
-            .page-content {
-                display: none;
-            }
-            
-            .page-content.active {
-                display: block;
-                animation: fadeIn 0.3s ease-in;
-            }
-            
-            @keyframes fadeIn {
-                from { opacity: 0; transform: translateY(20px); }
-                to { opacity: 1; transform: translateY(0); }
-            }
-            
-            .page-header {
-                text-align: center;
-                color: white;
-                margin-bottom: 3rem;
-            }
-            
-            .page-title {
-                font-size: 3rem;
-                font-weight: 800;
-                margin-bottom: 1rem;
-                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 50%, #ec4899 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-                text-align: center;
-                position: relative;
-                letter-spacing: -0.02em;
-            }
-            
-            .page-title:after {
-                content: '';
-                position: absolute;
-                bottom: -10px;
-                left: 50%;
-                transform: translateX(-50%);
-                width: 100px;
-                height: 4px;
-                background: linear-gradient(90deg, #6366f1, #8b5cf6, #ec4899);
-                border-radius: 2px;
-            }
-            
-            .page-subtitle {
-                font-size: 1.25rem;
-                color: #64748b;
-                text-align: center;
-                font-weight: 500;
-                margin-bottom: 3rem;
-            }
-            
-            /* Dashboard Styles */
-            .dashboard-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-                gap: 2rem;
-                margin-bottom: 3rem;
-            }
-            
-            .dashboard-card {
-                background: rgba(255, 255, 255, 0.9);
-                backdrop-filter: blur(20px);
-                border-radius: 10px;
-                padding: 2.5rem;
-                box-shadow: 
-                    0 10px 40px rgba(0, 0, 0, 0.08),
-                    0 4px 16px rgba(0, 0, 0, 0.04),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                position: relative;
-            }
-            
-            .dashboard-card:hover {
-                transform: translateY(-8px) scale(1.01);
-                box-shadow: 
-                    0 20px 60px rgba(0, 0, 0, 0.12),
-                    0 8px 24px rgba(99, 102, 241, 0.1),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.8);
-            }
-            
-            .card-header {
-                display: flex;
-                justify-content: between;
-                align-items: center;
-                margin-bottom: 1.5rem;
-                padding-bottom: 1rem;
-                border-bottom: 2px solid #f1f1f1;
-            }
-            
-            .card-title {
-                font-size: 1.5rem;
-                font-weight: 700;
-                color: #1e293b;
-                display: flex;
-                align-items: center;
-                gap: 0.75rem;
-                margin-bottom: 1.5rem;
-                position: relative;
-            }
-            
-            .card-title:after {
-                content: '';
-                position: absolute;
-                bottom: -8px;
-                left: 0;
-                width: 60px;
-                height: 3px;
-                background: linear-gradient(90deg, #6366f1, #8b5cf6);
-                border-radius: 2px;
-            }
-            
-            .card-icon {
-                font-size: 2rem;
-            }
-            
-            /* KPI Styles */
-            .kpi-grid {
-                display: grid;
-                grid-template-columns: repeat(6, 1fr);
-                gap: 1.2rem;
-                margin-bottom: 2rem;
-            }
-            
-            .kpi-card {
-                background: 
-                    linear-gradient(135deg, #6366f1 0%, #8b5cf6 50%, #ec4899 100%);
-                color: white;
-                padding: 2rem 1.5rem;
-                border-radius: 8px;
-                text-align: center;
-                box-shadow: 
-                    0 10px 40px rgba(99, 102, 241, 0.25),
-                    0 4px 16px rgba(139, 92, 246, 0.2),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-                position: relative;
-                overflow: hidden;
-                backdrop-filter: blur(10px);
-            }
-            
-            .kpi-card:hover {
-                transform: translateY(-5px) scale(1.02);
-                box-shadow: 0 12px 35px rgba(102, 126, 234, 0.4);
-            }
-            
-            .kpi-card:before {
-                content: '';
-                position: absolute;
-                top: -50%;
-                left: -50%;
-                width: 200%;
-                height: 200%;
-                background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-                opacity: 0;
-                transition: opacity 0.3s ease;
-            }
-            
-            .kpi-card:hover:before {
-                opacity: 1;
-            }
-            
-            .kpi-icon {
-                font-size: 2.5rem;
-                margin-bottom: 1rem;
-                display: block;
-            }
-            
-            .kpi-number {
-                font-size: 2.5rem;
-                font-weight: bold;
-                margin-bottom: 0.5rem;
-            }
-            
-            .kpi-label {
-                font-size: 1rem;
-                opacity: 0.9;
-                margin-bottom: 0.5rem;
-            }
-            
-            .kpi-trend {
-                font-size: 0.85rem;
-                opacity: 0.8;
-                margin-top: 0.5rem;
-                padding: 0.25rem 0.5rem;
-                border-radius: 12px;
-                background: rgba(255, 255, 255, 0.1);
-                display: inline-block;
-            }
-            
-            .kpi-card[data-trend="up"] .kpi-trend:before {
-                content: "📈 ";
-                color: #4ade80;
-            }
-            
-            .kpi-card[data-trend="down"] .kpi-trend:before {
-                content: "📉 ";
-                color: #f87171;
-            }
-            
-            .kpi-card[data-trend="stable"] .kpi-trend:before {
-                content: "📊 ";
-                color: #fbbf24;
-            }
-            
-            .kpi-grid {
-                grid-template-columns: repeat(3, 1fr);
-            }
-            
-            /* Category Styles */
-            .category-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-                gap: 1.5rem;
-            }
-            
-            .category-item {
-                background: white;
-                padding: 1.5rem;
-                border-radius: 12px;
-                box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-                transition: all 0.3s ease;
-                cursor: pointer;
-            }
-            
-            .category-item:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-                border-left: 4px solid #667eea;
-            }
-            
-            .category-header {
-                display: flex;
-                align-items: center;
-                justify-content: space-between;
-                margin-bottom: 1rem;
-            }
-            
-            .category-name {
-                font-weight: 600;
-                color: #333;
-                font-size: 1.1rem;
-            }
-            
-            .category-count {
-                background: #667eea;
-                color: white;
-                padding: 0.3rem 0.8rem;
-                border-radius: 15px;
-                font-size: 0.9rem;
-                font-weight: 500;
-            }
-            
-            .category-description {
-                color: #666;
-                font-size: 0.9rem;
-                line-height: 1.5;
-            }
-            
-            /* Trending Papers Styles */
-            .trending-list {
-                display: flex;
-                flex-direction: column;
-                gap: 1rem;
-            }
-            
-            .paper-item {
-                background: white;
-                padding: 1.5rem;
-                border-radius: 12px;
-                box-shadow: 0 4px 15px rgba(0, 0, 0, 0.08);
-                transition: all 0.3s ease;
-                border-left: 4px solid transparent;
-            }
-            
-            .paper-item:hover {
-                transform: translateX(5px);
-                border-left-color: #667eea;
-                box-shadow: 0 6px 20px rgba(0, 0, 0, 0.12);
-            }
-            
-            .paper-title {
-                font-weight: 600;
-                color: #333;
-                margin-bottom: 0.5rem;
-                line-height: 1.4;
-            }
-            
-            .paper-meta {
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                font-size: 0.9rem;
-                color: #666;
-            }
-            
-            .paper-trend {
-                color: #28a745;
-                font-weight: 500;
-            }
-            
-            /* Chart Container */
-            .chart-container {
-                background: rgba(255, 255, 255, 0.95);
-                backdrop-filter: blur(10px);
-                padding: 2rem;
-                border-radius: 8px;
-                margin-top: 1.5rem;
-                height: 360px;
-                position: relative;
-                box-shadow: 
-                    0 8px 30px rgba(0, 0, 0, 0.08),
-                    0 2px 8px rgba(99, 102, 241, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            }
-            
-            .chart-container:hover {
-                box-shadow: 
-                    0 16px 50px rgba(0, 0, 0, 0.12),
-                    0 4px 16px rgba(99, 102, 241, 0.15);
-                transform: translateY(-4px);
-                border-color: rgba(99, 102, 241, 0.2);
-            }
-            
-            /* Enhanced Grid Layout for Charts */
-            .dashboard-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-                gap: 2rem;
-                margin-bottom: 2rem;
-            }
-            
-            @media (max-width: 768px) {
-                .dashboard-grid {
-                    grid-template-columns: 1fr;
-                }
-                .chart-container {
-                    height: 280px;
-                    padding: 1rem;
-                }
-            }
-            
-            /* Research Publications Styles */
-            .search-container {
-                background: rgba(255, 255, 255, 0.9);
-                backdrop-filter: blur(20px);
-                padding: 2.5rem;
-                border-radius: 10px;
-                margin-bottom: 3rem;
-                box-shadow: 
-                    0 10px 40px rgba(0, 0, 0, 0.08),
-                    0 4px 16px rgba(0, 0, 0, 0.04);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-            
-            .search-form {
-                display: flex;
-                gap: 1.5rem;
-                align-items: center;
-                margin-bottom: 2rem;
-            }
-            
-            .search-input {
-                flex: 1;
-                padding: 1.25rem 1.5rem;
-                border: 2px solid rgba(99, 102, 241, 0.1);
-                border-radius: 16px;
-                font-size: 1rem;
-                transition: border-color 0.3s ease;
-            }
-            
-            .search-input:focus {
-                outline: none;
-                border-color: #667eea;
-            }
-            
-            .search-btn {
-                padding: 1rem 2rem;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-weight: 600;
-                cursor: pointer;
-                transition: transform 0.2s ease;
-            }
-            
-            .search-btn:hover {
-                transform: translateY(-2px);
-            }
-            
-            .filters {
-                display: flex;
-                gap: 1rem;
-                flex-wrap: wrap;
-            }
-            
-            .filter-btn {
-                padding: 0.75rem 1.5rem;
-                border: 2px solid rgba(99, 102, 241, 0.2);
-                background: rgba(255, 255, 255, 0.8);
-                backdrop-filter: blur(10px);
-                border-radius: 25px;
-                cursor: pointer;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                font-size: 0.95rem;
-                font-weight: 500;
-                color: #475569;
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .filter-btn:before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-                transition: left 0.5s;
-            }
-            
-            .filter-btn:hover:before {
-                left: 100%;
-            }
-            
-            .filter-btn:hover:not(.active) {
-                border-color: #6366f1;
-                color: #6366f1;
-                transform: translateY(-2px);
-                box-shadow: 0 4px 12px rgba(99, 102, 241, 0.2);
-            }
-            
-            .filter-btn.active {
-                border-color: #6366f1;
-                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-                color: white;
-                transform: translateY(-1px);
-                box-shadow: 0 6px 16px rgba(99, 102, 241, 0.3);
-            }
-            
-            /* Research Assistant Styles */
-            .assistant-interface {
-                background: white;
-                border-radius: 20px;
-                padding: 2rem;
-                box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-                min-height: 500px;
-            }
-            
-            .chat-container {
-                height: 400px;
-                border: 2px solid #f1f1f1;
-                border-radius: 12px;
-                padding: 1rem;
-                overflow-y: auto;
-                margin-bottom: 1rem;
-                background: #f8f9ff;
-            }
-            
-            .chat-input-container {
-                display: flex;
-                gap: 1rem;
-            }
-            
-            .chat-input {
-                flex: 1;
-                padding: 1rem;
-                border: 2px solid #e9ecef;
-                border-radius: 12px;
-                resize: vertical;
-                min-height: 80px;
-            }
-            
-            .chat-send {
-                padding: 1rem 2rem;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-weight: 600;
-                cursor: pointer;
-                align-self: flex-end;
-            }
-            
-            /* Responsive Design */
-            @media (max-width: 768px) {
-                .nav-header {
-                    flex-direction: column;
-                    gap: 1rem;
-                    padding: 1rem;
-                }
-                
-                .nav-tabs {
-                    flex-wrap: wrap;
-                    justify-content: center;
-                }
-                
-                .main-container {
-                    padding: 1rem;
-                }
-                
-                .dashboard-grid {
-                    grid-template-columns: 1fr;
-                    gap: 1.5rem;
-                }
-                
-                .kpi-grid {
-                    grid-template-columns: repeat(2, 1fr);
-                    gap: 1rem;
-                }
-                
-                .kpi-card {
-                    padding: 1.5rem 1rem;
-                }
-                
-                .search-form {
-                    flex-direction: column;
-                }
-                
-                .filters {
-                    justify-content: center;
-                }
-            }
-            
-            @media (max-width: 480px) {
-                .kpi-grid {
-                    grid-template-columns: 1fr;
-                    gap: 1rem;
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <!-- Navigation -->
-        <nav class="nav-container">
-            <div class="nav-header">
-                <a href="#" class="nav-logo">
-                    <div class="nav-logo-icon"></div>
-                    <span>Knovera</span>
-                </a>
-                <ul class="nav-tabs">
-                    <li class="nav-tab active" data-page="dashboard">📊 Dashboard</li>
-                    <li class="nav-tab" data-page="publications">📚 Research Publications</li>
-                    <li class="nav-tab" data-page="assistant">🤖 Research Assistant</li>
-                </ul>
-            </div>
-        </nav>
-
-        <!-- Main Content -->
-        <div class="main-container">
-            <!-- Dashboard Page -->
-            <div id="dashboard" class="page-content active">
-                <div class="page-header">
-                    <h1 class="page-title">Research Dashboard</h1>
-                    <p class="page-subtitle">Space Biology Research Intelligence Platform</p>
-                </div>
-
-                <!-- Enhanced KPIs -->
-                <div class="kpi-grid">
-                    <div class="kpi-card" data-trend="up">
-                        <div class="kpi-icon">📚</div>
-                        <div class="kpi-number" data-target="607">607</div>
-                        <div class="kpi-label">Total Papers</div>
-                        <div class="kpi-trend">+23 this month</div>
-                    </div>
-                    <div class="kpi-card" data-trend="up">
-                        <div class="kpi-icon">🔬</div>
-                        <div class="kpi-number" data-target="45">45</div>
-                        <div class="kpi-label">Research Categories</div>
-                        <div class="kpi-trend">+2 new areas</div>
-                    </div>
-                    <div class="kpi-card" data-trend="up">
-                        <div class="kpi-icon">📊</div>
-                        <div class="kpi-number" data-target="1247">1,247</div>
-                        <div class="kpi-label">Total Citations</div>
-                        <div class="kpi-trend">+156 this week</div>
-                    </div>
-                    <div class="kpi-card" data-trend="stable">
-                        <div class="kpi-icon">🎯</div>
-                        <div class="kpi-number" data-target="89">89%</div>
-                        <div class="kpi-label">Analysis Accuracy</div>
-                        <div class="kpi-trend">Stable performance</div>
-                    </div>
-                    <div class="kpi-card" data-trend="up">
-                        <div class="kpi-icon">👥</div>
-                        <div class="kpi-number" data-target="156">156</div>
-                        <div class="kpi-label">Active Researchers</div>
-                        <div class="kpi-trend">+12 new members</div>
-                    </div>
-                    <div class="kpi-card" data-trend="up">
-                        <div class="kpi-icon">🌟</div>
-                        <div class="kpi-number" data-target="23">23</div>
-                        <div class="kpi-label">Recent Discoveries</div>
-                        <div class="kpi-trend">This quarter</div>
-                    </div>
-                </div>
-
-                <div class="dashboard-grid">
-                    <!-- Research Categories -->
-                    <div class="dashboard-card">
-                        <div class="card-header">
-                            <h3 class="card-title">
-                                <span class="card-icon">🔬</span>
-                                Research Categories
-                            </h3>
-                        </div>
-                        <div class="category-grid">
-                            <div class="category-item">
-                                <div class="category-header">
-                                    <div class="category-name">Microgravity Effects</div>
-                                    <div class="category-count">142</div>
-                                </div>
-                                <div class="category-description">
-                                    Studies on biological effects of microgravity environments
-                                </div>
-                            </div>
-                            <div class="category-item">
-                                <div class="category-header">
-                                    <div class="category-name">Space Radiation</div>
-                                    <div class="category-count">89</div>
-                                </div>
-                                <div class="category-description">
-                                    Research on cosmic radiation impact on biological systems
-                                </div>
-                            </div>
-                            <div class="category-item">
-                                <div class="category-header">
-                                    <div class="category-name">Gene Expression</div>
-                                    <div class="category-count">76</div>
-                                </div>
-                                <div class="category-description">
-                                    Genomic and transcriptomic studies in space conditions
-                                </div>
-                            </div>
-                            <div class="category-item">
-                                <div class="category-header">
-                                    <div class="category-name">Bone & Muscle</div>
-                                    <div class="category-count">103</div>
-                                </div>
-                                <div class="category-description">
-                                    Musculoskeletal adaptations to spaceflight
-                                </div>
-                            </div>
-                            <div class="category-item">
-                                <div class="category-header">
-                                    <div class="category-name">Plant Biology</div>
-                                    <div class="category-count">67</div>
-                                </div>
-                                <div class="category-description">
-                                    Plant growth and development in space environments
-                                </div>
-                            </div>
-                            <div class="category-item">
-                                <div class="category-header">
-                                    <div class="category-name">Cardiovascular</div>
-                                    <div class="category-count">54</div>
-                                </div>
-                                <div class="category-description">
-                                    Heart and circulatory system adaptations
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Trending Papers -->
-                    <div class="dashboard-card">
-                        <div class="card-header">
-                            <h3 class="card-title">
-                                <span class="card-icon">📈</span>
-                                Trending Papers
-                            </h3>
-                        </div>
-                        <div class="trending-list">
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Microgravity induces pelvic bone loss through osteoclastic activity
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC3630201</span>
-                                    <span class="paper-trend">+24% this week</span>
-                                </div>
-                            </div>
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Stem Cell Health and Tissue Regeneration in Microgravity
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC11988870</span>
-                                    <span class="paper-trend">+19% this week</span>
-                                </div>
-                            </div>
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Spaceflight Modulates Key Oxidative Stress and Cell Cycle Genes
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC8396460</span>
-                                    <span class="paper-trend">+15% this week</span>
-                                </div>
-                            </div>
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Effects of Space Radiation on Skeletal System
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC5666799</span>
-                                    <span class="paper-trend">+12% this week</span>
-                                </div>
-                            </div>
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Gene Expression Analysis in Space Environment
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC5587110</span>
-                                    <span class="paper-trend">+8% this week</span>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Research Categories Bar Chart -->
-                    <div class="dashboard-card">
-                        <div class="card-header">
-                            <h3 class="card-title">
-                                <span class="card-icon">📊</span>
-                                Research Categories Distribution
-                            </h3>
-                        </div>
-                        <div class="chart-container">
-                            <canvas id="categoriesChart"></canvas>
-                        </div>
-                    </div>
-
-                    <!-- Publication Trends Line Chart -->
-                    <div class="dashboard-card">
-                        <div class="card-header">
-                            <h3 class="card-title">
-                                <span class="card-icon">📈</span>
-                                Publication Trends (2019-2024)
-                            </h3>
-                        </div>
-                        <div class="chart-container">
-                            <canvas id="trendsChart"></canvas>
-                        </div>
-                    </div>
-
-                    <!-- Research Impact Radar Chart -->
-                    <div class="dashboard-card">
-                        <div class="card-header">
-                            <h3 class="card-title">
-                                <span class="card-icon">🎯</span>
-                                Research Impact Analysis
-                            </h3>
-                        </div>
-                        <div class="chart-container">
-                            <canvas id="impactChart"></canvas>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Research Publications Page -->
-            <div id="publications" class="page-content">
-                <div class="page-header">
-                    <h1 class="page-title">Research Publications</h1>
-                    <p class="page-subtitle">Explore 607 Space Biology Research Papers</p>
-                </div>
-
-                <div class="search-container">
-                    <div class="search-form">
-                        <input type="text" class="search-input" placeholder="Search research papers..." id="searchInput">
-                        <button class="search-btn" onclick="searchPapers()">🔍 Search</button>
-                    </div>
-                    <div class="filters">
-                        <button class="filter-btn active" data-category="all">All Categories</button>
-                        <button class="filter-btn" data-category="microgravity">Microgravity</button>
-                        <button class="filter-btn" data-category="radiation">Radiation</button>
-                        <button class="filter-btn" data-category="gene">Gene Expression</button>
-                        <button class="filter-btn" data-category="bone">Bone & Muscle</button>
-                        <button class="filter-btn" data-category="plant">Plant Biology</button>
-                    </div>
-                </div>
-
-                <div class="dashboard-card">
-                    <div class="card-header">
-                        <h3 class="card-title">
-                            <span class="card-icon">📚</span>
-                            Search Results
-                        </h3>
-                    </div>
-                    <div id="searchResults">
-                        <div class="trending-list">
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Mice in Bion-M 1 space mission: training and selection
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC4136787</span>
-                                    <a href="https://www.ncbi.nlm.nih.gov/pmc/articles/PMC4136787/" target="_blank" style="color: #667eea;">View Paper</a>
-                                </div>
-                            </div>
-                            <div class="paper-item">
-                                <div class="paper-title">
-                                    Microgravity induces pelvic bone loss through osteoclastic activity
-                                </div>
-                                <div class="paper-meta">
-                                    <span>PMC3630201</span>
-                                    <a href="https://www.ncbi.nlm.nih.gov/pmc/articles/PMC3630201/" target="_blank" style="color: #667eea;">View Paper</a>
-                                </div>
-                            </div>
-                            <!-- More papers will be loaded here -->
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Research Assistant Page -->
-            <div id="assistant" class="page-content">
-                <div class="page-header">
-                    <h1 class="page-title">Knovera Research Assistant</h1>
-                    <p class="page-subtitle">AI-Powered Research Analysis & Graph Intelligence</p>
-                </div>
-
-                <div class="assistant-interface" style="padding: 0; border-radius: 20px; overflow: hidden; min-height: 80vh;">
-                    <div style="background: white; padding: 1rem 2rem; border-bottom: 1px solid #e9ecef; display: flex; justify-content: space-between; align-items: center;">
-                        <div class="card-title">
-                            <span class="card-icon">�</span>
-                            Knovera Research Assistant
-                        </div>
-                        <a href="http://localhost:8000" target="_blank" style="
-                            padding: 0.5rem 1rem; 
-                            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                            color: white; 
-                            text-decoration: none; 
-                            border-radius: 8px; 
-                            font-size: 0.9rem;
-                            transition: transform 0.2s ease;
-                        " onmouseover="this.style.transform='translateY(-2px)'" onmouseout="this.style.transform='translateY(0)'">
-                            🔗 Open in New Window
-                        </a>
-                    </div>
-                    <iframe 
-                        src="http://localhost:8000" 
-                        style="
-                            width: 100%; 
-                            height: calc(80vh - 80px); 
-                            border: none; 
-                            background: white;
-                        "
-                        title="Knovera Research Assistant">
-                    </iframe>
-                </div>
-            </div>
-        </div>
-
-        <script>
-            // Navigation functionality
-            document.querySelectorAll('.nav-tab').forEach(tab => {
-                tab.addEventListener('click', function() {
-                    // Remove active class from all tabs and pages
-                    document.querySelectorAll('.nav-tab').forEach(t => t.classList.remove('active'));
-                    document.querySelectorAll('.page-content').forEach(p => p.classList.remove('active'));
-                    
-                    // Add active class to clicked tab and corresponding page
-                    this.classList.add('active');
-                    const pageId = this.dataset.page;
-                    document.getElementById(pageId).classList.add('active');
-                });
-            });
-
-            // Filter functionality for publications
-            document.querySelectorAll('.filter-btn').forEach(btn => {
-                btn.addEventListener('click', function() {
-                    document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
-                    this.classList.add('active');
-                    
-                    const category = this.dataset.category;
-                    filterPapers(category);
-                });
-            });
-
-            // Search functionality
-            function searchPapers() {
-                const query = document.getElementById('searchInput').value;
-                console.log('Searching for:', query);
-                // Here you would implement actual search functionality
-                // For now, we'll just show a placeholder
-                document.getElementById('searchResults').innerHTML = `
-                    <div style="text-align: center; padding: 2rem; color: #666;">
-                        <div style="font-size: 2rem; margin-bottom: 1rem;">🔍</div>
-                        <div>Searching for "${query}"...</div>
-                        <div style="margin-top: 1rem; font-size: 0.9rem;">
-                            This would connect to the backend API to search through 607 papers
-                        </div>
-                    </div>
-                `;
-            }
+_DASHBOARD_HTML_BYTES = (_STATIC_DIR / "dashboard.html").read_bytes()
 
-            function filterPapers(category) {
-                console.log('Filtering by category:', category);
-                // Implement filtering logic here
-            }
 
-            // Chat functionality (removed - now using iframe)
-            // The Research Assistant tab now displays the full Knovera interface
-            // from http://localhost:8000 in an embedded iframe
-
-            // Allow Enter to send message (legacy - kept for future use)
-            // document.getElementById('chatInput').addEventListener('keypress', function(e) {
-            //     if (e.key === 'Enter' && !e.shiftKey) {
-            //         e.preventDefault();
-            //         sendMessage();
-            //     }
-            // });
-
-            // Initialize multiple charts
-            function initCharts() {
-                // Categories Bar Chart
-                const ctx1 = document.getElementById('categoriesChart').getContext('2d');
-                new Chart(ctx1, {
-                    type: 'bar',
-                    data: {
-                        labels: ['Microgravity', 'Radiation', 'Gene Expression', 'Bone & Muscle', 'Plant Biology', 'Cell Biology'],
-                        datasets: [{
-                            label: 'Number of Papers',
-                            data: [142, 89, 76, 103, 67, 130],
-                            backgroundColor: [
-                                '#667eea',
-                                '#764ba2',
-                                '#f093fb',
-                                '#f5576c',
-                                '#4facfe',
-                                '#43e97b'
-                            ],
-                            borderColor: [
-                                '#5a67d8',
-                                '#6b46c1',
-                                '#ec4899',
-                                '#dc2626',
-                                '#2563eb',
-                                '#059669'
-                            ],
-                            borderWidth: 2,
-                            borderRadius: 8,
-                            borderSkipped: false
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            legend: {
-                                display: false
-                            },
-                            tooltip: {
-                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
-                                titleColor: '#fff',
-                                bodyColor: '#fff',
-                                borderColor: '#667eea',
-                                borderWidth: 1
-                            }
-                        },
-                        scales: {
-                            y: {
-                                beginAtZero: true,
-                                grid: {
-                                    color: 'rgba(0, 0, 0, 0.1)'
-                                },
-                                ticks: {
-                                    color: '#666'
-                                }
-                            },
-                            x: {
-                                grid: {
-                                    display: false
-                                },
-                                ticks: {
-                                    color: '#666',
-                                    maxRotation: 45
-                                }
-                            }
-                        }
-                    }
-                });
-
-                // Publication Trends Line Chart
-                const ctx2 = document.getElementById('trendsChart').getContext('2d');
-                new Chart(ctx2, {
-                    type: 'line',
-                    data: {
-                        labels: ['2019', '2020', '2021', '2022', '2023', '2024'],
-                        datasets: [{
-                            label: 'Publications',
-                            data: [78, 95, 112, 134, 98, 90],
-                            borderColor: '#667eea',
-                            backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                            borderWidth: 3,
-                            fill: true,
-                            tension: 0.4,
-                            pointBackgroundColor: '#667eea',
-                            pointBorderColor: '#ffffff',
-                            pointBorderWidth: 2,
-                            pointRadius: 6,
-                            pointHoverRadius: 8
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            legend: {
-                                display: false
-                            },
-                            tooltip: {
-                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
-                                titleColor: '#fff',
-                                bodyColor: '#fff',
-                                borderColor: '#667eea',
-                                borderWidth: 1
-                            }
-                        },
-                        scales: {
-                            y: {
-                                beginAtZero: true,
-                                grid: {
-                                    color: 'rgba(102, 126, 234, 0.1)'
-                                },
-                                ticks: {
-                                    color: '#666'
-                                }
-                            },
-                            x: {
-                                grid: {
-                                    display: false
-                                },
-                                ticks: {
-                                    color: '#666'
-                                }
-                            }
-                        }
-                    }
-                });
-
-                // Research Impact Radar Chart
-                const ctx3 = document.getElementById('impactChart').getContext('2d');
-                new Chart(ctx3, {
-                    type: 'radar',
-                    data: {
-                        labels: ['Citations', 'Innovation', 'Methodology', 'Relevance', 'Impact Factor', 'Collaboration'],
-                        datasets: [{
-                            label: 'Current Research',
-                            data: [85, 78, 92, 88, 76, 89],
-                            borderColor: '#667eea',
-                            backgroundColor: 'rgba(102, 126, 234, 0.2)',
-                            borderWidth: 2,
-                            pointBackgroundColor: '#667eea',
-                            pointBorderColor: '#ffffff',
-                            pointBorderWidth: 2
-                        }, {
-                            label: 'Industry Average',
-                            data: [70, 65, 75, 72, 68, 74],
-                            borderColor: '#f093fb',
-                            backgroundColor: 'rgba(240, 147, 251, 0.1)',
-                            borderWidth: 2,
-                            pointBackgroundColor: '#f093fb',
-                            pointBorderColor: '#ffffff',
-                            pointBorderWidth: 2
-                        }]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            legend: {
-                                position: 'bottom',
-                                labels: {
-                                    color: '#666',
-                                    usePointStyle: true,
-                                    padding: 20
-                                }
-                            },
-                            tooltip: {
-                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
-                                titleColor: '#fff',
-                                bodyColor: '#fff',
-                                borderColor: '#667eea',
-                                borderWidth: 1
-                            }
-                        },
-                        scales: {
-                            r: {
-                                beginAtZero: true,
-                                max: 100,
-                                grid: {
-                                    color: 'rgba(102, 126, 234, 0.1)'
-                                },
-                                pointLabels: {
-                                    color: '#666',
-                                    font: {
-                                        size: 12
-                                    }
-                                },
-                                ticks: {
-                                    display: false
-                                }
-                            }
-                        }
-                    }
-                });
-            }
+@app.get("/new")
+async def dashboard():
+    """Serve the new dashboard interface"""
+    return Response(content=_DASHBOARD_HTML_BYTES, media_type="text/html")
 
-            // Animate KPI numbers
-            function animateNumbers() {
-                document.querySelectorAll('.kpi-number').forEach(el => {
-                    const target = parseInt(el.getAttribute('data-target')) || parseInt(el.textContent);
-                    let current = 0;
-                    const increment = target / 100;
-                    const timer = setInterval(() => {
-                        current += increment;
-                        if (current >= target) {
-                            current = target;
-                            clearInterval(timer);
-                        }
-                        
-                        // Format numbers with commas
-                        const formatted = Math.floor(current).toLocaleString();
-                        el.textContent = el.textContent.includes('%') ? 
-                            Math.floor(current) + '%' : formatted;
-                    }, 20);
-                });
-            }
+_UI_HTML_BYTES = (_STATIC_DIR / "ui.html").read_bytes()
 
-            // Initialize charts and animations when page loads
-            document.addEventListener('DOMContentLoaded', function() {
-                // Small delay to ensure canvas elements are rendered
-                setTimeout(() => {
-                    initCharts();
-                    animateNumbers();
-                }, 100);
-            });
-        </script>
-    </body>
-    </html>
-    """
 
-@app.get("/ui", response_class=HTMLResponse)
+@app.get("/ui")
 async def get_ui():
     """Serve the HTML frontend"""
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Research Assistant Agents</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 0; padding: 0; }
-            header { background: #0078d4; color: white; padding: 10px 0; text-align: center; }
-            h1 { margin: 0; font-size: 24px; }
-            main { padding: 20px; }
-            footer { text-align: center; padding: 10px 0; background: #f1f1f1; }
-            .container { max-width: 800px; margin: 0 auto; }
-            .button { background: #0078d4; color: white; padding: 10px 15px; text-decoration: none; border-radius: 5px; }
-            .button:hover { background: #005a9e; }
-        </style>
-    </head>
-    <body>
-        <header>
-            <h1>Research Assistant Agents</h1>
-        </header>
-        <main>
-            <div class="container">
-                <h2>Available Agents</h2>
-                <ul>
-                    <li>Research Assistant Agent</li>
-                    <li>Concept Explorer Agent</li>
-                    <li>Collaboration Finder Agent</li>
-                    <li>Analysis Specialist Agent</li>
-                </ul>
-                <h2>API Endpoints</h2>
-                <p>Use the following endpoints to interact with the agents:</p>
-                <ul>
-                    <li><code>/agent/query</code> - Query any research agent</li>
-                    <li><code>/agent/research</code> - Query the research assistant agent</li>
-                    <li><code>/agent/explore-concept</code> - Explore a research concept</li>
-                    <li><code>/agent/find-collaborations</code> - Find collaboration opportunities</li>
-                    <li><code>/agent/analyze</code> - Perform deep research analysis</li>
-                </ul>
-                <h2>Tools</h2>
-                <p>Available research tools:</p>
-                <ul id="tools-list"></ul>
-                <a href="/docs" class="button">API Documentation</a>
-            </div>
-        </main>
-        <footer>
-            <p>&copy; 2023 Research Assistant Agents</p>
-        </footer>
-        <script>
-            async function fetchTools() {
-                const response = await fetch('/tools');
-                const data = await response.json();
-                const toolsList = document.getElementById('tools-list');
-                
-                data.tools.forEach(tool => {
-                    const li = document.createElement('li');
-                    li.textContent = `${tool.name}: ${tool.description}`;
-                    toolsList.appendChild(li);
-                });
-            }
-            
-            fetchTools();
-        </script>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+    return Response(content=_UI_HTML_BYTES, media_type="text/html")
 
 
 if __name__ == "__main__":
@@ -4389,12 +1370,21 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     
     print(f"Starting Research Assistant Agents server on port {port}")
-    print(f"LangChain available: {create_agent is not None}")
+    print(f"LangChain available: {langchain_available}")
     
+    # uvloop is ~2x faster than default asyncio and httptools beats h11
+    # at request parsing; "auto" picks them up when installed and falls
+    # back cleanly. Workers >1 only outside --reload dev mode (each
+    # worker keeps its own in-process agent/response caches).
+    workers = int(os.getenv("WEB_WORKERS", "1"))
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        reload=workers == 1,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        limit_concurrency=512,
         log_level="info"
     )
@@ -0,0 +1,255 @@
+// Analysis parsing worker — keeps the regex-heavy Gemini response
+// processing (stats extraction + section parse + markdown formatting)
+// off the UI thread so the spinner keeps painting while multi-KB
+// responses are turned into HTML. Mirrors the same-named functions in
+// index.html, which stay as the no-Worker fallback path.
+
+// Hoisted once: rebuilding these arrays (and recompiling the
+// RegExp literals) per call dominated extractStats profiles
+const PAPER_PATTERNS = [
+    /Found\s+(\d+)\s+papers?\s+related\s+to/i,
+    /identified\s+(\d+)\s+research\s+papers?/i,
+    /(\d+)\s+papers?\s+directly\s+related/i,
+    /search\s+identified\s+(\d+)\s+papers?/i
+];
+const BIOLOGICAL_TERMS = [
+    'microgravity', 'cellular', 'protein', 'gene', 'DNA', 'bone', 'muscle',
+    'radiation', 'immune', 'metabolism', 'signaling', 'pathway', 'mitochondrial',
+    'cytoskeleton', 'osteoblast', 'osteoclast', 'stem cell', 'differentiation'
+];
+const CONFIDENCE_RE = /(\d+)%\s*confidence/i;
+// One alternation pass over the text (O(N)) instead of 18
+// full .includes() scans; \s+ tolerates wrapped phrases
+const BIO_RE = new RegExp(
+    '\\b(' + BIOLOGICAL_TERMS.map(t => t.replace(/\s+/g, '\\s+')).join('|') + ')\\b',
+    'gi'
+);
+
+function extractStatsFromGeminiResponse(analysisText, query) {
+    // Extract real numbers from Gemini's analysis text
+    let papers = 0, concepts = 0, relationships = 0, confidence = 95;
+
+    for (const pattern of PAPER_PATTERNS) {
+        const match = analysisText.match(pattern);
+        if (match) {
+            papers = parseInt(match[1]);
+            console.log(`✅ Extracted ${papers} papers from Gemini response`);
+            break;
+        }
+    }
+
+    // Count distinct biological concepts in one regex pass
+    const bioMatches = analysisText.match(BIO_RE);
+    const conceptCount = bioMatches
+        ? new Set(bioMatches.map(m => m.toLowerCase().replace(/\s+/g, ' '))).size
+        : 0;
+    concepts = Math.max(conceptCount, Math.floor(papers * 0.2)); // At least 20% of papers
+
+    // Calculate relationships based on biological network theory
+    // Most biological networks follow power-law distribution
+    if (papers > 0) {
+        relationships = Math.floor(papers * 1.5 + concepts * 2.5);
+    } else {
+        // Fallback estimation based on query complexity
+        const queryTerms = query.split(' ').length;
+        papers = Math.min(25, Math.max(5, queryTerms * 3));
+        concepts = Math.max(3, Math.floor(papers * 0.25));
+        relationships = Math.floor(papers * 1.8 + concepts * 2);
+    }
+
+    // Extract confidence if mentioned, otherwise calculate based on paper count
+    const confidenceMatch = analysisText.match(CONFIDENCE_RE);
+    if (confidenceMatch) {
+        confidence = parseInt(confidenceMatch[1]);
+    } else {
+        // Higher confidence with more papers found
+        confidence = Math.min(98, 85 + Math.floor(papers / 5));
+    }
+
+    console.log(`🧬 Real Gemini Stats: ${papers} papers, ${concepts} concepts, ${relationships} relationships, ${confidence}% confidence`);
+
+    return {
+        papers: papers,
+        concepts: concepts, 
+        relationships: relationships,
+        confidence: confidence
+    };
+}
+
+// Compiled once; the alternation only runs on lines whose
+// first character could plausibly start a header
+const HEADER_RE = /^#+\s*\d+\.?\s*.*|^\*\*.*:\*\*|^###?\s+.*|^\d+\.\s+.*:|^Key.*:|^Research.*:|^Network.*:/i;
+const HEADER_STRIP_RE = /^#+\s*|^\*\*|\*\*$/g;
+
+function isHeaderLine(line) {
+    // Cheap char-code gate: '#', '*', digits, or K/R/N prefixes
+    const c0 = line.charCodeAt(0);
+    if (c0 === 35 || c0 === 42 || (c0 >= 48 && c0 <= 57) ||
+        c0 === 75 || c0 === 107 || c0 === 82 || c0 === 114 ||
+        c0 === 78 || c0 === 110) {
+        return HEADER_RE.test(line);
+    }
+    return false;
+}
+
+function formatGeminiAnalysis(analysisText) {
+    if (!analysisText) return '';
+
+    // Single streaming pass; section bodies accumulate in an
+    // array (joined once on close) instead of += string churn
+    const sections = [];
+    let currentTitle = '';
+    let currentType = 'summary';
+    let contentParts = [];
+
+    const pushSection = () => {
+        const content = contentParts.join('\n');
+        if (content.trim()) {
+            sections.push({ title: currentTitle, content: content + '\n', type: currentType });
+        }
+    };
+
+    const lines = analysisText.split('\n');
+
+    for (let i = 0; i < lines.length; i++) {
+        const line = lines[i].trim();
+
+        if (line && isHeaderLine(line)) {
+            pushSection();
+            currentTitle = line.replace(HEADER_STRIP_RE, '').trim();
+            currentType = getSectionType(line);
+            contentParts = [];
+        } else if (line) {
+            contentParts.push(line);
+        }
+    }
+
+    // Add the last section
+    pushSection();
+
+    // If no sections found, treat entire text as summary
+    if (sections.length === 0) {
+        sections.push({
+            title: 'Research Summary',
+            content: analysisText,
+            type: 'summary'
+        });
+    }
+    lastSections = sections;
+
+    // Generate formatted HTML with collapsible sections
+    let html = '';
+
+    // Add a quick summary card if we have multiple sections
+    if (sections.length > 1) {
+        html += `
+            <div class="summary-card">
+                <h6>
+                    <span>📊</span> Quick Summary
+                </h6>
+                <div class="summary-text">
+                    Analysis contains <strong>${sections.length} detailed sections</strong> covering research insights, methodologies, and findings. 
+                    Click any section header below to expand and explore the detailed analysis.
+                </div>
+            </div>
+        `;
+    }
+
+    sections.forEach((section, index) => {
+        const icon = getSectionIcon(section.type, section.title);
+        const isExpanded = index === 0; // First section expanded by default
+
+        // Only the first body is formatted eagerly; the page fills the
+        // rest from the posted sections on first expand
+        const body = isExpanded
+            ? formatSectionContent(section.content, section.type)
+            : '';
+        const bodyClass = isExpanded ? 'section-body' : 'section-body lazy-section';
+        const bodyAttrs = isExpanded ? '' : ` data-idx="${index}"`;
+
+        // Native details/summary: the browser handles open/close, so
+        // there is no scrollHeight read / forced reflow per toggle
+        html += `
+            <details class="analysis-section"${isExpanded ? ' open' : ''}>
+                <summary class="section-header">
+                    <span class="section-icon">${icon}</span>
+                    <strong>${section.title}</strong>
+                </summary>
+                <div class="section-content">
+                    <div class="${bodyClass}"${bodyAttrs}>
+                        ${body}
+                    </div>
+                </div>
+            </details>
+        `;
+    });
+
+    return html;
+}
+
+function getSectionType(title) {
+    const titleLower = title.toLowerCase();
+    if (titleLower.includes('research') || titleLower.includes('papers') || titleLower.includes('findings')) return 'research';
+    if (titleLower.includes('network') || titleLower.includes('analysis') || titleLower.includes('connections')) return 'network';
+    if (titleLower.includes('gap') || titleLower.includes('opportunity') || titleLower.includes('future')) return 'gaps';
+    if (titleLower.includes('collaboration') || titleLower.includes('researcher') || titleLower.includes('institution')) return 'collaboration';
+    if (titleLower.includes('concept') || titleLower.includes('pathway') || titleLower.includes('biological')) return 'concepts';
+    return 'summary';
+}
+
+function getSectionIcon(type, title) {
+    switch (type) {
+        case 'research': return '📚';
+        case 'network': return '🕸️';
+        case 'gaps': return '🔍';
+        case 'collaboration': return '🤝';
+        case 'concepts': return '🧬';
+        case 'summary': return '📋';
+        default: return '📄';
+    }
+}
+
+// Fused token patterns: one structural scan (bullets,
+// numbered items, paragraph breaks) + one inline scan
+// (bold/italic) replace the old five-pass .replace() chain
+// and its intermediate full-string copies
+const BLOCK_MD_RE = /^[ \t]*\*[ \t]+(.+)$|^[ \t]*\d+\.[ \t]+(.+)$|\n\n+/gm;
+const INLINE_MD_RE = /\*\*([^*]+)\*\*|\*([^*]+)\*/g;
+
+function formatSectionContent(content, type) {
+    if (!content) return '';
+
+    let formatted = content
+        .replace(BLOCK_MD_RE, (m, bullet, numbered) => {
+            if (bullet !== undefined) return '<div class="kv-bullet">• ' + bullet + '</div>';
+            if (numbered !== undefined) return '<div class="kv-numbered">' + numbered + '</div>';
+            return '</p><p class="kv-para">';
+        })
+        .replace(INLINE_MD_RE, (m, bold, italic) =>
+            bold !== undefined ? '<strong>' + bold + '</strong>' : '<em>' + italic + '</em>'
+        )
+        .trim();
+
+    // Wrap in paragraph if not already formatted
+    if (!formatted.includes('<div') && !formatted.includes('<p')) {
+        formatted = `<p class="kv-p0">${formatted}</p>`;
+    } else if (formatted.includes('<div')) {
+        // Ensure proper paragraph structure around div elements
+        formatted = `<div>${formatted}</div>`;
+    }
+
+    return formatted;
+}
+
+let lastSections = [];
+
+self.onmessage = (e) => {
+    const { id, text, query } = e.data;
+    const html = formatGeminiAnalysis(text);
+    self.postMessage({
+        id,
+        stats: extractStatsFromGeminiResponse(text, query),
+        html,
+        sections: lastSections
+    });
+};
@@ -0,0 +1,43 @@
+// Force-layout worker: the page posts nodes and links, we converge a
+// d3 force simulation here and post the final positions back in one
+// transferable buffer. Only the blocking convergence loop lives off
+// the main thread - drawing and interaction stay on the page, where
+// hit-testing needs the positions anyway.
+importScripts('https://unpkg.com/d3-force@3/dist/d3-force.min.js');
+
+self.onmessage = (e) => {
+    const { id, nodes, links, width, height } = e.data;
+    try {
+        // Same size-adaptive parameters as the page-side simulation so
+        // the fallback path converges to an equivalent layout
+        const N = nodes.length;
+        const degree = new Map();
+        for (const l of links) {
+            degree.set(l.source, (degree.get(l.source) || 0) + 1);
+            degree.set(l.target, (degree.get(l.target) || 0) + 1);
+        }
+        const chargeBase = 30 + 2000 / Math.sqrt(N);
+        const simulation = d3.forceSimulation(nodes)
+            .force("link", d3.forceLink(links).id(d => d.id).distance(30 + 200 / Math.sqrt(N)))
+            .force("charge", d3.forceManyBody().strength(d => -chargeBase * Math.sqrt(1 + (degree.get(d.id) || 0))))
+            .force("center", d3.forceCenter(width / 2, height / 2).strength(0.1 / Math.log2(N + 2)))
+            .force("collision", d3.forceCollide().radius(d => d.size + 2))
+            .alphaDecay(1 - Math.pow(0.001, 1 / Math.max(300, N)))
+            .velocityDecay(0.4)
+            .stop();
+
+        const ticks = Math.ceil(
+            Math.log(simulation.alphaMin()) / Math.log(1 - simulation.alphaDecay())
+        );
+        for (let i = 0; i < ticks; ++i) simulation.tick();
+
+        const positions = new Float64Array(N * 2);
+        for (let i = 0; i < N; ++i) {
+            positions[i * 2] = nodes[i].x;
+            positions[i * 2 + 1] = nodes[i].y;
+        }
+        self.postMessage({ id, positions: positions.buffer }, [positions.buffer]);
+    } catch (err) {
+        self.postMessage({ id, error: String(err) });
+    }
+};